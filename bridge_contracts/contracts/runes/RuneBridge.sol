@@ -30,6 +30,16 @@ contract RuneBridge is Initializable, NBTEBridgeAccessControllable, Freezable, P
         uint256 dynamicFeeTokens;       // base unit is 0.01 %
     }
 
+    /// @dev A single transfer from BTC, with the federator signatures for it
+    struct TransferFromBtc {
+        address to;
+        uint256 rune;
+        uint256 runeAmount;
+        bytes32 btcTxId;
+        uint256 btcTxVout;
+        bytes[] signatures;
+    }
+
     /// @dev Emitted when a transfer from EVM to BTC is initiated.
     event RuneTransferToBtc(
         uint256 counter,                // an 1-based counter shared between both types of transfer
@@ -368,6 +378,49 @@ contract RuneBridge is Initializable, NBTEBridgeAccessControllable, Freezable, P
     external
     onlyFederator
     whenNotFrozen
+    {
+        _acceptTransferFromBtc(
+            to,
+            rune,
+            runeAmount,
+            btcTxId,
+            btcTxVout,
+            signatures
+        );
+    }
+
+    /// @dev Accepts multiple transfers from BTC in a single transaction.
+    /// The whole transaction reverts if any of the transfers is invalid.
+    /// @param transfers    The transfers, each with its own federator signatures
+    function acceptTransfersFromBtc(
+        TransferFromBtc[] calldata transfers
+    )
+    external
+    onlyFederator
+    whenNotFrozen
+    {
+        for (uint256 i = 0; i < transfers.length; i++) {
+            TransferFromBtc calldata transfer = transfers[i];
+            _acceptTransferFromBtc(
+                transfer.to,
+                transfer.rune,
+                transfer.runeAmount,
+                transfer.btcTxId,
+                transfer.btcTxVout,
+                transfer.signatures
+            );
+        }
+    }
+
+    function _acceptTransferFromBtc(
+        address to,
+        uint256 rune,
+        uint256 runeAmount,
+        bytes32 btcTxId,
+        uint256 btcTxVout,
+        bytes[] memory signatures
+    )
+    internal
     {
         require(!isRunePaused[rune], "rune paused");
 
@@ -0,0 +1,35 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.9;
+
+/// @title Multicall3
+/// @notice Aggregate the results of multiple read-only calls into one eth_call.
+/// @dev A subset of Multicall3 (https://github.com/mds1/multicall) with the same interface. The real one is deployed
+///      at 0xcA11bde05977b3631167028862bE2a173976CA11 on most chains, this is only deployed locally for tests.
+contract Multicall3 {
+    struct Call3 {
+        address target;
+        bool allowFailure;
+        bytes callData;
+    }
+
+    struct Result {
+        bool success;
+        bytes returnData;
+    }
+
+    /// @notice Aggregate calls, reverting if any of the calls that don't allow failure fails
+    function aggregate3(Call3[] calldata calls) public payable returns (Result[] memory returnData) {
+        uint256 length = calls.length;
+        returnData = new Result[](length);
+        for (uint256 i = 0; i < length; i++) {
+            Call3 calldata calli = calls[i];
+            Result memory result = returnData[i];
+            (result.success, result.returnData) = calli.target.call(calli.callData);
+            require(calli.allowFailure || result.success, "Multicall3: call failed");
+        }
+    }
+
+    function getBlockNumber() public view returns (uint256 blockNumber) {
+        blockNumber = block.number;
+    }
+}
@@ -204,6 +204,21 @@ task("deploy-testtoken")
         };
     }))
 
+task("deploy-multicall3")
+    .setAction(jsonAction(async ({}, hre) => {
+        const ethers = hre.ethers;
+        const multicall = await ethers.deployContract(
+            "Multicall3",
+            [],
+            {}
+        );
+        await multicall.waitForDeployment();
+        console.log("Multicall3 deployed at %s", multicall.target)
+        return {
+            "address": multicall.target
+        };
+    }))
+
 
 task("accounts", "Prints the list of accounts", async (args, hre) => {
     const accounts = await hre.ethers.getSigners();
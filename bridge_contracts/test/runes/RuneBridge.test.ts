@@ -772,6 +772,91 @@ describe("RuneBridge", function () {
     });
   });
 
+  describe("acceptTransfersFromBtc", () => {
+    let runeBridge: Contract,
+      rune: number,
+      federatorRuneBridge: Contract,
+      runeToken: Contract
+    ;
+    beforeEach(async () => {
+      ({runeBridge, rune, federatorRuneBridge, runeToken} = await loadFixture(runeBridgeFixture));
+    });
+
+    async function createTransfer(btcTxVout: number, runeAmount: number) {
+      const btcTxId = "0x" + "0".repeat(64);
+      const data = [
+        await user.getAddress(),
+        rune,
+        runeAmount,
+        btcTxId,
+        btcTxVout,
+      ];
+      const hash = await federatorRuneBridge.getAcceptTransferFromBtcMessageHash(...data);
+      const hashBytes = ethers.getBytes(hash);
+      const signatures = await Promise.all([
+        federator1.signMessage(hashBytes),
+        federator2.signMessage(hashBytes),
+      ]);
+      return [...data, signatures];
+    }
+
+    it('is only callable by a federator', async () => {
+      await expect(runeBridge.acceptTransfersFromBtc(
+        [await createTransfer(0, 100)]
+      )).to.be.revertedWith(reasonNotFederator(await owner.getAddress()));
+    });
+
+    it('accepts all transfers', async () => {
+      const to = await user.getAddress();
+      const tokenAddress = await runeBridge.getTokenByRune(rune);
+      const transfers = [
+        await createTransfer(0, 100),
+        await createTransfer(1, 200),
+      ];
+
+      const tx = federatorRuneBridge.acceptTransfersFromBtc(transfers);
+
+      await expect(tx).to.emit(federatorRuneBridge, "RuneTransferFromBtc").withArgs(
+        1,
+        to,
+        tokenAddress,
+        rune,
+        100,
+        transfers[0][3],
+        0
+      );
+      await expect(tx).to.emit(federatorRuneBridge, "RuneTransferFromBtc").withArgs(
+        2,
+        to,
+        tokenAddress,
+        rune,
+        200,
+        transfers[1][3],
+        1
+      );
+      await expect(tx).to.changeTokenBalances(
+        runeToken,
+        [to],
+        [await runeToken.getTokenAmount(300)]
+      );
+    });
+
+    it('reverts if any transfer is invalid', async () => {
+      const transfer = await createTransfer(0, 100);
+      await expect(federatorRuneBridge.acceptTransfersFromBtc(
+        [transfer, transfer]
+      )).to.be.revertedWith(reasonTransferAlreadyProcessed());
+
+      const invalidSignatures = await createTransfer(1, 100);
+      invalidSignatures[5] = [];
+      await expect(federatorRuneBridge.acceptTransfersFromBtc(
+        [transfer, invalidSignatures]
+      )).to.be.revertedWith(reasonNotEnoughSignatures());
+
+      expect(await runeBridge.isTransferFromBtcProcessed(transfer[3], 0, rune)).to.be.false;
+    });
+  });
+
   describe("acceptRuneRegistrationRequest", () => {
     let federatorRuneBridge: Contract,
       runeBridgeAsAdmin: Contract,
@@ -191,9 +191,8 @@ class MonitorViews:
                     rune_balances[rune_name] = 0
                 rune_balances[rune_name] += amount
 
-        entries = []
-        for rune_name, balance_raw in rune_balances.items():
-            rune = (
+        runes = {
+            rune_name: (
                 self.dbsession.query(
                     Rune,
                 )
@@ -203,17 +202,39 @@ class MonitorViews:
                 )
                 .one()
             )
+            for rune_name in rune_balances.keys()
+        }
+
+        # Read all the token data in two multicalls instead of 4 calls per token
+        service.contract_state.prefetch_runes(rune.n for rune in runes.values())
+        token_contracts = {rune_name: service.get_rune_token_or_none(rune.n) for rune_name, rune in runes.items()}
+        token_functions = [
+            function
+            for token_contract in token_contracts.values()
+            if token_contract
+            for function in (
+                token_contract.functions.decimals(),
+                token_contract.functions.totalSupply(),
+                token_contract.functions.name(),
+                token_contract.functions.symbol(),
+            )
+        ]
+        token_results = iter(service.multicall.call(token_functions))
+
+        entries = []
+        for rune_name, balance_raw in rune_balances.items():
+            rune = runes[rune_name]
             balance_decimal = Decimal(balance_raw) / 10**rune.divisibility
-            token_contract = service.get_rune_token_or_none(rune.n)
+            token_contract = token_contracts[rune_name]
             if token_contract:
-                decimals = token_contract.functions.decimals().call()
-                supply = Decimal(token_contract.functions.totalSupply().call()) / 10**decimals
+                decimals = next(token_results)
+                supply = Decimal(next(token_results)) / 10**decimals
                 difference = balance_decimal - supply
                 difference_pct = difference / balance_decimal * 100
                 token = {
                     "address": token_contract.address,
-                    "name": token_contract.functions.name().call(),
-                    "symbol": token_contract.functions.symbol().call(),
+                    "name": next(token_results),
+                    "symbol": next(token_results),
                     "supply": supply,
                 }
             else:
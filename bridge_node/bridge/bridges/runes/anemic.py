@@ -9,6 +9,7 @@ from anemic.ioc import (
     service,
 )
 
+from ...common.btc.rpc import BitcoinRPC
 from ...common.messengers import Messenger
 from ...common.p2p.network import Network
 from ...common.services.transactions import TransactionManager
@@ -43,6 +44,22 @@ def create_rune_bridge_env_config(
         to_evm_fee_percentage_decimal = environ.var(default="0.4", converter=Decimal)
         btc_max_fee_rate_sats_per_vbyte = environ.var(default="300", converter=int)
         btc_min_postage_sat = environ.var(default="10000", converter=int)
+        ord_output_resolution_concurrency = environ.var(default="8", converter=int)
+        ord_api_pool_size = environ.var(default="10", converter=int)
+        ord_api_timeout_seconds = environ.var(default="30.0", converter=float)
+        ord_api_max_retries = environ.var(default="3", converter=int)
+        btc_rpc_timeout_seconds = environ.var(default="120.0", converter=float)
+        btc_rpc_record_latencies = environ.bool_var(default=False)
+        btc_psbt_signing_concurrency = environ.var(default="1", converter=int)
+        evm_log_prefetch_concurrency = environ.var(default="4", converter=int)
+        evm_receipt_fetch_concurrency = environ.var(default="4", converter=int)
+        evm_scan_chunk_size = environ.var(default="10000", converter=int)
+        btc_transfer_batch_max_size = environ.var(default="1", converter=int)
+        btc_transfer_batch_max_vbytes = environ.var(default="50000", converter=int)
+        evm_transfer_batch_max_size = environ.var(default="1", converter=int)
+        evm_sign_batch_max_size = environ.var(default="1", converter=int)
+        evm_multicall_address = environ.var(default="")
+        deposit_address_pool_size = environ.var(default="0", converter=int)
 
     @environ.config(prefix=f"BRIDGE_SECRET_{prefix}".upper())
     class RuneBridgeEnvSecrets:
@@ -84,6 +101,22 @@ def wire_rune_bridge_from_environ(
             runes_to_evm_fee_percentage_decimal=runes_env.to_evm_fee_percentage_decimal,
             btc_max_fee_rate_sats_per_vbyte=runes_env.btc_max_fee_rate_sats_per_vbyte,
             btc_min_postage_sat=runes_env.btc_min_postage_sat,
+            ord_output_resolution_concurrency=runes_env.ord_output_resolution_concurrency,
+            ord_api_pool_size=runes_env.ord_api_pool_size,
+            ord_api_timeout_seconds=runes_env.ord_api_timeout_seconds,
+            ord_api_max_retries=runes_env.ord_api_max_retries,
+            btc_rpc_timeout_seconds=runes_env.btc_rpc_timeout_seconds,
+            btc_rpc_record_latencies=runes_env.btc_rpc_record_latencies,
+            btc_psbt_signing_concurrency=runes_env.btc_psbt_signing_concurrency,
+            evm_log_prefetch_concurrency=runes_env.evm_log_prefetch_concurrency,
+            evm_receipt_fetch_concurrency=runes_env.evm_receipt_fetch_concurrency,
+            evm_scan_chunk_size=runes_env.evm_scan_chunk_size,
+            btc_transfer_batch_max_size=runes_env.btc_transfer_batch_max_size,
+            btc_transfer_batch_max_vbytes=runes_env.btc_transfer_batch_max_vbytes,
+            evm_transfer_batch_max_size=runes_env.evm_transfer_batch_max_size,
+            evm_sign_batch_max_size=runes_env.evm_sign_batch_max_size,
+            evm_multicall_address=runes_env.evm_multicall_address or None,
+            deposit_address_pool_size=runes_env.deposit_address_pool_size,
         ),
         secrets=RuneBridgeSecrets(
             evm_private_key=secrets_env.evm_private_key,
@@ -95,6 +128,8 @@ def wire_rune_bridge_from_environ(
         network=container.get(interface=Network),
         transaction_manager=container.get(interface=TransactionManager),
         messenger=container.get(interface=Messenger),
+        # Share the connection pool with the global bitcoind RPC client
+        bitcoin_rpc_session=container.get(interface=BitcoinRPC).session,
     )
 
 
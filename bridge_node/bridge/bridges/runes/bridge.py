@@ -22,6 +22,7 @@ class RuneBridge(Bridge):
         self.service = service
 
         self.sign_rune_to_evm_transfer_question = f"{bridge_id}:sign-rune-to-evm-transfer"
+        self.sign_rune_to_evm_transfers_question = f"{bridge_id}:sign-rune-to-evm-transfers"
         self.sign_rune_token_to_btc_transfer_question = f"{bridge_id}:sign-rune-token-to-btc-transfer"
         self.max_retries = 10
         self.logger = logging.getLogger(f"{__name__}:{self.bridge_id}")
@@ -33,6 +34,10 @@ class RuneBridge(Bridge):
                 self.sign_rune_to_evm_transfer_question,
                 self._sign_rune_to_evm_transfer_answer,
             )
+            self.network.answer_with(
+                self.sign_rune_to_evm_transfers_question,
+                self._sign_rune_to_evm_transfers_answer,
+            )
             self.network.answer_with(
                 self.sign_rune_token_to_btc_transfer_question,
                 self._sign_rune_token_to_btc_transfer_answer,
@@ -42,6 +47,8 @@ class RuneBridge(Bridge):
         self.logger.info("Running iteration from %s", self.bridge_id)
 
         self.service.check()
+        # Re-read the contract state (federators, pauses etc.) if there's a new block
+        self.service.contract_state.refresh()
 
         num_rune_deposits = self.service.scan_rune_deposits()
         self.logger.info("Found %s Rune->EVM transfers", num_rune_deposits)
@@ -49,6 +56,7 @@ class RuneBridge(Bridge):
         self.logger.info("Found %s Rune Token->BTC transfers", num_rune_token_deposits)
 
         self.service.confirm_sent_rune_deposits()
+        self.service.refill_deposit_address_pool()
 
         if not self.network.is_leader():
             self.logger.info("Not leader, stopping here")
@@ -59,11 +67,27 @@ class RuneBridge(Bridge):
             return
 
         self._handle_rune_transfers_to_evm()
+        # The transfers are sent back-to-back without waiting for them, but check the receipts of any that were
+        # already mined
+        self.service.confirm_sent_rune_deposits()
         self._handle_rune_token_transfers_to_btc()
 
     # TODO: the _handle* methods are written differently and it's ugly
 
     def _handle_rune_transfers_to_evm(self):
+        # Sync the nonce, gas price and balance of the EVM account once per iteration
+        self.service.nonce_manager.refresh()
+
+        # Signatures are asked in batches also when the transfers are sent one by one, to clear backlogs
+        # in a few network rounds
+        sign_batch_size = max(
+            self.service.config.evm_sign_batch_max_size,
+            self.service.config.evm_transfer_batch_max_size,
+        )
+        if sign_batch_size > 1:
+            self._handle_rune_transfers_to_evm_in_batches(sign_batch_size)
+            return
+
         for deposit_id in self.service.get_accepted_rune_deposit_ids():
             try:
                 if not self.service.validate_rune_deposit_for_sending(deposit_id):
@@ -95,26 +119,105 @@ class RuneBridge(Bridge):
             except Exception as e:
                 self.logger.exception("Failed to process Rune->EVM transfer %s: %s", deposit_id, e)
 
+    def _handle_rune_transfers_to_evm_in_batches(self, batch_size: int):
+        for deposit_ids in self.service.get_accepted_rune_deposit_id_batches(batch_size):
+            try:
+                self.service.prefetch_rune_deposit_contract_state(deposit_ids)
+                deposit_ids = [
+                    deposit_id
+                    for deposit_id in deposit_ids
+                    if self.service.validate_rune_deposit_for_sending(deposit_id)
+                ]
+                if not deposit_ids:
+                    continue
+                self.logger.info("Processing Rune->EVM deposits %s", deposit_ids)
+                ready_deposit_ids = self._collect_rune_to_evm_transfer_signatures(deposit_ids)
+                self._send_rune_deposits_to_evm(ready_deposit_ids)
+            except Exception as e:
+                self.logger.exception("Failed to process Rune->EVM transfers %s: %s", deposit_ids, e)
+
+    def _collect_rune_to_evm_transfer_signatures(self, deposit_ids: list[int]) -> list[int]:
+        """
+        Ask the signatures of all `deposit_ids` in one network round and store them.
+        Returns the ids of the deposits that have enough signatures.
+        """
+        message = self.service.get_sign_rune_to_evm_transfers_question(deposit_ids)
+        self_response = self.service.answer_sign_rune_to_evm_transfers_question(message=message)
+        self.logger.info("Asking for signatures for deposits %s", deposit_ids)
+        responses = self.network.ask(
+            question=self.sign_rune_to_evm_transfers_question,
+            message=message,
+        )
+        self.logger.info("Got %s responses from the network for deposits %s", len(responses), deposit_ids)
+        responses = [response for response in responses if len(response.answers) == len(deposit_ids)]
+
+        answers_by_deposit_id = {}
+        for i, deposit_id in enumerate(deposit_ids):
+            self_answer = self_response.answers[i]
+            if self_answer is None:
+                self.logger.warning(
+                    "Not signing deposit %s ourselves (%s), skipping it",
+                    deposit_id,
+                    self_response.errors[i],
+                )
+                continue
+            answers = [self_answer]
+            for response in responses:
+                if response.answers[i] is not None:
+                    answers.append(response.answers[i])
+                    continue
+                # Federators running older versions don't send errors
+                errors = getattr(response, "errors", None)
+                if errors and len(errors) == len(deposit_ids):
+                    self.logger.info("A federator didn't sign deposit %s: %s", deposit_id, errors[i])
+            answers_by_deposit_id[deposit_id] = (self_answer.message_hash, answers)
+
+        ready_deposit_ids = self.service.update_rune_deposit_signatures_in_bulk(answers_by_deposit_id)
+        for deposit_id in answers_by_deposit_id.keys() - set(ready_deposit_ids):
+            self.logger.info("Not enough signatures for deposit %s", deposit_id)
+        return ready_deposit_ids
+
+    def _send_rune_deposits_to_evm(self, deposit_ids: list[int]):
+        batch_size = self.service.config.evm_transfer_batch_max_size
+        if batch_size <= 1:
+            for deposit_id in deposit_ids:
+                try:
+                    self.service.send_rune_deposit_to_evm(deposit_id)
+                except Exception as e:
+                    self.logger.exception("Failed to send Rune->EVM transfer %s: %s", deposit_id, e)
+            return
+        for i in range(0, len(deposit_ids), batch_size):
+            batch = deposit_ids[i : i + batch_size]
+            try:
+                self.service.send_rune_deposits_to_evm(batch)
+            except Exception as e:
+                self.logger.exception("Failed to send Rune->EVM transfers %s: %s", batch, e)
+
     def _handle_rune_token_transfers_to_btc(self):
         def ask_signatures(message):
+            # Wait for all peers instead of a quorum: the signed PSBTs are only validated when they are combined,
+            # so stopping at the first answers could leave out valid signatures
             return self.network.ask(
                 question=self.sign_rune_token_to_btc_transfer_question,
                 message=message,
             )
 
-        for deposit_id in self.service.get_accepted_rune_token_deposit_ids():
+        for deposit_ids in self.service.get_accepted_rune_token_deposit_id_batches():
             try:
-                self.service.handle_accepted_rune_token_deposit(
-                    deposit_id,
+                self.service.handle_accepted_rune_token_deposits(
+                    deposit_ids,
                     ask_signatures=ask_signatures,
                 )
             except Exception as e:
-                self.logger.exception("Failed to process Rune Token -> BTC transfer %s: %s", deposit_id, e)
+                self.logger.exception("Failed to process Rune Token -> BTC transfers %s: %s", deposit_ids, e)
 
     def _sign_rune_to_evm_transfer_answer(self, message):
         # TODO: This is wrapped to make it easier to patch...
         return self.service.answer_sign_rune_to_evm_transfer_question(message=message)
 
+    def _sign_rune_to_evm_transfers_answer(self, message):
+        return self.service.answer_sign_rune_to_evm_transfers_question(message=message)
+
     def _sign_rune_token_to_btc_transfer_answer(self, message):
         # TODO: This is wrapped to make it easier to patch...
         return self.service.answer_sign_rune_token_to_btc_transfer_question(message=message)
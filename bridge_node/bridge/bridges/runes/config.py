@@ -5,6 +5,8 @@ from eth_typing import ChecksumAddress
 
 from bridge.common.btc.types import BitcoinNetwork
 
+from .evm import RUNE_TO_EVM_TRANSFER_BATCH_MAX_SIZE
+
 
 @dataclass()
 class RuneBridgeConfig:
@@ -23,6 +25,29 @@ class RuneBridgeConfig:
     btc_min_postage_sat: int = 10_000
     btc_listsinceblock_buffer: int = 6
     btc_max_fee_rate_sats_per_vbyte: int = 300
+    ord_output_resolution_concurrency: int = 8
+    ord_api_pool_size: int = 10
+    ord_api_timeout_seconds: float = 30.0
+    ord_api_max_retries: int = 3
+    btc_rpc_timeout_seconds: float = 120.0
+    btc_rpc_record_latencies: bool = False
+    btc_psbt_signing_concurrency: int = 1
+    evm_log_prefetch_concurrency: int = 4
+    evm_receipt_fetch_concurrency: int = 4
+    evm_scan_chunk_size: int = 10_000
+    btc_transfer_batch_max_size: int = 1
+    evm_transfer_batch_max_size: int = 1
+    evm_sign_batch_max_size: int = 1
+    evm_multicall_address: ChecksumAddress | None = None
+    btc_transfer_batch_max_vbytes: int = 50_000
+    deposit_address_pool_size: int = 0
+
+    def __post_init__(self):
+        if not 1 <= self.evm_transfer_batch_max_size <= RUNE_TO_EVM_TRANSFER_BATCH_MAX_SIZE:
+            raise ValueError(
+                f"evm_transfer_batch_max_size must be between 1 and {RUNE_TO_EVM_TRANSFER_BATCH_MAX_SIZE} "
+                f"(got {self.evm_transfer_batch_max_size}), or the transfers won't fit in an EVM block"
+            )
 
 
 @dataclass(repr=False)
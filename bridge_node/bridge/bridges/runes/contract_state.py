@@ -0,0 +1,157 @@
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from eth_typing import ChecksumAddress
+from web3 import Web3
+from web3.contract import Contract
+
+from ...common.evm.multicall import Multicall
+
+logger = logging.getLogger(__name__)
+
+
+class RuneBridgeContractState:
+    """
+    Block-scoped cache of the RuneBridge contract state that's read over and over again (federators, number of
+    required signers, frozen flag, rune registrations, pauses and token addresses).
+
+    All values are read at the cached block number, and the cache is cleared when a new block is seen. The block
+    number is checked at most every `block_check_interval` seconds (or when `refresh()` is called), so validating
+    a batch of signatures doesn't cost more RPC calls than validating a single one. Values that are needed together
+    can be fetched in one multicall with the `prefetch_*` methods.
+
+    Stale values can't cause harm: the contract checks everything again when a transfer is sent.
+    """
+
+    def __init__(
+        self,
+        *,
+        web3: Web3,
+        rune_bridge_contract: Contract,
+        multicall: Multicall | None = None,
+        block_check_interval: float = 5.0,
+    ):
+        self.web3 = web3
+        self.rune_bridge_contract = rune_bridge_contract
+        if multicall is None:
+            multicall = Multicall(web3=web3, address=None)
+        self.multicall = multicall
+        self.block_check_interval = block_check_interval
+        self._lock = threading.RLock()
+        self._block_number: int | None = None
+        self._block_checked_at = 0.0
+        self._values: dict[tuple, Any] = {}
+
+    @property
+    def block_number(self) -> int:
+        with self._lock:
+            self._ensure_fresh()
+            return self._block_number
+
+    def refresh(self):
+        """
+        Check for a new block now, clearing the cache if one is found.
+        """
+        with self._lock:
+            self._check_block_number()
+
+    def is_federator(self, address: ChecksumAddress) -> bool:
+        return self._get(*self._is_federator(address))
+
+    def get_num_required_federators(self) -> int:
+        return self._get(("numRequiredFederators",), lambda f: f.numRequiredFederators())
+
+    def is_frozen(self) -> bool:
+        return self._get(("frozen",), lambda f: f.frozen())
+
+    def is_rune_registered(self, rune_number: int) -> bool:
+        return self._get(*self._is_rune_registered(rune_number))
+
+    def is_rune_paused(self, rune_number: int) -> bool:
+        return self._get(*self._is_rune_paused(rune_number))
+
+    def get_token_by_rune(self, rune_number: int) -> ChecksumAddress:
+        return self._get(*self._get_token_by_rune(rune_number))
+
+    def prefetch_federators(self, addresses: Iterable[ChecksumAddress]):
+        self._prefetch(self._is_federator(address) for address in set(addresses))
+
+    def prefetch_runes(self, rune_numbers: Iterable[int]):
+        """
+        Fetch the registration, pause status and token address of all `rune_numbers` in one go.
+        """
+        self._prefetch(
+            item
+            for rune_number in set(rune_numbers)
+            for item in (
+                self._is_rune_registered(rune_number),
+                self._is_rune_paused(rune_number),
+                # Fails for runes that are not registered, those are just not cached
+                self._get_token_by_rune(rune_number),
+            )
+        )
+
+    @staticmethod
+    def _is_federator(address: ChecksumAddress):
+        return ("isFederator", address), lambda f: f.isFederator(address)
+
+    @staticmethod
+    def _is_rune_registered(rune_number: int):
+        return ("isRuneRegistered", rune_number), lambda f: f.isRuneRegistered(rune_number)
+
+    @staticmethod
+    def _is_rune_paused(rune_number: int):
+        return ("isRunePaused", rune_number), lambda f: f.isRunePaused(rune_number)
+
+    @staticmethod
+    def _get_token_by_rune(rune_number: int):
+        return ("getTokenByRune", rune_number), lambda f: f.getTokenByRune(rune_number)
+
+    def _get(self, key: tuple, get_function: Callable[[Any], Any]) -> Any:
+        with self._lock:
+            self._ensure_fresh()
+            try:
+                return self._values[key]
+            except KeyError:
+                pass
+            block_number = self._block_number
+        # Don't hold the lock during the call. Values read at an outdated block are discarded
+        value = get_function(self.rune_bridge_contract.functions).call(block_identifier=block_number)
+        self._store(block_number, {key: value})
+        return value
+
+    def _prefetch(self, items: Iterable[tuple[tuple, Callable[[Any], Any]]]):
+        with self._lock:
+            self._ensure_fresh()
+            missing = {key: get_function for key, get_function in items if key not in self._values}
+            block_number = self._block_number
+        if not missing:
+            return
+        results = self.multicall.try_call(
+            [get_function(self.rune_bridge_contract.functions) for get_function in missing.values()],
+            block_identifier=block_number,
+        )
+        self._store(
+            block_number,
+            {key: value for key, (success, value) in zip(missing, results, strict=True) if success},
+        )
+
+    def _store(self, block_number: int, values: dict[tuple, Any]):
+        with self._lock:
+            if self._block_number == block_number:
+                self._values.update(values)
+
+    def _ensure_fresh(self):
+        if self._block_number is None or time.monotonic() - self._block_checked_at >= self.block_check_interval:
+            self._check_block_number()
+
+    def _check_block_number(self):
+        block_number = self.web3.eth.block_number
+        self._block_checked_at = time.monotonic()
+        if block_number != self._block_number:
+            logger.debug("New block %s, clearing RuneBridge contract state", block_number)
+            self._block_number = block_number
+            self._values = {}
@@ -0,0 +1,91 @@
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import sqlalchemy as sa
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from .models import DepositAddress, User
+
+
+@dataclass(frozen=True)
+class DepositAddressOwner:
+    user_id: int
+    evm_address: str
+
+
+class DepositAddressIndex:
+    """
+    In-memory index of the deposit addresses of a bridge, mapping BTC addresses to their owners.
+
+    The index is loaded with `load()` and kept up to date by `add_on_commit()`, which adds a generated address
+    once the transaction that created it has been committed (so rolled back addresses never end up in it).
+    Addresses not found in the index are looked up from the DB, to also find ones created by other processes.
+
+    The index can be used from multiple threads.
+    """
+
+    def __init__(self, *, bridge_id: int):
+        self.bridge_id = bridge_id
+        self._lock = threading.Lock()
+        self._owners: dict[str, DepositAddressOwner] | None = None
+
+    def load(self, dbsession: Session):
+        owners = self._query(dbsession)
+        with self._lock:
+            self._owners = owners
+
+    def get(self, dbsession: Session, btc_address: str) -> DepositAddressOwner | None:
+        return self.get_many(dbsession, [btc_address]).get(btc_address)
+
+    def get_many(self, dbsession: Session, btc_addresses: Iterable[str]) -> dict[str, DepositAddressOwner]:
+        if self._owners is None:
+            self.load(dbsession)
+
+        ret = {}
+        missing = set()
+        with self._lock:
+            for btc_address in btc_addresses:
+                owner = self._owners.get(btc_address)
+                if owner is None:
+                    missing.add(btc_address)
+                else:
+                    ret[btc_address] = owner
+        if missing:
+            found = self._query(dbsession, btc_addresses=missing)
+            with self._lock:
+                self._owners.update(found)
+            ret.update(found)
+        return ret
+
+    def add_on_commit(self, dbsession: Session, btc_address: str, owner: DepositAddressOwner):
+        def add(session):
+            event.remove(session, "after_rollback", discard)
+            with self._lock:
+                if self._owners is not None:
+                    self._owners[btc_address] = owner
+
+        def discard(session):
+            event.remove(session, "after_commit", add)
+
+        event.listen(dbsession, "after_commit", add, once=True)
+        event.listen(dbsession, "after_rollback", discard, once=True)
+
+    def _query(
+        self,
+        dbsession: Session,
+        *,
+        btc_addresses: Iterable[str] | None = None,
+    ) -> dict[str, DepositAddressOwner]:
+        query = (
+            sa.select(DepositAddress.btc_address, User.id, User.evm_address)
+            .join(User, DepositAddress.user_id == User.id)
+            .where(User.bridge_id == self.bridge_id)
+        )
+        if btc_addresses is not None:
+            query = query.where(DepositAddress.btc_address.in_(list(btc_addresses)))
+        return {
+            btc_address: DepositAddressOwner(user_id=user_id, evm_address=evm_address)
+            for btc_address, user_id, evm_address in dbsession.execute(query).tuples()
+        }
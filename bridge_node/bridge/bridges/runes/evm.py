@@ -5,6 +5,12 @@ from pathlib import Path
 logger = logging.getLogger(__name__)
 ABI_DIR = Path(__file__).parent / "abi"
 
+# actual gas usage is somewhere around 95k-115k per transfer, but let's be safe
+RUNE_TO_EVM_TRANSFER_GAS_LIMIT = 250_000
+# RSK's block gas limit is around 6.8M, leave some room for other transactions
+RUNE_TO_EVM_MAX_GAS_LIMIT = 6_000_000
+RUNE_TO_EVM_TRANSFER_BATCH_MAX_SIZE = RUNE_TO_EVM_MAX_GAS_LIMIT // RUNE_TO_EVM_TRANSFER_GAS_LIMIT
+
 
 def load_rune_bridge_abi(name: str) -> dict:
     with (ABI_DIR / f"{name}.json").open() as f:
@@ -3,7 +3,10 @@ from __future__ import annotations
 import dataclasses
 from decimal import Decimal
 
+from bridge.common.p2p.codec import register_message
 
+
+@register_message
 @dataclasses.dataclass
 class RuneToEvmTransfer:
     evm_address: str
@@ -16,6 +19,7 @@ class RuneToEvmTransfer:
     rune_number: int
 
 
+@register_message
 @dataclasses.dataclass
 class RuneTokenToBtcTransfer:
     receiver_address: str
@@ -27,11 +31,13 @@ class RuneTokenToBtcTransfer:
     event_log_index: int
 
 
+@register_message
 @dataclasses.dataclass
 class SignRuneToEvmTransferQuestion:
     transfer: RuneToEvmTransfer
 
 
+@register_message
 @dataclasses.dataclass
 class SignRuneToEvmTransferAnswer:
     signature: str
@@ -39,14 +45,34 @@ class SignRuneToEvmTransferAnswer:
     message_hash: str
 
 
+@register_message
+@dataclasses.dataclass
+class SignRuneToEvmTransfersQuestion:
+    transfers: list[RuneToEvmTransfer]
+
+
+@register_message
+@dataclasses.dataclass
+class SignRuneToEvmTransfersAnswer:
+    # One answer for each transfer of the question, None if the transfer could not be signed
+    answers: list[SignRuneToEvmTransferAnswer | None]
+    # The reason for not signing each transfer (None for signed ones). Federators running older versions
+    # don't send this
+    errors: list[str | None] | None = None
+
+
+@register_message
 @dataclasses.dataclass
 class SignRuneTokenToBtcTransferQuestion:
-    # transfers: list[RuneTokenToBtcTransfer]
+    # The first transfer of the batch, for federators that don't understand `transfers`
     transfer: RuneTokenToBtcTransfer
     unsigned_psbt_serialized: str
     fee_rate_sats_per_vb: int
+    # All transfers of the PSBT, or None if it has only one transfer
+    transfers: list[RuneTokenToBtcTransfer] | None = None
 
 
+@register_message
 @dataclasses.dataclass
 class SignRuneTokenToBtcTransferAnswer:
     signed_psbt_serialized: str
@@ -69,6 +69,22 @@ class DepositAddress(Base):
     user = relationship("User", back_populates="deposit_address")
 
 
+class DepositAddressPoolEntry(Base):
+    """
+    A pre-derived deposit address that's not yet assigned to a user.
+
+    The derivation index is reserved from the user id sequence, and it becomes the id of the user that claims
+    the address (so that the derivation index of a deposit address is always the user id).
+    """
+
+    __tablename__ = "deposit_address_pool_entry"
+
+    index = Column(BigInteger, primary_key=True, autoincrement=False)
+    bridge_id = Column(Integer, ForeignKey("bridge.id"), nullable=False, index=True)
+    btc_address = Column(Text, nullable=False, unique=True)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+
 # class BridgeableRune(Base):
 #     __tablename__ = f"{PREFIX}_bridgeable_rune"
 #
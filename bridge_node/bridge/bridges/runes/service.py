@@ -1,9 +1,10 @@
 import dataclasses
 import functools
-import itertools
 import logging
 import time
+from collections import defaultdict
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 from typing import (
     Protocol,
@@ -17,12 +18,15 @@ from bitcointx.wallet import CCoinAddress
 from eth_account.account import LocalAccount
 from eth_account.messages import encode_defunct
 from hexbytes import HexBytes
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import (
     Session,
+    joinedload,
 )
 from web3 import Web3
 from web3.contract import Contract
 from web3.exceptions import (
+    ContractLogicError,
     TransactionIndexingInProgress,
     TransactionNotFound,
 )
@@ -32,14 +36,15 @@ from bridge.common.btc.fees import BitcoinFeeEstimator
 from bridge.common.btc.rpc import BitcoinRPC
 
 from ...common.btc.types import BitcoinNetwork
+from ...common.evm.multicall import Multicall
+from ...common.evm.nonces import NonceManager
 from ...common.evm.scanner import EvmEventScanner
 from ...common.evm.utils import (
-    from_wei,
     recover_message,
 )
 from ...common.messengers import Messenger, NullMessenger
 from ...common.models.key_value_store import KeyValuePair
-from ...common.ord.client import OrdApiClient
+from ...common.ord.client import OrdApiClient, OutputResponse
 from ...common.ord.multisig import (
     OrdMultisig,
     RuneTransfer,
@@ -51,10 +56,17 @@ from ...common.ord.types import (
 from ...common.services.key_value_store import KeyValueStore
 from ...common.services.transactions import TransactionManager
 from . import messages
-from .evm import load_rune_bridge_abi
+from .contract_state import RuneBridgeContractState
+from .deposit_addresses import DepositAddressIndex, DepositAddressOwner
+from .evm import (
+    RUNE_TO_EVM_MAX_GAS_LIMIT,
+    RUNE_TO_EVM_TRANSFER_GAS_LIMIT,
+    load_rune_bridge_abi,
+)
 from .models import (
     Bridge,
     DepositAddress,
+    DepositAddressPoolEntry,
     IncomingBtcTx,
     IncomingBtcTxStatus,
     Rune,
@@ -80,6 +92,21 @@ class ValidationError(ValueError):
     pass
 
 
+def _promoted_status(column, new_status, *, from_status: int, to_status: int):
+    """
+    Status to set in an upsert: the existing status is only ever changed from `from_status` to `to_status`.
+    """
+    return sa.case(
+        (sa.and_(column == from_status, new_status == to_status), to_status),
+        else_=column,
+    )
+
+
+# Multi-row inserts are split in chunks of this many rows, to stay well below PostgreSQL's limit of 65535 bind
+# parameters per statement
+INSERT_CHUNK_SIZE = 1000
+
+
 class RuneBridgeServiceConfig(Protocol):
     bridge_id: str
     evm_block_safety_margin: int
@@ -90,6 +117,16 @@ class RuneBridgeServiceConfig(Protocol):
     btc_listsinceblock_buffer: int
     btc_network: BitcoinNetwork
     btc_max_fee_rate_sats_per_vbyte: int
+    ord_output_resolution_concurrency: int
+    evm_log_prefetch_concurrency: int
+    evm_receipt_fetch_concurrency: int
+    evm_scan_chunk_size: int
+    btc_transfer_batch_max_size: int
+    btc_transfer_batch_max_vbytes: int
+    evm_transfer_batch_max_size: int
+    evm_sign_batch_max_size: int
+    evm_multicall_address: str | None
+    deposit_address_pool_size: int
 
 
 class RuneBridgeService:
@@ -104,6 +141,7 @@ class RuneBridgeService:
         evm_account: LocalAccount,
         web3: Web3,
         rune_bridge_contract: Contract,
+        nonce_manager: NonceManager | None = None,
         messenger: Messenger | None = None,
     ):
         self.config = config
@@ -114,14 +152,27 @@ class RuneBridgeService:
         self.transaction_manager = transaction_manager
         self.evm_account = evm_account
         self.web3 = web3
+        if nonce_manager is None:
+            nonce_manager = NonceManager(web3=web3, address=evm_account.address)
+        self.nonce_manager = nonce_manager
+        self.multicall = Multicall(
+            web3=web3,
+            address=config.evm_multicall_address,
+        )
+        self.contract_state = RuneBridgeContractState(
+            web3=web3,
+            rune_bridge_contract=rune_bridge_contract,
+            multicall=self.multicall,
+        )
         self._bridge_id = None
+        self._evm_chain_id: int | None = None
+        self._deposit_address_index: DepositAddressIndex | None = None
         self._btc_fee_estimator = BitcoinFeeEstimator(
             rpc=bitcoin_rpc,
             network=config.btc_network,
         )
 
-        self._get_block_time_by_hash = functools.lru_cache(256)(self._get_block_time_by_hash)
-        self._get_block_number_by_hash = functools.lru_cache(256)(self._get_block_number_by_hash)
+        self._get_block_time_and_number_by_hash = functools.lru_cache(256)(self._get_block_time_and_number_by_hash)
         self.logger = logging.getLogger(f"{__name__}:{self.bridge_name}")
         if messenger is None:
             self._messenger = NullMessenger()
@@ -137,6 +188,8 @@ class RuneBridgeService:
                 dbsession.add(bridge)
                 dbsession.flush()
             self._bridge_id = bridge.id
+            self._deposit_address_index = DepositAddressIndex(bridge_id=bridge.id)
+            self._deposit_address_index.load(dbsession)
 
     @property
     def bridge_id(self) -> int:
@@ -148,6 +201,12 @@ class RuneBridgeService:
     def bridge_name(self) -> str:
         return self.config.bridge_id
 
+    @property
+    def evm_chain_id(self) -> int:
+        if self._evm_chain_id is None:
+            self._evm_chain_id = self.web3.eth.chain_id
+        return self._evm_chain_id
+
     def check(self) -> None:
         self.ord_multisig.check()
 
@@ -160,6 +219,30 @@ class RuneBridgeService:
 
         user = dbsession.query(User).filter_by(bridge_id=self.bridge_id, evm_address=evm_address).first()
         if not user:
+            pool_entry = self._claim_deposit_address_pool_entry(dbsession)
+            if pool_entry:
+                pool_index, btc_address = pool_entry
+                user = User(
+                    id=pool_index,
+                    bridge_id=self.bridge_id,
+                    evm_address=evm_address,
+                )
+                dbsession.add(user)
+                dbsession.flush()
+                dbsession.add(
+                    DepositAddress(
+                        user_id=user.id,
+                        btc_address=btc_address,
+                    )
+                )
+                dbsession.flush()
+                self._deposit_address_index.add_on_commit(
+                    dbsession,
+                    btc_address,
+                    DepositAddressOwner(user_id=user.id, evm_address=user.evm_address),
+                )
+                return btc_address
+
             user = User(
                 bridge_id=self.bridge_id,
                 evm_address=evm_address,
@@ -175,9 +258,86 @@ class RuneBridgeService:
             )
             dbsession.add(deposit_address)
             dbsession.flush()
+            self._deposit_address_index.add_on_commit(
+                dbsession,
+                deposit_address.btc_address,
+                DepositAddressOwner(user_id=user.id, evm_address=user.evm_address),
+            )
 
         return deposit_address.btc_address
 
+    def _claim_deposit_address_pool_entry(self, dbsession: Session) -> tuple[int, str] | None:
+        """
+        Claim the next pre-derived deposit address from the pool, returning (index, btc_address).
+
+        Concurrent claims skip the entries locked by each other. Returns None if the pool is empty.
+        """
+        next_index = (
+            sa.select(DepositAddressPoolEntry.index)
+            .where(DepositAddressPoolEntry.bridge_id == self.bridge_id)
+            .order_by(DepositAddressPoolEntry.index)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        claimed = dbsession.execute(
+            sa.delete(DepositAddressPoolEntry)
+            .where(DepositAddressPoolEntry.index == next_index)
+            .returning(DepositAddressPoolEntry.index, DepositAddressPoolEntry.btc_address)
+        ).one_or_none()
+        if not claimed:
+            self.logger.warning("Deposit address pool is empty, deriving the address on demand")
+            return None
+        return claimed.index, claimed.btc_address
+
+    def refill_deposit_address_pool(self) -> int:
+        """
+        Pre-derive deposit addresses until the pool has config.deposit_address_pool_size unclaimed addresses.
+
+        Returns the number of addresses added to the pool.
+        """
+        pool_size = self.config.deposit_address_pool_size
+        if pool_size <= 0:
+            return 0
+
+        with self.transaction_manager.transaction() as tx:
+            dbsession = tx.find_service(Session)
+            num_available = dbsession.scalar(
+                sa.select(sa.func.count())
+                .select_from(DepositAddressPoolEntry)
+                .where(DepositAddressPoolEntry.bridge_id == self.bridge_id)
+            )
+            num_missing = pool_size - num_available
+            if num_missing <= 0:
+                return 0
+            # Reserve the indices from the user id sequence, so that they're never used for users created on demand.
+            # Sequences are not transactional, so the reservation holds even if the rest of this fails.
+            indices = dbsession.scalars(
+                sa.select(sa.func.nextval(sa.func.pg_get_serial_sequence('"user"', "id"))).select_from(
+                    sa.func.generate_series(1, num_missing)
+                )
+            ).all()
+
+        # Derive outside the DB transaction, this is the slow part
+        btc_addresses = self.ord_multisig.derive_addresses(indices)
+
+        with self.transaction_manager.transaction() as tx:
+            dbsession = tx.find_service(Session)
+            dbsession.execute(
+                postgresql.insert(DepositAddressPoolEntry).values(
+                    [
+                        {
+                            "index": index,
+                            "bridge_id": self.bridge_id,
+                            "btc_address": btc_address,
+                        }
+                        for index, btc_address in zip(indices, btc_addresses, strict=True)
+                    ]
+                )
+            )
+        self.logger.info("Added %s addresses to the deposit address pool", len(indices))
+        return len(indices)
+
     def scan_rune_deposits(self):
         last_block_key = f"{self.bridge_name}:btc:deposits:last_scanned_block"
         with self.transaction_manager.transaction() as tx:
@@ -227,38 +387,21 @@ class RuneBridgeService:
                 self.logger.debug("Ignoring tx to change address %s", btc_address)
                 continue
 
-            txid = tx["txid"]
-            vout = tx["vout"]
-            tx_confirmations = tx["confirmations"]
-            ord_output = tx["ord_output"] = None
-            if tx_confirmations > 0:
-                self.logger.debug("tx: %s", tx)
-                # TXs without confirmations are not indexed by ord
-                retries = 10
-                for i in range(retries):
-                    ord_output = self.ord_client.get_output(txid, vout)
-                    if ord_output["indexed"]:
-                        tx["ord_output"] = ord_output
-                        break
-                    if ord_output["spent"]:
-                        # ORD drops spent outputs from the index and no longer shows the rune balances for them
-                        # this is a problem, because
-                        # 1) we have the listsinceblock buffer
-                        # 2) a node that's down a while might not get to index an output
-                        # From my understanding, it's hard to do this properly right now.
-                        # See https://github.com/ordinals/ord/issues/3723
-                        self.logger.warning("Unindexed spent output %s:%s (%s), ignoring", txid, vout, ord_output)
-                        break
-                    self.logger.info("Output %s:%s (%s) not indexed in ord yet, waiting", txid, vout, ord_output)
-                    self._sleep(i)
-                else:
-                    raise RuntimeError(f"Output not indexed in ord after {retries} tries")
+            tx["ord_output"] = None
+            transactions.append(tx)
 
+        # TXs without confirmations are not indexed by ord
+        ord_outputs = self._resolve_ord_outputs(
+            [(tx["txid"], tx["vout"]) for tx in transactions if tx["confirmations"] > 0],
+        )
+        for tx in transactions:
+            ord_output = ord_outputs.get((tx["txid"], tx["vout"]))
             if ord_output:
+                tx["ord_output"] = ord_output
                 for spaced_rune_name, _ in ord_output["runes"]:
                     rune_names.add(spaced_rune_name)
-
-            transactions.append(tx)
+        self.logger.debug("Ord API client stats: %s", self.ord_client.get_stats())
+        self.logger.debug("Bitcoin RPC client stats: %s", self.bitcoin_rpc.get_stats())
 
         rune_entries = []
         for rune_name in rune_names:
@@ -267,188 +410,351 @@ class RuneBridgeService:
                 raise RuntimeError(f"Rune {rune_name} not found in ord")
             rune_entries.append(rune_response["entry"])
 
-        num_transfers = 0
         with self.transaction_manager.transaction() as _tx:
             dbsession = _tx.find_service(Session)
             key_value_store = _tx.find_service(KeyValueStore)
 
             self.logger.debug("Indexing %s runes", len(rune_entries))
-            for rune_entry in rune_entries:
-                pyord_rune = rune_from_str(rune_entry["spaced_rune"])
-                rune = dbsession.query(Rune).filter_by(bridge_id=self.bridge_id, n=pyord_rune.n).one_or_none()
-                if not rune:
-                    self.logger.info("Indexing rune %s (%s)", pyord_rune, rune_entry)
-                    rune = Rune(
-                        bridge_id=self.bridge_id,
-                        n=pyord_rune.n,
-                        name=pyord_rune.name,
-                        symbol=rune_entry["symbol"],
-                        spaced_name=rune_entry["spaced_rune"],
-                        divisibility=rune_entry["divisibility"],
-                        turbo=rune_entry["turbo"],
-                    )
-                    dbsession.add(rune)
-                    dbsession.flush()
-
+            rune_ids_by_n = self._index_runes(dbsession, rune_entries)
             self.logger.debug("Indexing %s transactions", len(transactions))
-            for tx in transactions:
-                tx_confirmations = tx["confirmations"]
-                txid = tx["txid"]
-                vout = tx["vout"]
-                btc_address = tx["address"]
-                ord_output = tx["ord_output"]
-                if ord_output:
-                    if not ord_output["indexed"]:
-                        raise AssertionError(f"Output {txid}:{vout} not indexed in ord")
-
-                btc_tx = (
-                    dbsession.query(IncomingBtcTx)
-                    .filter_by(
-                        bridge_id=self.bridge_id,
-                        tx_id=txid,
-                        vout=vout,
-                    )
-                    .one_or_none()
+            num_transfers = self._index_rune_deposit_transactions(dbsession, transactions, rune_ids_by_n)
+
+            check = key_value_store.get_value(last_block_key, default_value=None)
+            if check != last_bitcoin_block:
+                raise RuntimeError(
+                    f"Last block changed from {last_bitcoin_block} to " f"{check} while processing deposits!"
                 )
-                if btc_tx:
-                    self.logger.debug("Updating IncomingBtcTx %s:%s: %s", txid, vout, btc_tx)
-                else:
-                    self.logger.info("New IncomingBtcTx detected: %s:%s", txid, vout)
-                    btc_tx = IncomingBtcTx(
-                        bridge_id=self.bridge_id,
-                        tx_id=txid,
-                        vout=vout,
-                        status=IncomingBtcTxStatus.DETECTED,
-                    )
-                    dbsession.add(btc_tx)
-                    self._messenger.send_message(
-                        title=f"[{self.bridge_name}] New incoming BTC transaction",
-                        message=f"BTC tx: `{txid}:{vout}`\nUser address: `{btc_address}`",
-                    )
+            key_value_store.set_value(last_block_key, new_last_block)
+        return num_transfers
 
-                if tx_confirmations >= required_confirmations and btc_tx.status == IncomingBtcTxStatus.DETECTED:
-                    btc_tx.status = IncomingBtcTxStatus.ACCEPTED
-                btc_tx.block_number = tx.get("blockheight")
-                btc_tx.time = tx["time"]
-                btc_tx.amount_sat = int(tx["amount"] * 100_000_000)
-                btc_tx.address = btc_address
-                dbsession.flush()
+    def _index_runes(self, dbsession: Session, rune_entries: list[dict]) -> dict[int, int]:
+        """
+        Insert the runes that are not yet in the DB, and return the ids of all the given runes by rune number.
+        """
+        if not rune_entries:
+            return {}
+        rows = {}
+        for rune_entry in rune_entries:
+            pyord_rune = rune_from_str(rune_entry["spaced_rune"])
+            rows[pyord_rune.n] = {
+                "bridge_id": self.bridge_id,
+                "n": pyord_rune.n,
+                "name": pyord_rune.name,
+                "symbol": rune_entry["symbol"],
+                "spaced_name": rune_entry["spaced_rune"],
+                "divisibility": rune_entry["divisibility"],
+                "turbo": rune_entry["turbo"],
+            }
+        inserted = dbsession.execute(
+            postgresql.insert(Rune)
+            .values(list(rows.values()))
+            .on_conflict_do_nothing(constraint="uq_rune_n")
+            .returning(Rune.n)
+        ).scalars()
+        for n in inserted:
+            self.logger.info("Indexed rune %s", rows[n]["spaced_name"])
+
+        return dict(
+            dbsession.execute(
+                sa.select(Rune.n, Rune.id).where(
+                    Rune.bridge_id == self.bridge_id,
+                    Rune.n.in_(list(rows)),
+                )
+            ).tuples()
+        )
 
-                deposit_address = dbsession.query(DepositAddress).filter_by(btc_address=btc_address).one_or_none()
-                if not deposit_address:
-                    self.logger.warning("No deposit address found for %s", tx)
-                    continue
+    def _index_rune_deposit_transactions(
+        self,
+        dbsession: Session,
+        transactions: list[dict],
+        rune_ids_by_n: dict[int, int],
+    ) -> int:
+        """
+        Upsert the IncomingBtcTx and RuneDeposit rows for the transactions returned by listsinceblock.
+
+        The existing rows and the deposit addresses are prefetched and the changes written in bulk, so the number
+        of queries doesn't depend on the number of transactions. Returns the number of Rune deposits found.
+        """
+        required_confirmations = self.config.btc_min_confirmations
 
-                btc_tx.user_id = deposit_address.user_id
-                dbsession.flush()
+        # The same output could be listed more than once -- the last one wins
+        transactions_by_outpoint = {(tx["txid"], tx["vout"]): tx for tx in transactions}
+        if not transactions_by_outpoint:
+            return 0
+        outpoints = list(transactions_by_outpoint)
+
+        existing_btc_tx_outpoints = set(
+            dbsession.execute(
+                sa.select(IncomingBtcTx.tx_id, IncomingBtcTx.vout).where(
+                    IncomingBtcTx.bridge_id == self.bridge_id,
+                    sa.tuple_(IncomingBtcTx.tx_id, IncomingBtcTx.vout).in_(outpoints),
+                )
+            ).tuples()
+        )
+        deposit_address_owners = self._deposit_address_index.get_many(
+            dbsession,
+            {tx["address"] for tx in transactions_by_outpoint.values()},
+        )
 
-                evm_address = deposit_address.user.evm_address
+        btc_tx_rows = []
+        for (txid, vout), tx in transactions_by_outpoint.items():
+            btc_address = tx["address"]
+            ord_output = tx["ord_output"]
+            if ord_output and not ord_output["indexed"]:
+                raise AssertionError(f"Output {txid}:{vout} not indexed in ord")
 
-                self.logger.info(
-                    "found transfer: %s:%s, user %s with %s confirmations",
-                    txid,
-                    vout,
-                    evm_address,
-                    tx_confirmations,
+            if (txid, vout) in existing_btc_tx_outpoints:
+                self.logger.debug("Updating IncomingBtcTx %s:%s", txid, vout)
+            else:
+                self.logger.info("New IncomingBtcTx detected: %s:%s", txid, vout)
+                self._messenger.send_message(
+                    title=f"[{self.bridge_name}] New incoming BTC transaction",
+                    message=f"BTC tx: `{txid}:{vout}`\nUser address: `{btc_address}`",
                 )
 
-                if not ord_output:
-                    self.logger.info("Ord output not yet indexed, will be scanned later")
-                    continue
+            owner = deposit_address_owners.get(btc_address)
+            btc_tx_rows.append(
+                {
+                    "bridge_id": self.bridge_id,
+                    "tx_id": txid,
+                    "vout": vout,
+                    "status": (
+                        IncomingBtcTxStatus.ACCEPTED
+                        if tx["confirmations"] >= required_confirmations
+                        else IncomingBtcTxStatus.DETECTED
+                    ),
+                    "block_number": tx.get("blockheight"),
+                    "time": tx["time"],
+                    "amount_sat": int(tx["amount"] * 100_000_000),
+                    "address": btc_address,
+                    "user_id": owner.user_id if owner else None,
+                }
+            )
 
-                self.logger.debug(
-                    "Transaction contains %s runes in outpoint %s:%s (user %s)",
-                    len(ord_output["runes"]),
+        btc_tx_ids_by_outpoint = {}
+        for i in range(0, len(btc_tx_rows), INSERT_CHUNK_SIZE):
+            insert_btc_txs = postgresql.insert(IncomingBtcTx).values(btc_tx_rows[i : i + INSERT_CHUNK_SIZE])
+            btc_tx_ids_by_outpoint.update(
+                ((txid, vout), btc_tx_id)
+                for btc_tx_id, txid, vout in dbsession.execute(
+                    insert_btc_txs.on_conflict_do_update(
+                        constraint="uq_incoming_bitcoin_tx_id_vout",
+                        set_={
+                            "status": _promoted_status(
+                                IncomingBtcTx.status,
+                                insert_btc_txs.excluded.status,
+                                from_status=IncomingBtcTxStatus.DETECTED,
+                                to_status=IncomingBtcTxStatus.ACCEPTED,
+                            ),
+                            "block_number": insert_btc_txs.excluded.block_number,
+                            "time": insert_btc_txs.excluded.time,
+                            "amount_sat": insert_btc_txs.excluded.amount_sat,
+                            "address": insert_btc_txs.excluded.address,
+                            "user_id": sa.func.coalesce(insert_btc_txs.excluded.user_id, IncomingBtcTx.user_id),
+                        },
+                    ).returning(IncomingBtcTx.id, IncomingBtcTx.tx_id, IncomingBtcTx.vout)
+                ).tuples()
+            )
+
+        deposit_transactions = []
+        for (txid, vout), tx in transactions_by_outpoint.items():
+            btc_address = tx["address"]
+            ord_output = tx["ord_output"]
+            owner = deposit_address_owners.get(btc_address)
+            if not owner:
+                self.logger.warning("No deposit address found for %s", tx)
+                continue
+            evm_address = owner.evm_address
+
+            self.logger.info(
+                "found transfer: %s:%s, user %s with %s confirmations",
+                txid,
+                vout,
+                evm_address,
+                tx["confirmations"],
+            )
+
+            if not ord_output:
+                self.logger.info("Ord output not yet indexed, will be scanned later")
+                continue
+
+            self.logger.debug(
+                "Transaction contains %s runes in outpoint %s:%s (user %s)",
+                len(ord_output["runes"]),
+                txid,
+                vout,
+                evm_address,
+            )
+
+            if not ord_output["runes"]:
+                self.logger.warning(
+                    "Transfer without runes: %s:%s. ord output: %s",
                     txid,
                     vout,
-                    evm_address,
+                    ord_output,
+                )
+                continue
+            deposit_transactions.append(tx)
+
+        if not deposit_transactions:
+            return 0
+
+        existing_deposit_keys = set(
+            dbsession.execute(
+                sa.select(RuneDeposit.tx_id, RuneDeposit.vout, RuneDeposit.rune_number).where(
+                    RuneDeposit.bridge_id == self.bridge_id,
+                    sa.tuple_(RuneDeposit.tx_id, RuneDeposit.vout).in_(
+                        [(tx["txid"], tx["vout"]) for tx in deposit_transactions]
+                    ),
                 )
+            ).tuples()
+        )
 
-                if not ord_output["runes"]:
-                    self.logger.warning(
-                        "Transfer without runes: %s:%s. ord output: %s",
+        deposit_rows = []
+        for tx in deposit_transactions:
+            txid = tx["txid"]
+            vout = tx["vout"]
+            btc_address = tx["address"]
+            ord_output = tx["ord_output"]
+            owner = deposit_address_owners[btc_address]
+            evm_address = owner.evm_address
+            for spaced_rune_name, balance_entry in ord_output["runes"]:
+                rune_number = rune_from_str(spaced_rune_name).n
+                amounts = self._calculate_rune_to_evm_transfer_amounts(
+                    amount_raw=balance_entry["amount"],
+                    divisibility=balance_entry["divisibility"],
+                )
+                if (txid, vout, rune_number) in existing_deposit_keys:
+                    self.logger.debug(
+                        "Updating deposit (%s %s for %s at %s:%s)",
+                        amounts.amount_decimal,
+                        spaced_rune_name,
+                        evm_address,
                         txid,
                         vout,
-                        ord_output,
                     )
-                    continue
-
-                for spaced_rune_name, balance_entry in ord_output["runes"]:
-                    pyord_rune = rune_from_str(spaced_rune_name)
-                    rune = dbsession.query(Rune).filter_by(bridge_id=self.bridge_id, n=pyord_rune.n).one()
-                    amounts = self._calculate_rune_to_evm_transfer_amounts(
-                        amount_raw=balance_entry["amount"],
-                        divisibility=balance_entry["divisibility"],
+                else:
+                    self.logger.info(
+                        "Received new Rune deposit: %s %s for %s at %s:%s",
+                        amounts.amount_decimal,
+                        spaced_rune_name,
+                        evm_address,
+                        txid,
+                        vout,
                     )
-
-                    deposit = (
-                        dbsession.query(RuneDeposit)
-                        .filter_by(
-                            bridge_id=self.bridge_id,
-                            tx_id=txid,
-                            vout=vout,
-                            rune_number=rune.n,
-                        )
-                        .one_or_none()
+                    self._messenger.send_message(
+                        title=f"[{self.bridge_name}] New Rune deposit",
+                        message=(
+                            f"Deposit: `{amounts.amount_decimal} {spaced_rune_name}`\n"
+                            f"BTC Tx: `{txid}:{vout}`\n"
+                            f"User (evm): `{evm_address}`\nUser (btc): `{btc_address}`"
+                        ),
                     )
-                    if deposit:
-                        self.logger.debug(
-                            "Updating deposit %s (%s %s for %s at %s:%s)",
-                            deposit.id,
-                            amounts.amount_decimal,
-                            spaced_rune_name,
-                            evm_address,
-                            txid,
-                            vout,
-                        )
-                    else:
-                        self.logger.info(
-                            "Received new Rune deposit: %s %s for %s at %s:%s",
-                            amounts.amount_decimal,
-                            spaced_rune_name,
-                            evm_address,
-                            txid,
-                            vout,
-                        )
-                        deposit = RuneDeposit(
-                            bridge_id=self.bridge_id,
-                            tx_id=txid,
-                            vout=vout,
-                            rune_number=rune.n,
-                            status=RuneDepositStatus.DETECTED,
-                        )
-                        dbsession.add(deposit)
-                        self._messenger.send_message(
-                            title=f"[{self.bridge_name}] New Rune deposit",
-                            message=(
-                                f"Deposit: `{amounts.amount_decimal} {spaced_rune_name}`\n"
-                                f"BTC Tx: `{txid}:{vout}`\n"
-                                f"User (evm): `{evm_address}`\nUser (btc): `{btc_address}`"
-                            ),
-                        )
 
-                    deposit.incoming_btc_tx_id = btc_tx.id
-                    deposit.block_number = tx["blockheight"]
-                    deposit.user_id = deposit_address.user_id
-                    deposit.postage = ord_output["value"]
-                    deposit.transfer_amount_raw = balance_entry["amount"]
-                    deposit.net_amount_raw = amounts.net_amount_raw
-                    deposit.rune_id = rune.id
-                    if tx_confirmations >= required_confirmations and deposit.status == RuneDepositStatus.DETECTED:
-                        assert deposit.status == RuneDepositStatus.DETECTED
-                        deposit.status = RuneDepositStatus.ACCEPTED
-                    dbsession.flush()
-
-                    self.logger.debug("Deposit: %s", deposit)
-                    num_transfers += 1
+                deposit_rows.append(
+                    {
+                        "bridge_id": self.bridge_id,
+                        "tx_id": txid,
+                        "vout": vout,
+                        "rune_number": rune_number,
+                        "rune_id": rune_ids_by_n[rune_number],
+                        "incoming_btc_tx_id": btc_tx_ids_by_outpoint[(txid, vout)],
+                        "block_number": tx["blockheight"],
+                        "user_id": owner.user_id,
+                        "postage": ord_output["value"],
+                        "transfer_amount_raw": balance_entry["amount"],
+                        "net_amount_raw": amounts.net_amount_raw,
+                        "status": (
+                            RuneDepositStatus.ACCEPTED
+                            if tx["confirmations"] >= required_confirmations
+                            else RuneDepositStatus.DETECTED
+                        ),
+                    }
+                )
 
-            check = key_value_store.get_value(last_block_key, default_value=None)
-            if check != last_bitcoin_block:
-                raise RuntimeError(
-                    f"Last block changed from {last_bitcoin_block} to " f"{check} while processing deposits!"
+        for i in range(0, len(deposit_rows), INSERT_CHUNK_SIZE):
+            insert_deposits = postgresql.insert(RuneDeposit).values(deposit_rows[i : i + INSERT_CHUNK_SIZE])
+            dbsession.execute(
+                insert_deposits.on_conflict_do_update(
+                    constraint="uq_rune_deposit_txid_vout_rune_number",
+                    set_={
+                        "status": _promoted_status(
+                            RuneDeposit.status,
+                            insert_deposits.excluded.status,
+                            from_status=RuneDepositStatus.DETECTED,
+                            to_status=RuneDepositStatus.ACCEPTED,
+                        ),
+                        "rune_id": insert_deposits.excluded.rune_id,
+                        "incoming_btc_tx_id": insert_deposits.excluded.incoming_btc_tx_id,
+                        "block_number": insert_deposits.excluded.block_number,
+                        "user_id": insert_deposits.excluded.user_id,
+                        "postage": insert_deposits.excluded.postage,
+                        "transfer_amount_raw": insert_deposits.excluded.transfer_amount_raw,
+                        "net_amount_raw": insert_deposits.excluded.net_amount_raw,
+                    },
                 )
-            key_value_store.set_value(last_block_key, new_last_block)
-        return num_transfers
+            )
+        return len(deposit_rows)
+
+    def _resolve_ord_outputs(
+        self,
+        outpoints: list[tuple[str, int]],
+        *,
+        retries: int = 10,
+    ) -> dict[tuple[str, int], OutputResponse | None]:
+        """
+        Fetch ord outputs for the given (txid, vout) pairs concurrently.
+
+        All outputs are requested at once (bounded by config.ord_output_resolution_concurrency) and only the
+        outputs that are not yet indexed are retried, as a group. Unindexed spent outputs map to None.
+        """
+        ret: dict[tuple[str, int], OutputResponse | None] = {}
+        pending = list(dict.fromkeys(outpoints))
+        if not pending:
+            return ret
+
+        start = time.monotonic()
+        max_workers = min(len(pending), max(1, self.config.ord_output_resolution_concurrency))
+        with ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=f"{self.bridge_name}-ord-output",
+        ) as executor:
+            for i in range(retries):
+                ord_outputs = executor.map(
+                    lambda outpoint: self.ord_client.get_output(*outpoint),
+                    pending,
+                )
+                still_pending = []
+                for (txid, vout), ord_output in zip(pending, ord_outputs, strict=True):
+                    if ord_output["indexed"]:
+                        ret[(txid, vout)] = ord_output
+                    elif ord_output["spent"]:
+                        # ORD drops spent outputs from the index and no longer shows the rune balances for them
+                        # this is a problem, because
+                        # 1) we have the listsinceblock buffer
+                        # 2) a node that's down a while might not get to index an output
+                        # From my understanding, it's hard to do this properly right now.
+                        # See https://github.com/ordinals/ord/issues/3723
+                        self.logger.warning("Unindexed spent output %s:%s (%s), ignoring", txid, vout, ord_output)
+                        ret[(txid, vout)] = None
+                    else:
+                        self.logger.info("Output %s:%s (%s) not indexed in ord yet, waiting", txid, vout, ord_output)
+                        still_pending.append((txid, vout))
+                pending = still_pending
+                if not pending:
+                    break
+                self._sleep(i)
+            else:
+                raise RuntimeError(f"{len(pending)} outputs not indexed in ord after {retries} tries: {pending}")
+
+        self.logger.info(
+            "Resolved %s ord outputs in %.3f seconds (%s rounds, %s workers)",
+            len(ret),
+            time.monotonic() - start,
+            i + 1,
+            max_workers,
+        )
+        return ret
 
     def _sync_ord_with_bitcoind(self, timeout=60):
         start = time.time()
@@ -495,12 +801,12 @@ class RuneBridgeService:
             self.logger.debug("Invalid block hash length %s", last_block)
             return []
 
-        block_time = self._get_block_time_by_hash(last_block)
-        if not block_time:
+        block_time_and_number = self._get_block_time_and_number_by_hash(last_block)
+        if not block_time_and_number:
             self.logger.debug("Invalid block hash %s", last_block)
             return []
 
-        block_number = self._get_block_number_by_hash(last_block)
+        block_time, block_number = block_time_and_number
         block_number += self.config.btc_listsinceblock_buffer
 
         deposit_address = user.deposit_address
@@ -585,18 +891,11 @@ class RuneBridgeService:
 
         return deposits
 
-    def _get_block_time_by_hash(self, block_hash) -> int | None:
+    def _get_block_time_and_number_by_hash(self, block_hash) -> tuple[int, int] | None:
+        # The header has both the time and the height, so one round-trip is enough
         try:
-            block = self.bitcoin_rpc.call("getblock", block_hash)
-            return block["time"]
-        except Exception as e:
-            self.logger.info("Invalid block hash %s (%s)", block_hash, e)
-            return None
-
-    def _get_block_number_by_hash(self, block_hash) -> int | None:
-        try:
-            block = self.bitcoin_rpc.call("getblock", block_hash)
-            return block["height"]
+            header = self.bitcoin_rpc.call("getblockheader", block_hash)
+            return header["time"], header["height"]
         except Exception as e:
             self.logger.info("Invalid block hash %s (%s)", block_hash, e)
             return None
@@ -616,6 +915,40 @@ class RuneBridgeService:
             )
             return [deposit.id for deposit in deposits]
 
+    def get_accepted_rune_deposit_id_batches(self, batch_size: int | None = None) -> list[list[int]]:
+        deposit_ids = self.get_accepted_rune_deposit_ids()
+        if batch_size is None:
+            batch_size = self.config.evm_transfer_batch_max_size
+        return [deposit_ids[i : i + batch_size] for i in range(0, len(deposit_ids), batch_size)]
+
+    def get_sign_rune_to_evm_transfers_question(
+        self,
+        deposit_ids: list[int],
+    ) -> messages.SignRuneToEvmTransfersQuestion:
+        with self.transaction_manager.transaction() as tx:
+            dbsession = tx.find_service(Session)
+            deposits = {
+                deposit.id: deposit
+                for deposit in dbsession.scalars(
+                    sa.select(RuneDeposit)
+                    .where(
+                        RuneDeposit.bridge_id == self.bridge_id,
+                        RuneDeposit.id.in_(deposit_ids),
+                    )
+                    .options(
+                        joinedload(RuneDeposit.user),
+                        joinedload(RuneDeposit.rune),
+                    )
+                )
+            }
+            transfers = []
+            for deposit_id in deposit_ids:
+                deposit = deposits.get(deposit_id)
+                if deposit is None:
+                    raise ValidationError(f"Deposit {deposit_id} not found")
+                transfers.append(self._get_rune_to_evm_transfer(deposit))
+            return messages.SignRuneToEvmTransfersQuestion(transfers=transfers)
+
     def get_sign_rune_to_evm_transfer_question(self, deposit_id: int) -> messages.SignRuneToEvmTransferQuestion:
         with self.transaction_manager.transaction() as tx:
             dbsession = tx.find_service(Session)
@@ -627,21 +960,40 @@ class RuneBridgeService:
                 )
                 .one()
             )
-            if deposit.status != RuneDepositStatus.ACCEPTED:
-                raise ValidationError(f"Deposit {deposit} not accepted (got {deposit.status})")
             return messages.SignRuneToEvmTransferQuestion(
-                transfer=messages.RuneToEvmTransfer(
-                    evm_address=deposit.user.evm_address,
-                    amount_raw=deposit.transfer_amount_raw,
-                    amount_decimal=deposit.rune.decimal_amount(deposit.transfer_amount_raw),
-                    net_amount_raw=deposit.net_amount_raw,
-                    txid=deposit.tx_id,
-                    vout=deposit.vout,
-                    rune_name=deposit.rune.name,
-                    rune_number=deposit.rune.n,
-                )
+                transfer=self._get_rune_to_evm_transfer(deposit),
             )
 
+    def _get_rune_to_evm_transfer(self, deposit: RuneDeposit) -> messages.RuneToEvmTransfer:
+        if deposit.status != RuneDepositStatus.ACCEPTED:
+            raise ValidationError(f"Deposit {deposit} not accepted (got {deposit.status})")
+        return messages.RuneToEvmTransfer(
+            evm_address=deposit.user.evm_address,
+            amount_raw=deposit.transfer_amount_raw,
+            amount_decimal=deposit.rune.decimal_amount(deposit.transfer_amount_raw),
+            net_amount_raw=deposit.net_amount_raw,
+            txid=deposit.tx_id,
+            vout=deposit.vout,
+            rune_name=deposit.rune.name,
+            rune_number=deposit.rune.n,
+        )
+
+    def prefetch_rune_deposit_contract_state(self, deposit_ids: list[int]):
+        """
+        Read the contract state needed to validate the deposits in one multicall
+        """
+        with self.transaction_manager.transaction() as tx:
+            dbsession = tx.find_service(Session)
+            rune_numbers = dbsession.scalars(
+                sa.select(RuneDeposit.rune_number)
+                .where(
+                    RuneDeposit.bridge_id == self.bridge_id,
+                    RuneDeposit.id.in_(deposit_ids),
+                )
+                .distinct()
+            ).all()
+        self.contract_state.prefetch_runes(rune_numbers)
+
     def validate_rune_deposit_for_sending(self, deposit_id: int) -> bool:
         with self.transaction_manager.transaction() as tx:
             dbsession = tx.find_service(Session)
@@ -660,10 +1012,10 @@ class RuneBridgeService:
             rune_number = deposit.rune.n
             rune_name = deposit.rune.name
             postage = deposit.postage
-        if not self.rune_bridge_contract.functions.isRuneRegistered(rune_number).call():
+        if not self.contract_state.is_rune_registered(rune_number):
             self.logger.warning("Rune %s for deposit %s is not registered", rune_name, deposit_repr)
             return False
-        if self.rune_bridge_contract.functions.isRunePaused(rune_number).call():
+        if self.contract_state.is_rune_paused(rune_number):
             self.logger.warning("Rune %s for deposit %s is paused", rune_name, deposit_repr)
             return False
         if postage < self.config.btc_min_postage_sat:
@@ -682,40 +1034,85 @@ class RuneBridgeService:
         message_hash: str,
         answers: list[messages.SignRuneToEvmTransferAnswer],
     ) -> bool:
-        with self.transaction_manager.transaction() as tx:
-            dbsession = tx.find_service(Session)
-            deposit = (
-                dbsession.query(RuneDeposit)
-                .filter_by(
-                    bridge_id=self.bridge_id,
-                    id=deposit_id,
-                )
-                .one()
-            )
-            self.logger.info("Updating signatures for deposit %s", deposit)
-            if deposit.status != RuneDepositStatus.ACCEPTED:
-                raise ValidationError(f"Deposit {deposit} not accepted (got {deposit.status})")
+        ready_deposit_ids = self.update_rune_deposit_signatures_in_bulk(
+            {deposit_id: (message_hash, answers)},
+        )
+        return deposit_id in ready_deposit_ids
 
-            deposit.accept_transfer_message_hash = message_hash
-            signatures = deposit.accept_transfer_signatures
-            signers = deposit.accept_transfer_signers
-            answers = self._prune_invalid_sign_rune_to_evm_transfer_answers(
+    def update_rune_deposit_signatures_in_bulk(
+        self,
+        answers_by_deposit_id: dict[int, tuple[str, list[messages.SignRuneToEvmTransferAnswer]]],
+    ) -> list[int]:
+        """
+        Store the valid signatures of many deposits in a single transaction.
+
+        `answers_by_deposit_id` maps deposit ids to (message_hash, answers). Returns the ids of the deposits
+        that have enough signatures to be sent, in the order they were given.
+        """
+        if not answers_by_deposit_id:
+            return []
+        # Look up all the signers at once instead of validating them one by one. Malformed addresses are left for
+        # the validation to reject
+        self.contract_state.prefetch_federators(
+            answer.signer
+            for _, answers in answers_by_deposit_id.values()
+            for answer in answers
+            if Web3.is_checksum_address(answer.signer)
+        )
+        # Validate the answers before touching the DB, so that the transaction doesn't wait for the RPC calls
+        valid_answers_by_deposit_id = {
+            deposit_id: self._prune_invalid_sign_rune_to_evm_transfer_answers(
                 message_hash=message_hash,
                 answers=answers,
             )
-            for answer in answers:
-                if answer.signer not in signers:
-                    signers.append(answer.signer)
-                    signatures.append(answer.signature)
+            for deposit_id, (message_hash, answers) in answers_by_deposit_id.items()
+        }
+        num_required = self.get_runes_to_evm_num_required_signers()
+
+        ready_deposit_ids = []
+        with self.transaction_manager.transaction() as tx:
+            dbsession = tx.find_service(Session)
+            deposits = {
+                deposit.id: deposit
+                for deposit in dbsession.scalars(
+                    sa.select(RuneDeposit)
+                    .where(
+                        RuneDeposit.bridge_id == self.bridge_id,
+                        RuneDeposit.id.in_(answers_by_deposit_id.keys()),
+                    )
+                    .with_for_update()
+                )
+            }
+            for deposit_id, (message_hash, _) in answers_by_deposit_id.items():
+                deposit = deposits.get(deposit_id)
+                if deposit is None:
+                    self.logger.warning("Deposit %s not found, not updating signatures", deposit_id)
+                    continue
+                if deposit.status != RuneDepositStatus.ACCEPTED:
+                    self.logger.warning(
+                        "Deposit %s not accepted (got %s), not updating signatures",
+                        deposit,
+                        deposit.status,
+                    )
+                    continue
+
+                deposit.accept_transfer_message_hash = message_hash
+                signatures = deposit.accept_transfer_signatures
+                signers = deposit.accept_transfer_signers
+                for answer in valid_answers_by_deposit_id[deposit_id]:
+                    if answer.signer not in signers:
+                        signers.append(answer.signer)
+                        signatures.append(answer.signature)
+                self.logger.debug(
+                    "Got %s signatures for deposit %s, required: %s",
+                    len(signatures),
+                    deposit,
+                    num_required,
+                )
+                if len(signatures) >= num_required:
+                    ready_deposit_ids.append(deposit_id)
             dbsession.flush()
-            num_required = self.get_runes_to_evm_num_required_signers()
-            self.logger.debug(
-                "Got %s signatures for deposit %s, required: %s",
-                len(signatures),
-                deposit,
-                num_required,
-            )
-            return len(signatures) >= num_required
+        return ready_deposit_ids
 
     def send_rune_deposit_to_evm(self, deposit_id: int):
         if self.is_bridge_frozen():
@@ -742,7 +1139,6 @@ class RuneBridgeService:
                 self.logger.info("Don't have enough signatures for transfer %s", deposit)
                 return
             signatures = signatures[:num_required_signers]
-            deposit.status = RuneDepositStatus.SENDING_TO_EVM
             evm_address = deposit.user.evm_address
             rune_number = deposit.rune_number
             net_rune_amount = deposit.net_amount_raw
@@ -751,141 +1147,274 @@ class RuneBridgeService:
             rune_name = deposit.rune.spaced_name
             net_amount_decimal = deposit.rune.decimal_amount(net_rune_amount)
 
-        tx_gas_limit = 250_000  # actual gas usage is somewhere around 95k-115k, but let's be safe
-        tx_gas_price = self.web3.eth.gas_price
-        balance_wei = self.web3.eth.get_balance(
-            self.evm_account.address,
-            block_identifier="pending",
-        )
-        min_balance_wei = int(1.2 * tx_gas_limit * tx_gas_price)
-        if balance_wei < min_balance_wei:
-            raise RuntimeError(
-                f"Insufficient balance in EVM account ({from_wei(balance_wei)} < {from_wei(min_balance_wei)}) -- "
-                "cannot execute Runes-to-EVM transfer"
-            )
+        # Reserve the nonce before changing the status, so that the deposit is retried later if there are
+        # too many pending transactions
+        with self.nonce_manager.transaction_params(gas_limit=RUNE_TO_EVM_TRANSFER_GAS_LIMIT) as tx_params:
+            with self.transaction_manager.transaction() as tx:
+                dbsession = tx.find_service(Session)
+                deposit = dbsession.get(RuneDeposit, deposit_id)
+                assert deposit.status == RuneDepositStatus.ACCEPTED
+                deposit.status = RuneDepositStatus.SENDING_TO_EVM
 
-        # set nonce explicitly to avoid overriding our own transactions
-        nonce = self.web3.eth.get_transaction_count(
-            self.evm_account.address,
-            block_identifier="pending",
-        )
+            try:
+                tx_hash = self.rune_bridge_contract.functions.acceptTransferFromBtc(
+                    evm_address,
+                    rune_number,
+                    net_rune_amount,
+                    eth_utils.add_0x_prefix(btc_txid),
+                    btc_vout,
+                    signatures,
+                ).transact(tx_params)
+            except Exception:
+                self.logger.exception("Error sending Rune-to-EVM transfer")
+                with self.transaction_manager.transaction() as tx:
+                    dbsession = tx.find_service(Session)
+                    deposit = dbsession.get(RuneDeposit, deposit_id)
+                    assert deposit.bridge_id == self.bridge_id
+                    deposit.status = RuneDepositStatus.SENDING_TO_EVM_FAILED
+                self._messenger.send_message(
+                    title=f"[{self.bridge_name}] Sending Rune-to-EVM transfer to EVM failed!",
+                    message=(
+                        f"Deposit: `{btc_txid}:{btc_vout}` (rune `{rune_name}`)\n"
+                        f"Transfer: `{net_amount_decimal} {rune_name}`"
+                    ),
+                    alert=True,
+                )
+                raise
 
-        num_pending_transactions = nonce - self.web3.eth.get_transaction_count(
-            self.evm_account.address,
-            block_identifier="latest",
+        with self.transaction_manager.transaction() as tx:
+            dbsession = tx.find_service(Session)
+            deposit = dbsession.get(RuneDeposit, deposit_id)
+            assert deposit.bridge_id == self.bridge_id
+            deposit.status = RuneDepositStatus.SENT_TO_EVM
+            deposit.evm_tx_hash = tx_hash.hex()
+
+        self.logger.info("Sent Rune-to-EVM transfer %s", tx_hash.hex())
+        self._messenger.send_message(
+            title=f"[{self.bridge_name}] Rune-to-EVM transfer sent to EVM",
+            message=(
+                f"EVM Tx: `{tx_hash.hex()}`\n"
+                f"Deposit: `{btc_txid}:{btc_vout}` (rune `{rune_name}`)\n"
+                f"Transfer: `{net_amount_decimal} {rune_name}`"
+            ),
         )
 
-        # RSK has a hard limit of 4 transactions in mempool per address -- just hardcode this for all chains for now
-        # Raising an exception here is fine, transactions will just be resumed
-        if num_pending_transactions >= 4:
-            raise RuntimeError(
-                f"We have {num_pending_transactions} pending transactions, which is greater than 4. "
-                "Trying again later.",
-            )
+    def send_rune_deposits_to_evm(self, deposit_ids: list[int]):
+        """
+        Send multiple accepted Rune->EVM deposits to EVM in a single acceptTransfersFromBtc transaction.
 
-        try:
-            tx_hash = self.rune_bridge_contract.functions.acceptTransferFromBtc(
-                evm_address,
-                rune_number,
-                net_rune_amount,
-                eth_utils.add_0x_prefix(btc_txid),
-                btc_vout,
-                signatures,
-            ).transact(
-                {
-                    "gas": tx_gas_limit,
-                    "nonce": nonce,
-                }
-            )
-            self.logger.info("Sent Rune-to-EVM transfer %s, waiting...", tx_hash.hex())
-            self._messenger.send_message(
-                title=f"[{self.bridge_name}] Rune-to-EVM transfer sent to EVM",
-                message=(
-                    f"EVM Tx: `{tx_hash.hex()}`\n"
-                    f"Deposit: `{btc_txid}:{btc_vout}` (rune `{rune_name}`)\n"
-                    f"Transfer: `{net_amount_decimal} {rune_name}`"
-                ),
-            )
-        except Exception as e:
-            self.logger.exception("Error sending Rune-to-EVM transfer")
-            with self.transaction_manager.transaction() as tx:
-                dbsession = tx.find_service(Session)
-                deposit = dbsession.get(RuneDeposit, deposit_id)
-                assert deposit.bridge_id == self.bridge_id
-                deposit.status = RuneDepositStatus.SENDING_TO_EVM_FAILED
-            self._messenger.send_message(
-                title=f"[{self.bridge_name}] Sending Rune-to-EVM transfer to EVM failed!",
-                message=(
-                    f"Deposit: `{btc_txid}:{btc_vout}` (rune `{rune_name}`)\n"
-                    f"Transfer: `{net_amount_decimal} {rune_name}`"
-                ),
-                alert=True,
+        Deposits without enough signatures are skipped. If the batch would revert, the transfers that revert on
+        their own are marked failed and the rest are sent.
+        """
+        if self.is_bridge_frozen():
+            self.logger.info("Bridge is frozen, cannot send deposits to EVM")
+            return
+
+        num_required_signers = self.get_runes_to_evm_num_required_signers()
+        transfers = []
+        sent_deposit_ids = []
+        deposit_reprs = []
+        with self.transaction_manager.transaction() as tx:
+            dbsession = tx.find_service(Session)
+            deposits = (
+                dbsession.query(RuneDeposit)
+                .filter(
+                    RuneDeposit.bridge_id == self.bridge_id,
+                    RuneDeposit.id.in_(deposit_ids),
+                )
+                .order_by(RuneDeposit.id)
             )
-            raise e
-        else:
+            for deposit in deposits:
+                self.logger.info("Executing Rune-to-EVM transfer %s", deposit)
+                if deposit.status != RuneDepositStatus.ACCEPTED:
+                    raise ValidationError(f"Deposit {deposit} not accepted (got {deposit.status})")
+
+                signatures = deposit.accept_transfer_signatures
+                if len(signatures) < num_required_signers:
+                    self.logger.info("Don't have enough signatures for transfer %s", deposit)
+                    continue
+                transfers.append(
+                    (
+                        deposit.user.evm_address,
+                        deposit.rune_number,
+                        deposit.net_amount_raw,
+                        eth_utils.add_0x_prefix(deposit.tx_id),
+                        deposit.vout,
+                        signatures[:num_required_signers],
+                    )
+                )
+                sent_deposit_ids.append(deposit.id)
+                deposit_reprs.append(
+                    f"`{deposit.tx_id}:{deposit.vout}`: "
+                    f"`{deposit.rune.decimal_amount(deposit.net_amount_raw)} {deposit.rune.spaced_name}`"
+                )
+
+        if not transfers:
+            return
+
+        if len(transfers) > 1 and self._accept_transfers_from_btc_reverts(transfers):
+            # Don't let one invalid transfer fail the whole batch
+            reverting_indices = [
+                i for i, transfer in enumerate(transfers) if self._accept_transfers_from_btc_reverts([transfer])
+            ]
+            if reverting_indices:
+                self.logger.error(
+                    "Rune-to-EVM transfers %s would revert, marking them failed",
+                    [deposit_reprs[i] for i in reverting_indices],
+                )
+                with self.transaction_manager.transaction() as tx:
+                    dbsession = tx.find_service(Session)
+                    for i in reverting_indices:
+                        deposit = dbsession.get(RuneDeposit, sent_deposit_ids[i])
+                        assert deposit.status == RuneDepositStatus.ACCEPTED
+                        deposit.status = RuneDepositStatus.SENDING_TO_EVM_FAILED
+                self._messenger.send_message(
+                    title=f"[{self.bridge_name}] {len(reverting_indices)} Rune-to-EVM transfers would revert!",
+                    message="Deposits:\n" + "\n".join(deposit_reprs[i] for i in reverting_indices),
+                    alert=True,
+                )
+                transfers = [t for i, t in enumerate(transfers) if i not in reverting_indices]
+                sent_deposit_ids = [d for i, d in enumerate(sent_deposit_ids) if i not in reverting_indices]
+                deposit_reprs = [r for i, r in enumerate(deposit_reprs) if i not in reverting_indices]
+                if not transfers:
+                    return
+
+        # Reserve the nonce before changing the status, so that the deposits are retried later if there are
+        # too many pending transactions
+        with self.nonce_manager.transaction_params(
+            gas_limit=min(RUNE_TO_EVM_TRANSFER_GAS_LIMIT * len(transfers), RUNE_TO_EVM_MAX_GAS_LIMIT),
+        ) as tx_params:
             with self.transaction_manager.transaction() as tx:
                 dbsession = tx.find_service(Session)
+                for deposit_id in sent_deposit_ids:
+                    deposit = dbsession.get(RuneDeposit, deposit_id)
+                    assert deposit.status == RuneDepositStatus.ACCEPTED
+                    deposit.status = RuneDepositStatus.SENDING_TO_EVM
+
+            try:
+                tx_hash = self.rune_bridge_contract.functions.acceptTransfersFromBtc(
+                    transfers,
+                ).transact(tx_params)
+            except Exception:
+                self.logger.exception("Error sending Rune-to-EVM transfers")
+                with self.transaction_manager.transaction() as tx:
+                    dbsession = tx.find_service(Session)
+                    for deposit_id in sent_deposit_ids:
+                        deposit = dbsession.get(RuneDeposit, deposit_id)
+                        assert deposit.bridge_id == self.bridge_id
+                        deposit.status = RuneDepositStatus.SENDING_TO_EVM_FAILED
+                self._messenger.send_message(
+                    title=f"[{self.bridge_name}] Sending {len(transfers)} Rune-to-EVM transfers to EVM failed!",
+                    message="Deposits:\n" + "\n".join(deposit_reprs),
+                    alert=True,
+                )
+                raise
+
+        with self.transaction_manager.transaction() as tx:
+            dbsession = tx.find_service(Session)
+            for deposit_id in sent_deposit_ids:
                 deposit = dbsession.get(RuneDeposit, deposit_id)
                 assert deposit.bridge_id == self.bridge_id
                 deposit.status = RuneDepositStatus.SENT_TO_EVM
                 deposit.evm_tx_hash = tx_hash.hex()
 
-        self._confirm_sent_rune_deposit(deposit_id)
+        self.logger.info("Sent %s Rune-to-EVM transfers in %s", len(transfers), tx_hash.hex())
+        self._messenger.send_message(
+            title=f"[{self.bridge_name}] {len(transfers)} Rune-to-EVM transfers sent to EVM",
+            message=f"EVM Tx: `{tx_hash.hex()}`\nDeposits:\n" + "\n".join(deposit_reprs),
+        )
+
+    def _accept_transfers_from_btc_reverts(self, transfers: list[tuple]) -> bool:
+        try:
+            self.rune_bridge_contract.functions.acceptTransfersFromBtc(transfers).call(
+                {"from": self.evm_account.address},
+            )
+        except ContractLogicError:
+            return True
+        return False
 
     def confirm_sent_rune_deposits(self):
+        """
+        Check the receipts of all Rune->EVM deposits sent to EVM, and mark them confirmed or failed.
+
+        The receipts are fetched concurrently (bounded by config.evm_receipt_fetch_concurrency), once per
+        transaction, and the statuses are updated in a single DB transaction.
+        """
+        deposit_reprs_by_tx_hash: dict[str, dict[int, str]] = defaultdict(dict)
         with self.transaction_manager.transaction() as tx:
             dbsession = tx.find_service(Session)
             deposits = dbsession.query(RuneDeposit).filter_by(
                 bridge_id=self.bridge_id,
                 status=RuneDepositStatus.SENT_TO_EVM,
             )
-            ids = [deposit.id for deposit in deposits]
-        for deposit_id in ids:
-            self._confirm_sent_rune_deposit(deposit_id)
+            for deposit in deposits:
+                # Deposits sent in a batch share the same transaction
+                deposit_reprs_by_tx_hash[deposit.evm_tx_hash][deposit.id] = repr(deposit)
+        if not deposit_reprs_by_tx_hash:
+            return
+
+        evm_tx_hashes = list(deposit_reprs_by_tx_hash)
+        max_workers = min(len(evm_tx_hashes), max(1, self.config.evm_receipt_fetch_concurrency))
+        with ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=f"{self.bridge_name}-evm-receipt",
+        ) as executor:
+            receipts = list(executor.map(self._get_transaction_receipt, evm_tx_hashes))
+
+        deposit_ids_by_status: dict[RuneDepositStatus, list[int]] = defaultdict(list)
+        confirmed_tx_hashes = []
+        failed_tx_hashes = []
+        for evm_tx_hash, receipt in zip(evm_tx_hashes, receipts, strict=True):
+            deposit_reprs = deposit_reprs_by_tx_hash[evm_tx_hash]
+            if not receipt:
+                self.logger.info("Rune-to-EVM transfers %s not yet confirmed", list(deposit_reprs.values()))
+            elif receipt["status"]:
+                self.logger.info("Rune-to-EVM transfers %s confirmed", list(deposit_reprs.values()))
+                deposit_ids_by_status[RuneDepositStatus.CONFIRMED_IN_EVM].extend(deposit_reprs)
+                confirmed_tx_hashes.append(evm_tx_hash)
+            else:
+                self.logger.warning("Rune-to-EVM transfers %s failed", list(deposit_reprs.values()))
+                deposit_ids_by_status[RuneDepositStatus.EVM_TRANSACTION_FAILED].extend(deposit_reprs)
+                failed_tx_hashes.append(evm_tx_hash)
+        if not deposit_ids_by_status:
+            return
 
-    def _confirm_sent_rune_deposit(self, deposit_id: int):
         with self.transaction_manager.transaction() as tx:
             dbsession = tx.find_service(Session)
-            deposit = dbsession.get(RuneDeposit, deposit_id)
-            assert deposit.bridge_id == self.bridge_id
-            existing_status = deposit.status
-            evm_tx_hash = deposit.evm_tx_hash
-            deposit_repr = repr(deposit)
-
-        updated_status = None
-        if existing_status == RuneDepositStatus.SENT_TO_EVM:
-            try:
-                receipt = self.web3.eth.get_transaction_receipt(evm_tx_hash)
-            except (TransactionNotFound, TransactionIndexingInProgress):
-                receipt = None
-
-            if receipt:
-                if receipt["status"]:
-                    updated_status = RuneDepositStatus.CONFIRMED_IN_EVM
-                    self.logger.info("Rune-to-EVM transfer %s confirmed", deposit_repr)
-                    self._messenger.send_message(
-                        title=f"[{self.bridge_name}] Rune-to-EVM transfer confirmed in EVM",
-                        message=f"EVM Tx:`{evm_tx_hash}`\nDeposit: `{deposit_repr}`",
+            for updated_status, deposit_ids in deposit_ids_by_status.items():
+                dbsession.execute(
+                    sa.update(RuneDeposit)
+                    .where(
+                        RuneDeposit.bridge_id == self.bridge_id,
+                        RuneDeposit.id.in_(deposit_ids),
+                        RuneDeposit.status == RuneDepositStatus.SENT_TO_EVM,
                     )
-                else:
-                    updated_status = RuneDepositStatus.EVM_TRANSACTION_FAILED
-                    self.logger.warning("Rune-to-EVM transfer %s failed", deposit_repr)
-                    self._messenger.send_message(
-                        title=f"[{self.bridge_name}] Rune-to-EVM transfer in EVM failed!",
-                        message=f"EVM Tx:`{evm_tx_hash}`\nDeposit: `{deposit_repr}`",
-                        alert=True,
-                    )
-            else:
-                self.logger.info("Rune-to-EVM transfer %s not yet confirmed", deposit_repr)
-        else:
-            self.logger.error("Deposit %s not in SENT_TO_EVM state", deposit_repr)
+                    .values(status=updated_status)
+                    .execution_options(synchronize_session=False)
+                )
 
-        if updated_status is not None:
-            with self.transaction_manager.transaction() as tx:
-                dbsession = tx.find_service(Session)
-                deposit = dbsession.get(RuneDeposit, deposit_id)
-                assert deposit.status == RuneDepositStatus.SENT_TO_EVM
-                deposit.status = updated_status
+        for evm_tx_hash in confirmed_tx_hashes:
+            self._messenger.send_message(
+                title=f"[{self.bridge_name}] Rune-to-EVM transfer confirmed in EVM",
+                message=self._format_sent_rune_deposits_message(evm_tx_hash, deposit_reprs_by_tx_hash[evm_tx_hash]),
+            )
+        for evm_tx_hash in failed_tx_hashes:
+            self._messenger.send_message(
+                title=f"[{self.bridge_name}] Rune-to-EVM transfer in EVM failed!",
+                message=self._format_sent_rune_deposits_message(evm_tx_hash, deposit_reprs_by_tx_hash[evm_tx_hash]),
+                alert=True,
+            )
+
+    def _get_transaction_receipt(self, tx_hash: str):
+        try:
+            return self.web3.eth.get_transaction_receipt(tx_hash)
+        except (TransactionNotFound, TransactionIndexingInProgress):
+            return None
+
+    def _format_sent_rune_deposits_message(self, evm_tx_hash: str, deposit_reprs: dict[int, str]) -> str:
+        return f"EVM Tx:`{evm_tx_hash}`\n" + "\n".join(
+            f"Deposit: `{deposit_repr}`" for deposit_repr in deposit_reprs.values()
+        )
 
     def answer_sign_rune_to_evm_transfer_question(
         self,
@@ -921,10 +1450,10 @@ class RuneBridgeService:
         if not rune.n == transfer.rune_number:
             raise ValidationError(f"Rune number mismatch: {rune}.n != {transfer.rune_number}")
 
-        if not self.rune_bridge_contract.functions.isRuneRegistered(rune.n).call():
+        if not self.contract_state.is_rune_registered(rune.n):
             raise ValidationError(f"Rune {rune} not registered")
 
-        if self.rune_bridge_contract.functions.isRunePaused(rune.n).call():
+        if self.contract_state.is_rune_paused(rune.n):
             raise ValidationError(f"Rune {rune} is paused")
 
         divisibility = rune_response["entry"]["divisibility"]
@@ -976,6 +1505,38 @@ class RuneBridgeService:
             message_hash=eth_utils.to_hex(message_hash),
         )
 
+    def answer_sign_rune_to_evm_transfers_question(
+        self,
+        message: messages.SignRuneToEvmTransfersQuestion,
+    ) -> messages.SignRuneToEvmTransfersAnswer:
+        self.contract_state.prefetch_runes(
+            transfer.rune_number
+            for transfer in message.transfers
+            if isinstance(transfer.rune_number, int) and transfer.rune_number >= 0
+        )
+        answers = []
+        errors = []
+        for transfer in message.transfers:
+            try:
+                answer = self.answer_sign_rune_to_evm_transfer_question(
+                    message=messages.SignRuneToEvmTransferQuestion(transfer=transfer),
+                )
+            except ValidationError as e:
+                # Don't let one invalid transfer prevent signing the others
+                self.logger.exception("Not signing Rune->EVM transfer %s", transfer)
+                answers.append(None)
+                errors.append(str(e))
+            except Exception as e:
+                # Nor one that fails for other reasons (e.g. a malformed transfer), or it would block its batch
+                # for good
+                self.logger.exception("Error signing Rune->EVM transfer %s", transfer)
+                answers.append(None)
+                errors.append(f"{type(e).__name__}: {e}")
+            else:
+                answers.append(answer)
+                errors.append(None)
+        return messages.SignRuneToEvmTransfersAnswer(answers=answers, errors=errors)
+
     def _prune_invalid_sign_rune_to_evm_transfer_answers(
         self,
         *,
@@ -1004,7 +1565,7 @@ class RuneBridgeService:
     def validate_sign_rune_to_evm_transfer_answer(
         self, *, message_hash: bytes | str, answer: messages.SignRuneToEvmTransferAnswer
     ):
-        is_federator = self.rune_bridge_contract.functions.isFederator(answer.signer).call()
+        is_federator = self.contract_state.is_federator(answer.signer)
         if not is_federator:
             raise ValidationError(f"Signer {answer.signer} is not a federator")
 
@@ -1021,27 +1582,40 @@ class RuneBridgeService:
         self,
         message: messages.SignRuneTokenToBtcTransferQuestion,
     ) -> messages.SignRuneTokenToBtcTransferAnswer:
-        # Prepare for API change -- message will have multiple transfers in the future
+        # Federators running older versions don't send `transfers`
         transfers = getattr(message, "transfers", None)
-        if transfers is None:
+        if not transfers:
             transfers = [message.transfer]
         num_transfers = len(transfers)
         num_unique_transfers = len(set((transfer.event_tx_hash, transfer.event_log_index) for transfer in transfers))
         if num_unique_transfers != num_transfers:
             raise ValidationError(f"Duplicate transfers: {transfers}")
 
+        # Rune names are shared by many transfers of a batch, so parse them only once
+        runes_by_name = {
+            rune_name: rune_from_str(rune_name) for rune_name in dict.fromkeys(t.rune_name for t in transfers)
+        }
+
         with self.transaction_manager.transaction() as tx:
             dbsession = tx.find_service(Session)
-            for transfer in transfers:
-                deposit = (
-                    dbsession.query(RuneTokenDeposit)
-                    .filter_by(
-                        bridge_id=self.bridge_id,
-                        evm_tx_hash=transfer.event_tx_hash,
-                        evm_log_index=transfer.event_log_index,
+            # Load all deposits in one query instead of one query per transfer
+            deposits_by_event = {
+                (deposit.evm_tx_hash, deposit.evm_log_index): deposit
+                for deposit in dbsession.scalars(
+                    sa.select(RuneTokenDeposit)
+                    .options(joinedload(RuneTokenDeposit.rune))
+                    .where(
+                        RuneTokenDeposit.bridge_id == self.bridge_id,
+                        sa.tuple_(RuneTokenDeposit.evm_tx_hash, RuneTokenDeposit.evm_log_index).in_(
+                            [(transfer.event_tx_hash, transfer.event_log_index) for transfer in transfers]
+                        ),
                     )
-                    .one()
                 )
+            }
+            for transfer in transfers:
+                deposit = deposits_by_event.get((transfer.event_tx_hash, transfer.event_log_index))
+                if deposit is None:
+                    raise ValidationError(f"Deposit not found (transfer: {transfer})")
                 # This validates that the transfer happened on the smart contract side and is seen by us
                 if deposit.status != RuneTokenDepositStatus.ACCEPTED:
                     raise ValidationError(
@@ -1060,7 +1634,7 @@ class RuneBridgeService:
                         f"(transfer: {transfer}))"
                     )
 
-                rune = rune_from_str(transfer.rune_name)
+                rune = runes_by_name[transfer.rune_name]
                 if deposit.rune.n != rune.n:
                     raise ValidationError(f"Rune number mismatch: {deposit.rune.n} != {rune.n} (transfer: {transfer}))")
                 if rune.n != transfer.rune_number:
@@ -1068,12 +1642,6 @@ class RuneBridgeService:
                         f"Rune number/name mismatch: {rune.n} != {transfer.rune_number}  (transfer: {transfer}))"
                     )
 
-                if deposit.net_rune_amount_raw != transfer.net_rune_amount:
-                    raise ValidationError(
-                        f"Net rune amount mismatch: {deposit.net_rune_amount_raw} != {transfer.net_rune_amount} "
-                        f"(transfer: {transfer}))"
-                    )
-
         unsigned_psbt = self.ord_multisig.deserialize_psbt(message.unsigned_psbt_serialized)
 
         unsigned_tx = unsigned_psbt.unsigned_tx
@@ -1119,17 +1687,29 @@ class RuneBridgeService:
         if len(runestone.edicts) != num_transfers:
             raise ValidationError(f"Expected {num_transfers} edicts, got {len(runestone.edicts)}")
 
-        for transfer_vout, (edict, transfer) in enumerate(
-            itertools.zip_longest(runestone.edicts, transfers),
-            start=2,
-        ):
-            rune_response = self.ord_client.get_rune(transfer.rune_name)
-            if not rune_response:
-                raise ValidationError(f"Rune {rune.name} not found in ord")
-
-            rune_id = pyord.RuneId.from_str(rune_response["id"])
+        # Edicts are sorted by rune id when the runestone is enciphered, so match them to transfers by output
+        edicts_by_output = {edict.output: edict for edict in runestone.edicts}
+        if len(edicts_by_output) != num_transfers:
+            raise ValidationError(f"Expected one edict per output, got {runestone.edicts}")
 
-            edict = runestone.edicts[0]
+        # Look up each rune and parse each receiver address only once per question, not once per transfer
+        rune_ids_by_name = {}
+        for rune_name in runes_by_name:
+            rune_response = self.ord_client.get_rune(rune_name)
+            if not rune_response:
+                raise ValidationError(f"Rune {rune_name} not found in ord")
+            rune_ids_by_name[rune_name] = pyord.RuneId.from_str(rune_response["id"])
+        script_pubkeys_by_address = {
+            address: CCoinAddress(address).to_scriptPubKey()
+            for address in dict.fromkeys(t.receiver_address for t in transfers)
+        }
+
+        for transfer_vout, transfer in enumerate(transfers, start=2):
+            rune_id = rune_ids_by_name[transfer.rune_name]
+
+            edict = edicts_by_output.get(transfer_vout)
+            if edict is None:
+                raise ValidationError(f"No edict for output {transfer_vout} (transfer: {transfer})")
             if edict.amount != transfer.net_rune_amount:
                 raise ValidationError(
                     f"Amount mismatch: {edict.amount} != {transfer.net_rune_amount} "
@@ -1148,12 +1728,12 @@ class RuneBridgeService:
                     f"got {unsigned_tx.vout[transfer_vout].nValue} (transfer: {transfer})"
                 )
 
-            expected_parsed_address = CCoinAddress(transfer.receiver_address)
+            expected_script_pubkey = script_pubkeys_by_address[transfer.receiver_address]
             script_pubkey = unsigned_tx.vout[transfer_vout].scriptPubKey
-            if script_pubkey != expected_parsed_address.to_scriptPubKey():
+            if script_pubkey != expected_script_pubkey:
                 raise ValidationError(
-                    f"Expected script pubkey {expected_parsed_address.to_scriptPubKey()} "
-                    "(address {expected_parsed_address}) at output {transfer_vout}, "
+                    f"Expected script pubkey {expected_script_pubkey} "
+                    f"(address {transfer.receiver_address}) at output {transfer_vout}, "
                     f"got {script_pubkey} (transfer: {transfer})"
                 )
 
@@ -1183,6 +1763,20 @@ class RuneBridgeService:
         )
 
     def scan_rune_token_deposits(self) -> int:
+        """
+        Scan new RuneTransferToBtc events in chunks of at most `evm_scan_chunk_size` blocks.
+
+        Each chunk is applied and checkpointed in its own transaction, so a long catch-up makes durable progress
+        and an error late in the range only loses the current chunk.
+        """
+        num_transfers = 0
+        caught_up = False
+        while not caught_up:
+            num_chunk_transfers, caught_up = self._scan_rune_token_deposit_chunk()
+            num_transfers += num_chunk_transfers
+        return num_transfers
+
+    def _scan_rune_token_deposit_chunk(self) -> tuple[int, bool]:
         with self.transaction_manager.transaction() as tx:
             dbsession = tx.find_service(Session)
             key_value_store = tx.find_service(KeyValueStore)
@@ -1258,10 +1852,12 @@ class RuneBridgeService:
                 key_value_store=key_value_store,
                 key_value_store_namespace=self.bridge_name,
                 default_start_block=self.config.evm_default_start_block,
+                prefetch_concurrency=self.config.evm_log_prefetch_concurrency,
+                chain_id=self.evm_chain_id,
             )
-            scanner.scan_new_events()
+            caught_up = scanner.scan_new_events(max_blocks=self.config.evm_scan_chunk_size)
 
-        return num_transfers
+        return num_transfers, caught_up
 
     def get_accepted_rune_token_deposit_ids(self):
         with self.transaction_manager.transaction() as tx:
@@ -1278,6 +1874,11 @@ class RuneBridgeService:
             )
             return [deposit.id for deposit in deposits]
 
+    def get_accepted_rune_token_deposit_id_batches(self) -> list[list[int]]:
+        deposit_ids = self.get_accepted_rune_token_deposit_ids()
+        batch_size = self.config.btc_transfer_batch_max_size
+        return [deposit_ids[i : i + batch_size] for i in range(0, len(deposit_ids), batch_size)]
+
     def handle_accepted_rune_token_deposit(
         self,
         deposit_id: int,
@@ -1286,30 +1887,66 @@ class RuneBridgeService:
             list[messages.SignRuneTokenToBtcTransferAnswer],
         ],
     ):
+        self.handle_accepted_rune_token_deposits([deposit_id], ask_signatures=ask_signatures)
+
+    def handle_accepted_rune_token_deposits(
+        self,
+        deposit_ids: list[int],
+        ask_signatures: Callable[
+            [messages.SignRuneTokenToBtcTransferQuestion],
+            list[messages.SignRuneTokenToBtcTransferAnswer],
+        ],
+    ):
+        """
+        Transfer accepted RuneToken->BTC deposits to BTC in a single Bitcoin transaction,
+        with one edict (and output) per deposit.
+
+        If the transaction would be larger than `btc_transfer_batch_max_vbytes`, only part of the deposits are
+        transferred, and the rest are left for the next round. Deposits with a zero net amount are rejected.
+        """
+        deposit_ids_and_transfers: list[tuple[int, messages.RuneTokenToBtcTransfer]] = []
+        rejected_deposits = []
         with self.transaction_manager.transaction() as tx:
             dbsession = tx.find_service(Session)
-            deposit = (
-                dbsession.query(RuneTokenDeposit)
-                .filter_by(
-                    bridge_id=self.bridge_id,
-                    id=deposit_id,
+            for deposit_id in deposit_ids:
+                deposit = (
+                    dbsession.query(RuneTokenDeposit)
+                    .filter_by(
+                        bridge_id=self.bridge_id,
+                        id=deposit_id,
+                    )
+                    .one()
                 )
-                .one()
+                self.logger.info("Processing RuneToken->BTC deposit %s", deposit)
+                if deposit.status != RuneTokenDepositStatus.ACCEPTED:
+                    raise ValidationError(f"Deposit {deposit} not accepted (got {deposit.status})")
+                if deposit.net_rune_amount_raw == 0:
+                    # Reject it for good, so that it doesn't keep blocking (a slot of) the batch
+                    self.logger.warning("Net amount is zero for deposit %s, rejecting it", deposit)
+                    deposit.status = RuneTokenDepositStatus.REJECTED
+                    rejected_deposits.append(str(deposit))
+                    continue
+                transfer = messages.RuneTokenToBtcTransfer(
+                    receiver_address=deposit.receiver_btc_address,
+                    rune_number=deposit.rune.n,
+                    rune_name=deposit.rune.name,
+                    token_address=deposit.token_address,
+                    net_rune_amount=deposit.net_rune_amount_raw,
+                    event_tx_hash=deposit.evm_tx_hash,
+                    event_log_index=deposit.evm_log_index,
+                )
+                deposit_ids_and_transfers.append((deposit_id, transfer))
+
+        if rejected_deposits:
+            self._messenger.send_message(
+                title=f"[{self.bridge_name}] Rejected RuneToken->BTC deposits with zero net amount",
+                message=f"Deposits: `{rejected_deposits}`",
+                alert=True,
             )
-            self.logger.info("Processing RuneToken->BTC deposit %s", deposit)
-            if deposit.status != RuneTokenDepositStatus.ACCEPTED:
-                raise ValidationError(f"Deposit {deposit} not accepted (got {deposit.status})")
-            if deposit.net_rune_amount_raw == 0:
+            if len(deposit_ids) == 1:
                 raise ValidationError("Net amount is zero")
-            transfer = messages.RuneTokenToBtcTransfer(
-                receiver_address=deposit.receiver_btc_address,
-                rune_number=deposit.rune.n,
-                rune_name=deposit.rune.name,
-                token_address=deposit.token_address,
-                net_rune_amount=deposit.net_rune_amount_raw,
-                event_tx_hash=deposit.evm_tx_hash,
-                event_log_index=deposit.evm_log_index,
-            )
+        if not deposit_ids_and_transfers:
+            return
 
         fee_rate_sats_per_vb = self._btc_fee_estimator.get_fee_sats_per_vb()
         self.logger.info("Fee rate: %s sats/vb", fee_rate_sats_per_vb)
@@ -1326,24 +1963,41 @@ class RuneBridgeService:
         self.logger.info("Adjusted fee rate: %s sats/vb", fee_rate_sats_per_vb)
 
         num_required_signatures = self.get_rune_tokens_to_btc_num_required_signers()
-        unsigned_psbt = self.ord_multisig.create_rune_psbt(
-            fee_rate_sat_per_vbyte=fee_rate_sats_per_vb,
-            transfers=[
-                RuneTransfer(
-                    rune=transfer.rune_number,
-                    receiver=transfer.receiver_address,
-                    amount=transfer.net_rune_amount,
-                )
-            ],
-        )
+        while True:
+            transfers = [transfer for _, transfer in deposit_ids_and_transfers]
+            unsigned_psbt = self.ord_multisig.create_rune_psbt(
+                fee_rate_sat_per_vbyte=fee_rate_sats_per_vb,
+                transfers=[
+                    RuneTransfer(
+                        rune=transfer.rune_number,
+                        receiver=transfer.receiver_address,
+                        amount=transfer.net_rune_amount,
+                    )
+                    for transfer in transfers
+                ],
+            )
+            if len(transfers) == 1:
+                break
+            psbt_size = self.ord_multisig.estimate_psbt_size_vb(unsigned_psbt)
+            if psbt_size <= self.config.btc_transfer_batch_max_vbytes:
+                break
+            self.logger.info(
+                "PSBT for %s transfers too large (%s vbytes), halving the batch",
+                len(transfers),
+                psbt_size,
+            )
+            deposit_ids_and_transfers = deposit_ids_and_transfers[: len(deposit_ids_and_transfers) // 2]
+        deposit_ids = [deposit_id for deposit_id, _ in deposit_ids_and_transfers]
+
         message = messages.SignRuneTokenToBtcTransferQuestion(
-            transfer=transfer,
+            transfer=transfers[0],
             unsigned_psbt_serialized=self.ord_multisig.serialize_psbt(unsigned_psbt),
             fee_rate_sats_per_vb=fee_rate_sats_per_vb,
+            transfers=transfers if len(transfers) > 1 else None,
         )
         self_response = self.answer_sign_rune_token_to_btc_transfer_question(message=message)
         self_signed_psbt = self.ord_multisig.deserialize_psbt(self_response.signed_psbt_serialized)
-        self.logger.info("Asking for signatures for RuneToken->BTC transfer %s", transfer)
+        self.logger.info("Asking for signatures for RuneToken->BTC transfers %s", transfers)
         responses = ask_signatures(message)
         signed_psbts = [self_signed_psbt]
         signed_psbts.extend(
@@ -1355,8 +2009,8 @@ class RuneBridgeService:
 
         if len(signed_psbts) < num_required_signatures:
             self.logger.warning(
-                "Not enough signatures for transfer: %s (got %s, expected %s)",
-                transfer,
+                "Not enough signatures for transfers: %s (got %s, expected %s)",
+                transfers,
                 len(signed_psbts),
                 num_required_signatures,
             )
@@ -1369,10 +2023,11 @@ class RuneBridgeService:
 
         with self.transaction_manager.transaction() as tx:
             dbsession = tx.find_service(Session)
-            deposit = dbsession.get(RuneTokenDeposit, deposit_id)
-            assert deposit.status == RuneTokenDepositStatus.ACCEPTED
-            deposit.status = RuneTokenDepositStatus.SENDING_TO_BTC
-            deposit.finalized_psbt = self.ord_multisig.serialize_psbt(finalized_psbt)
+            for deposit_id in deposit_ids:
+                deposit = dbsession.get(RuneTokenDeposit, deposit_id)
+                assert deposit.status == RuneTokenDepositStatus.ACCEPTED
+                deposit.status = RuneTokenDepositStatus.SENDING_TO_BTC
+                deposit.finalized_psbt = self.ord_multisig.serialize_psbt(finalized_psbt)
             dbsession.flush()
 
         try:
@@ -1381,45 +2036,40 @@ class RuneBridgeService:
             self.logger.exception("Error broadcasting RuneToken->BTC transfer")
             with self.transaction_manager.transaction() as tx:
                 dbsession = tx.find_service(Session)
-                deposit = dbsession.get(RuneTokenDeposit, deposit_id)
-                deposit.status = RuneTokenDepositStatus.SENDING_TO_BTC_FAILED
+                deposits = [dbsession.get(RuneTokenDeposit, deposit_id) for deposit_id in deposit_ids]
+                for deposit in deposits:
+                    deposit.status = RuneTokenDepositStatus.SENDING_TO_BTC_FAILED
                 self._messenger.send_message(
                     title=f"[{self.bridge_name}] Broadcasting Rune PSBT to Bitcoin failed!",
-                    message=f"Deposit: `{deposit}`\nTransfer: `{transfer}",
+                    message=f"Deposits: `{deposits}`\nTransfers: `{transfers}`",
                     alert=True,
                 )
             raise e
 
         self._messenger.send_message(
             title=f"[{self.bridge_name}] Rune PSBT broadcast to Bitcoin",
-            message=f"BTC Tx: `{txid}`\nTransfer: `{transfer}`\n",
+            message=f"BTC Tx: `{txid}`\nTransfers: `{transfers}`\n",
         )
 
         with self.transaction_manager.transaction() as tx:
             dbsession = tx.find_service(Session)
-            deposit = dbsession.get(RuneTokenDeposit, deposit_id)
-            assert deposit.status == RuneTokenDepositStatus.SENDING_TO_BTC
-            deposit.status = RuneTokenDepositStatus.SENT_TO_BTC
-            deposit.btc_tx_id = txid
+            for deposit_id in deposit_ids:
+                deposit = dbsession.get(RuneTokenDeposit, deposit_id)
+                assert deposit.status == RuneTokenDepositStatus.SENDING_TO_BTC
+                deposit.status = RuneTokenDepositStatus.SENT_TO_BTC
+                deposit.btc_tx_id = txid
             dbsession.flush()
 
     def get_user_by_deposit_address(self, deposit_address: str) -> User | None:
         with self.transaction_manager.transaction() as tx:
             dbsession = tx.find_service(Session)
-            obj = dbsession.scalars(
-                sa.select(DepositAddress)
-                .join(User)
-                .filter(
-                    User.bridge_id == self.bridge_id,
-                    DepositAddress.btc_address == deposit_address,
-                )
-            ).one_or_none()
-            if not obj:
+            owner = self._deposit_address_index.get(dbsession, deposit_address)
+            if not owner:
                 return None
-            return obj.user
+            return dbsession.get(User, owner.user_id)
 
     def get_runes_to_evm_num_required_signers(self) -> int:
-        return self.rune_bridge_contract.functions.numRequiredFederators().call()
+        return self.contract_state.get_num_required_federators()
 
     def get_rune_tokens_to_btc_num_required_signers(self) -> int:
         return self.ord_multisig.num_required_signers
@@ -1428,7 +2078,7 @@ class RuneBridgeService:
         return self.ord_multisig.num_required_signers
 
     def is_bridge_frozen(self) -> bool:
-        return self.rune_bridge_contract.functions.frozen().call()
+        return self.contract_state.is_frozen()
 
     def _sleep(self, multiplier: float = 1.0):
         time.sleep(1.0 * multiplier)
@@ -1456,15 +2106,14 @@ class RuneBridgeService:
         )
 
     def get_rune_token(self, rune_number: int) -> Contract:
-        address = self.rune_bridge_contract.functions.getTokenByRune(rune_number).call()
+        address = self.contract_state.get_token_by_rune(rune_number)
         return self.web3.eth.contract(
             address=address,
             abi=load_rune_bridge_abi("RuneToken"),
         )
 
     def get_rune_token_or_none(self, rune_number: int) -> Contract | None:
-        is_registered = self.rune_bridge_contract.functions.isRuneRegistered(rune_number).call()
-        if not is_registered:
+        if not self.contract_state.is_rune_registered(rune_number):
             return None
         return self.get_rune_token(rune_number)
 
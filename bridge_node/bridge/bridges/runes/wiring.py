@@ -1,9 +1,11 @@
 from dataclasses import dataclass
 from urllib.parse import urlsplit, urlunsplit
 
+import requests
 from eth_account import Account
 
 from ...common.btc.rpc import BitcoinRPC
+from ...common.evm.nonces import NonceManager
 from ...common.evm.utils import create_web3
 from ...common.messengers import Messenger
 from ...common.ord.client import OrdApiClient
@@ -30,12 +32,23 @@ def wire_rune_bridge(
     network: Network,
     transaction_manager: TransactionManager,
     messenger: Messenger | None = None,
+    bitcoin_rpc_session: requests.Session | None = None,
 ) -> RuneBridgeWiring:
+    # The same (pooled) RPC client is shared by the multisig and the service. If bitcoin_rpc_session is given,
+    # the connection pool is also shared with other clients of the same bitcoind (sized by BRIDGE_BTC_RPC_POOL_SIZE)
     bitcoin_rpc = BitcoinRPC(
         url=_add_auth(config.btc_rpc_wallet_url, secrets.btc_rpc_auth),
+        session=bitcoin_rpc_session,
+        timeout=(min(5.0, config.btc_rpc_timeout_seconds), config.btc_rpc_timeout_seconds),
+        record_latencies=config.btc_rpc_record_latencies,
     )
+    # One pooled client is shared by the multisig (and its output cache) and the service. The pool must fit
+    # all the concurrent output lookups of a deposit scan.
     ord_client = OrdApiClient(
         base_url=_add_auth(config.ord_api_url, secrets.ord_api_auth),
+        pool_size=max(config.ord_api_pool_size, config.ord_output_resolution_concurrency),
+        timeout=(min(5.0, config.ord_api_timeout_seconds), config.ord_api_timeout_seconds),
+        max_retries=config.ord_api_max_retries,
     )
 
     min_non_change_rune_utxo_confirmations = config.btc_min_confirmations
@@ -50,6 +63,7 @@ def wire_rune_bridge(
         bitcoin_rpc=bitcoin_rpc,
         ord_client=ord_client,
         min_non_change_rune_utxo_confirmations=min_non_change_rune_utxo_confirmations,
+        psbt_signing_concurrency=config.btc_psbt_signing_concurrency,
     )
 
     evm_account = Account.from_key(secrets.evm_private_key)
@@ -68,6 +82,7 @@ def wire_rune_bridge(
         web3=web3,
         rune_bridge_contract=rune_bridge_contract,
         evm_account=evm_account,
+        nonce_manager=NonceManager(web3=web3, address=evm_account.address),
         messenger=messenger,
     )
 
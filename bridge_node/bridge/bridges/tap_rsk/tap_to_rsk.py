@@ -8,6 +8,7 @@ from hexbytes import HexBytes
 from sqlalchemy.orm.session import Session
 
 from bridge.common.evm.account import Account
+from bridge.common.evm.nonces import NonceManager
 from bridge.common.evm.provider import Web3
 from bridge.common.evm.utils import recover_message
 from bridge.common.p2p.network import Network
@@ -28,6 +29,7 @@ logger = logging.getLogger(__name__)
 
 
 SIGN_TRANSFER_BATCH_QUESTION = "taprsk-sign-tap-to-rsk"
+ACCEPT_TRANSFER_FROM_TAP_GAS_LIMIT = 20_000_000
 
 
 class SignTransferBatchAnswer(TypedDict):
@@ -45,6 +47,7 @@ class TapToRskService:
     config: Config = autowired(auto)
     rsk_account: Account = autowired(auto)
     web3: Web3 = autowired(auto)
+    nonce_manager: NonceManager = autowired(auto)
 
     def __init__(self, container: Container):
         self.container = container
@@ -137,19 +140,55 @@ class TapToRskService:
                     )
                 ]
 
+            # Transfers already processed by an earlier, partially failed attempt are skipped
+            accept_transfer_calls = [
+                call_args
+                for call_args in accept_transfer_calls
+                if not self.bridge_contract.functions.isProcessed(call_args[2], call_args[3]).call()
+            ]
+
+            if not accept_transfer_calls:
+                logger.info("All transfers of batch %s already processed", batch_id)
+                with self.transaction_manager.transaction() as tx:
+                    dbsession = tx.find_service(Session)
+                    current_batch = dbsession.query(TapToRskTransferBatch).get(batch_id)
+                    current_batch.status = TapToRskTransferBatchStatus.FINALIZED
+                    dbsession.flush()
+                return
+
+            # Check that we can afford the whole batch before committing to send it
+            self.nonce_manager.refresh()
+            self.nonce_manager.check_balance(gas_limit=ACCEPT_TRANSFER_FROM_TAP_GAS_LIMIT * len(accept_transfer_calls))
+
+            with self.transaction_manager.transaction() as tx:
+                dbsession = tx.find_service(Session)
+                current_batch = dbsession.query(TapToRskTransferBatch).get(batch_id)
                 status = current_batch.status = TapToRskTransferBatchStatus.SENDING_TO_RSK
                 dbsession.flush()
 
             logger.info("Handling %s transfers from Tap to EVM", len(accept_transfer_calls))
             tx_hashes = []
-            for call_args in accept_transfer_calls:
-                tx_hash = self.bridge_contract.functions.acceptTransferFromTap(*call_args).transact(
-                    {
-                        "gas": 20_000_000,
-                    }
-                )
-                logger.info("Tx hash %s", tx_hash.hex())
-                tx_hashes.append(tx_hash)
+            try:
+                for call_args in accept_transfer_calls:
+                    # The batch is sent all at once, so the pending transaction limit doesn't apply
+                    with self.nonce_manager.transaction_params(
+                        gas_limit=ACCEPT_TRANSFER_FROM_TAP_GAS_LIMIT,
+                        limit_pending=False,
+                    ) as tx_params:
+                        tx_hash = self.bridge_contract.functions.acceptTransferFromTap(*call_args).transact(tx_params)
+                    logger.info("Tx hash %s", tx_hash.hex())
+                    tx_hashes.append(tx_hash)
+            except Exception:
+                logger.exception("Sending batch %s failed after %s transfers", batch_id, len(tx_hashes))
+                # Wait for the sent transfers to be processed, so that they are skipped on retry
+                for tx_hash in tx_hashes:
+                    self.web3.eth.wait_for_transaction_receipt(tx_hash, poll_latency=2)
+                with self.transaction_manager.transaction() as tx:
+                    dbsession = tx.find_service(Session)
+                    current_batch = dbsession.query(TapToRskTransferBatch).get(batch_id)
+                    current_batch.status = TapToRskTransferBatchStatus.SIGNATURES_COLLECTED
+                    dbsession.flush()
+                raise
 
             with self.transaction_manager.transaction() as tx:
                 dbsession = tx.find_service(Session)
@@ -0,0 +1,113 @@
+import logging
+import threading
+import time
+
+from .interfaces.bridge import Bridge
+from .wakeups import Wakeup
+
+logger = logging.getLogger(__name__)
+
+
+class BridgeWorker:
+    """
+    Runs the iterations of a single bridge in its own thread, so that a slow bridge doesn't delay the others.
+
+    Iterations are run every `sleep_time` seconds, or earlier when the worker's `wakeup` is notified (but at most
+    every `min_interval` seconds). After a failed iteration, the next one is delayed with exponential backoff,
+    up to `max_backoff` seconds. Python threads cannot be interrupted, so an iteration taking longer than `timeout`
+    seconds is only reported by `is_stuck()` for the supervisor to act on.
+    """
+
+    def __init__(
+        self,
+        *,
+        bridge: Bridge,
+        sleep_time: float,
+        min_interval: float = 1.0,
+        timeout: float = 600.0,
+        max_backoff: float = 300.0,
+    ):
+        self.bridge = bridge
+        self.sleep_time = sleep_time
+        self.min_interval = min_interval
+        self.timeout = timeout
+        self.max_backoff = max_backoff
+        self.wakeup = Wakeup()
+
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._iteration_started_at: float | None = None
+        self._last_success_at: float | None = None
+        self._num_consecutive_failures = 0
+
+    @property
+    def name(self) -> str:
+        return self.bridge.name
+
+    def start(self):
+        if self.is_alive():
+            raise RuntimeError(f"Worker for bridge {self.name} already running")
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"bridge-worker-{self.name}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None):
+        self._stopped.set()
+        self.wakeup.notify("stop")
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def is_alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def is_stuck(self) -> bool:
+        iteration_started_at = self._iteration_started_at
+        return iteration_started_at is not None and time.monotonic() - iteration_started_at > self.timeout
+
+    def get_status(self) -> dict[str, object]:
+        now = time.monotonic()
+        iteration_started_at = self._iteration_started_at
+        last_success_at = self._last_success_at
+        return {
+            "alive": self.is_alive(),
+            "stuck": self.is_stuck(),
+            "iteration_running_seconds": None if iteration_started_at is None else now - iteration_started_at,
+            "seconds_since_last_success": None if last_success_at is None else now - last_success_at,
+            "consecutive_failures": self._num_consecutive_failures,
+        }
+
+    def _run(self):
+        while not self._stopped.is_set():
+            iteration_started_at = self._iteration_started_at = time.monotonic()
+            try:
+                self.bridge.run_iteration()
+            except Exception:
+                self._num_consecutive_failures += 1
+                logger.exception(
+                    "Error in iteration from bridge %s (%d consecutive failures)",
+                    self.name,
+                    self._num_consecutive_failures,
+                )
+            else:
+                self._num_consecutive_failures = 0
+                self._last_success_at = time.monotonic()
+            finally:
+                self._iteration_started_at = None
+
+            if self._num_consecutive_failures:
+                backoff = min(self.sleep_time * 2 ** (self._num_consecutive_failures - 1), self.max_backoff)
+                logger.info("Backing off bridge %s for %.1f seconds", self.name, backoff)
+                self._stopped.wait(backoff)
+                continue
+
+            reasons = self.wakeup.wait(timeout=self.sleep_time)
+            if reasons and not self._stopped.is_set():
+                logger.debug("Bridge %s woken up by %s", self.name, ", ".join(sorted(reasons)))
+                # Don't run iterations back-to-back when there's a lot going on (e.g. a burst of new transactions)
+                remaining = self.min_interval - (time.monotonic() - iteration_started_at)
+                if remaining > 0:
+                    self._stopped.wait(remaining)
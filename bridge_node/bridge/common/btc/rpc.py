@@ -1,8 +1,10 @@
 import decimal
 import json
+import threading
 import time
 import typing
 import urllib.parse
+from collections.abc import Sequence
 from decimal import Decimal
 
 import requests
@@ -10,6 +12,16 @@ from anemic.ioc import Container, service
 
 from bridge.config import Config
 
+from ..utils.http import (
+    LatencyHistogram,
+    Timeout,
+    create_http_session,
+    get_connection_pool_stats,
+)
+
+# Timeout for calls that can rescan the chain, e.g. importdescriptors (with an old timestamp) and rescanblockchain
+LONG_RUNNING_CALL_TIMEOUT: Timeout = (5.0, 3600.0)
+
 
 class JSONRPCError(requests.HTTPError):
     def __init__(self, *, message, code=None, request=None, response=None, jsonrpc_data=None):
@@ -27,10 +39,32 @@ class JSONRPCError(requests.HTTPError):
 
 
 class BitcoinRPC:
-    """Requests-based RPC client, because bitcointx.rpc.RPCCaller is riddled with cryptic http errors"""
+    """
+    Requests-based RPC client, because bitcointx.rpc.RPCCaller is riddled with cryptic http errors.
+
+    Calls go through a keep-alive connection pool. Pass the same `session` to instances that talk to the same
+    bitcoind (e.g. wallet and non-wallet URLs) to share the pool. JSON-RPC calls are not retried, since they are
+    not necessarily idempotent.
+
+    Long-running calls (e.g. importdescriptors or rescanblockchain, which rescan the chain) can override the
+    default timeout per call, e.g. `rpc.call("rescanblockchain", timeout=LONG_RUNNING_CALL_TIMEOUT)`.
+    """
 
-    def __init__(self, url: str):
+    def __init__(
+        self,
+        url: str,
+        *,
+        session: requests.Session | None = None,
+        pool_size: int = 10,
+        timeout: Timeout = (5.0, 120.0),
+        record_latencies: bool = False,
+    ):
         self._id_count = 0
+        self._id_lock = threading.Lock()
+        self.timeout = timeout
+        self._session = session if session is not None else create_http_session(pool_size=pool_size)
+        self._latency_histograms: dict[str, LatencyHistogram] | None = {} if record_latencies else None
+        self._latency_histograms_lock = threading.Lock()
         urlparts = urllib.parse.urlparse(url)
         self._auth = (urlparts.username, urlparts.password) if (urlparts.username or urlparts.password) else None
         if urlparts.port:
@@ -48,9 +82,13 @@ class BitcoinRPC:
             )
         )
 
+    @property
+    def session(self) -> requests.Session:
+        return self._session
+
     # Interface to any service call
-    def call(self, service_name: str, *args: typing.Any):
-        return self._jsonrpc_call(service_name, args)
+    def call(self, service_name: str, *args: typing.Any, timeout: Timeout | None = None):
+        return self._jsonrpc_call(service_name, args, timeout=timeout)
 
     # __getattr__ for allowing syntactic sugar to any service call
     def __getattr__(self, name: str):
@@ -58,35 +96,137 @@ class BitcoinRPC:
             # No internals
             raise AttributeError(name)
 
-        def caller(*args: typing.Any):
-            return self.call(name, *args)
+        def caller(*args: typing.Any, timeout: Timeout | None = None):
+            return self.call(name, *args, timeout=timeout)
 
         caller.__name__ = name
         return caller
 
+    def call_many(
+        self,
+        calls: Sequence[tuple[str, Sequence[typing.Any]]],
+        *,
+        return_exceptions: bool = False,
+        timeout: Timeout | None = None,
+    ) -> list[typing.Any]:
+        """
+        Send multiple calls as one JSON-RPC batch request (a single HTTP POST).
+
+        `calls` is a sequence of (method, params) tuples. Results are returned in the same order as the calls.
+        If any call fails, a JSONRPCError for the first failing call is raised, unless `return_exceptions` is True,
+        in which case the JSONRPCErrors are returned in place of the results of the failing calls.
+        """
+        if not calls:
+            return []
+
+        batch_data = []
+        for method, params in calls:
+            batch_data.append(
+                {
+                    "jsonrpc": "2.0",
+                    "id": self._next_id(),
+                    "method": method,
+                    "params": list(params),
+                }
+            )
+
+        response, response_json = self._post(batch_data, timeout=timeout)
+        if not isinstance(response_json, list):
+            # Errors for the whole batch (e.g. auth errors or invalid requests) are returned as a single object
+            error = response_json.get("error") if isinstance(response_json, dict) else None
+            raise JSONRPCError(
+                message=str(error or "Expected a list of responses to a batch request"),
+                response=response,
+                jsonrpc_data=batch_data,
+            )
+
+        responses_by_id = {item.get("id"): item for item in response_json if isinstance(item, dict)}
+        ret = []
+        for jsonrpc_data in batch_data:
+            item = responses_by_id.get(jsonrpc_data["id"])
+            if item is None:
+                result = JSONRPCError(
+                    message="No response for call in batch",
+                    response=response,
+                    jsonrpc_data=jsonrpc_data,
+                )
+            else:
+                try:
+                    result = self._get_result(response, item, jsonrpc_data, check_http_status=False)
+                except JSONRPCError as e:
+                    result = e
+            if isinstance(result, JSONRPCError) and not return_exceptions:
+                raise result
+            ret.append(result)
+        return ret
+
     # Type-annotate all calls implemented with __getattr__, implement methods ourselves
 
-    def _jsonrpc_call(self, method, params):
-        self._id_count += 1
+    def get_stats(self) -> dict[str, typing.Any]:
+        """
+        Get connection pool stats, and per-method latency histograms if enabled with `record_latencies`.
+        Batch requests are recorded under the method "batch".
+        """
+        pool_stats = get_connection_pool_stats(self._session)
+        ret = {
+            "num_requests": pool_stats.num_requests,
+            "num_connections": pool_stats.num_connections,
+            "num_reused_connections": pool_stats.num_reused_connections,
+        }
+        if self._latency_histograms is not None:
+            with self._latency_histograms_lock:
+                histograms = dict(self._latency_histograms)
+            ret["latencies"] = {method: histogram.as_dict() for method, histogram in sorted(histograms.items())}
+        return ret
+
+    def close(self):
+        self._session.close()
+
+    def _next_id(self) -> int:
+        with self._id_lock:
+            self._id_count += 1
+            return self._id_count
+
+    def _record_latency(self, method: str, latency_seconds: float):
+        if self._latency_histograms is None:
+            return
+        with self._latency_histograms_lock:
+            histogram = self._latency_histograms.get(method)
+            if histogram is None:
+                histogram = self._latency_histograms[method] = LatencyHistogram()
+        histogram.record(latency_seconds)
 
+    def _jsonrpc_call(self, method, params, *, timeout=None):
         jsonrpc_data = {
             "jsonrpc": "2.0",
-            "id": self._id_count,
+            "id": self._next_id(),
             "method": method,
             "params": params,
         }
+        response, response_json = self._post(jsonrpc_data, timeout=timeout)
+        return self._get_result(response, response_json, jsonrpc_data)
+
+    def _post(self, jsonrpc_data, *, timeout=None):
         postdata = json.dumps(
             jsonrpc_data,
             cls=DecimalJSONEncoder,
         )
-        response = requests.post(
-            self._url,
-            data=postdata,
-            auth=self._auth,
-            headers={
-                "Content-Type": "application/json",
-            },
-        )
+        start = time.monotonic()
+        try:
+            response = self._session.post(
+                self._url,
+                data=postdata,
+                auth=self._auth,
+                headers={
+                    "Content-Type": "application/json",
+                },
+                timeout=self.timeout if timeout is None else timeout,
+            )
+        finally:
+            self._record_latency(
+                "batch" if isinstance(jsonrpc_data, list) else jsonrpc_data["method"],
+                time.monotonic() - start,
+            )
 
         # Don't raise here, we want sane error messages
         # try:
@@ -109,8 +249,11 @@ class BitcoinRPC:
                 response=response,
                 jsonrpc_data=jsonrpc_data,
             ) from e
+        return response, response_json
+
+    def _get_result(self, response, response_json, jsonrpc_data, *, check_http_status=True):
         error = response_json.get("error")
-        if error is not None or not response.ok:
+        if error is not None or (check_http_status and not response.ok):
             if isinstance(error, dict):
                 raise JSONRPCError(
                     message=error["message"],
@@ -161,4 +304,8 @@ class DecimalJSONEncoder(json.JSONEncoder):
 def bitcoin_rpc_factory(container: Container):
     config = container.get(interface=Config)
 
-    return BitcoinRPC(config.btc_rpc_url)
+    # The bridges share the connection pool of this client (see wire_rune_bridge_from_environ)
+    return BitcoinRPC(
+        config.btc_rpc_url,
+        pool_size=config.btc_rpc_pool_size,
+    )
@@ -0,0 +1,112 @@
+import logging
+from collections.abc import Sequence
+from typing import Any
+
+from eth_abi.exceptions import DecodingError
+from eth_typing import ChecksumAddress
+from web3 import Web3
+from web3._utils.abi import get_abi_output_types, map_abi_data
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3.contract.contract import ContractFunction
+from web3.exceptions import BadFunctionCallOutput, ContractLogicError
+from web3.types import BlockIdentifier
+
+from .utils import load_abi
+
+logger = logging.getLogger(__name__)
+
+
+class MulticallError(Exception):
+    pass
+
+
+class Multicall:
+    """
+    Executes many read-only contract calls in one eth_call, using a Multicall3 contract.
+
+    All the calls see the state of the same block. Without a Multicall3 address, the calls are made one by one,
+    so that callers don't have to care whether the chain has the contract or not.
+    """
+
+    def __init__(
+        self,
+        *,
+        web3: Web3,
+        address: ChecksumAddress | str | None,
+        max_calls_per_request: int = 500,
+    ):
+        self.web3 = web3
+        self.max_calls_per_request = max_calls_per_request
+        if address:
+            self.contract = web3.eth.contract(
+                address=address,
+                abi=load_abi("Multicall3"),
+            )
+        else:
+            self.contract = None
+
+    def call(
+        self,
+        functions: Sequence[ContractFunction],
+        *,
+        block_identifier: BlockIdentifier | None = None,
+    ) -> list[Any]:
+        """
+        Call all `functions` and return their results (like `function.call()`). Raises if any of the calls fail.
+        """
+        results = []
+        for function, (success, result) in zip(
+            functions,
+            self.try_call(functions, block_identifier=block_identifier),
+            strict=True,
+        ):
+            if not success:
+                raise MulticallError(f"Call to {function.fn_name} at {function.address} failed")
+            results.append(result)
+        return results
+
+    def try_call(
+        self,
+        functions: Sequence[ContractFunction],
+        *,
+        block_identifier: BlockIdentifier | None = None,
+    ) -> list[tuple[bool, Any]]:
+        """
+        Call all `functions` and return (success, result) for each of them. The result of a failed call is None.
+        """
+        if not functions:
+            return []
+        if self.contract is None:
+            return [self._call_one(function, block_identifier) for function in functions]
+
+        results = []
+        for i in range(0, len(functions), self.max_calls_per_request):
+            batch = functions[i : i + self.max_calls_per_request]
+            call_results = self.contract.functions.aggregate3(
+                [(function.address, True, function._encode_transaction_data()) for function in batch]
+            ).call(block_identifier=block_identifier)
+            for function, (success, return_data) in zip(batch, call_results, strict=True):
+                if success:
+                    try:
+                        results.append((True, self._decode_output(function, return_data)))
+                        continue
+                    except DecodingError:
+                        # E.g. the target is not a contract
+                        logger.debug("Invalid output from %s at %s", function.fn_name, function.address)
+                results.append((False, None))
+        return results
+
+    def _call_one(self, function: ContractFunction, block_identifier: BlockIdentifier | None) -> tuple[bool, Any]:
+        try:
+            return True, function.call(block_identifier=block_identifier)
+        except (ContractLogicError, BadFunctionCallOutput):
+            return False, None
+
+    def _decode_output(self, function: ContractFunction, return_data: bytes) -> Any:
+        # Same as in web3.contract.utils.call_contract_function
+        output_types = get_abi_output_types(function.abi)
+        output_data = self.web3.codec.decode(output_types, return_data)
+        normalized_data = map_abi_data(BASE_RETURN_NORMALIZERS, output_types, output_data)
+        if len(normalized_data) == 1:
+            return normalized_data[0]
+        return normalized_data
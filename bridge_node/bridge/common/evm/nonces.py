@@ -0,0 +1,156 @@
+import logging
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from anemic.ioc import Container, service
+from web3 import Web3
+from web3.types import TxParams
+
+from .account import Account
+from .utils import from_wei
+
+logger = logging.getLogger(__name__)
+
+
+# RSK has a hard limit of 4 transactions in mempool per address -- just use this for all chains for now
+DEFAULT_MAX_PENDING_TRANSACTIONS = 4
+
+
+class NonceManager:
+    """
+    Assigns nonces (and gas prices) to transactions sent from a single EVM account.
+
+    Nonces are assigned locally, so transactions can be sent back-to-back without querying the node for each one.
+    The gas price and the balance of the account are cached too. The state is synced with the node lazily:
+    on first use, after `refresh()` (which should be called once per iteration), and after a transaction
+    has failed to send. The number of pending transactions of the account is limited to `max_pending_transactions`.
+
+    Usage:
+
+        with nonce_manager.transaction_params(gas_limit=100_000) as tx_params:
+            tx_hash = contract.functions.foo().transact(tx_params)
+    """
+
+    def __init__(
+        self,
+        *,
+        web3: Web3,
+        address: str,
+        max_pending_transactions: int = DEFAULT_MAX_PENDING_TRANSACTIONS,
+        min_balance_multiplier: float = 1.2,
+    ):
+        self.web3 = web3
+        self.address = address
+        self.max_pending_transactions = max_pending_transactions
+        self.min_balance_multiplier = min_balance_multiplier
+        self._lock = threading.Lock()
+        self._reset()
+
+    def refresh(self):
+        """
+        Forget the cached state, so that it's synced with the node on next use.
+        """
+        with self._lock:
+            self._reset()
+
+    def check_balance(self, *, gas_limit: int):
+        """
+        Check that the account can afford to send transactions with a total gas limit of `gas_limit`, e.g. a batch
+        of transactions that should be sent all or nothing.
+
+        Raises RuntimeError if the account balance is insufficient.
+        """
+        with self._lock:
+            self._check_balance(gas_limit=gas_limit, gas_price=self._get_gas_price())
+
+    @contextmanager
+    def transaction_params(self, *, gas_limit: int, limit_pending: bool = True) -> Iterator[TxParams]:
+        """
+        Reserve the next nonce for a transaction and yield the params to send it with.
+
+        The transaction should be sent inside the with block, which holds the nonce manager for its duration.
+        If the block raises, the nonce is not used up and the state is synced with the node before the next
+        transaction.
+
+        Raises RuntimeError if the account balance is insufficient or there are too many pending transactions
+        (unless `limit_pending` is False).
+        """
+        with self._lock:
+            gas_price = self._get_gas_price()
+            self._check_balance(gas_limit=gas_limit, gas_price=gas_price)
+
+            nonce = self._get_next_nonce()
+            num_pending_transactions = nonce - self._confirmed_nonce
+            if limit_pending and num_pending_transactions >= self.max_pending_transactions:
+                # Some of them might have been mined since we last checked
+                self._confirmed_nonce = self._get_transaction_count("latest")
+                num_pending_transactions = nonce - self._confirmed_nonce
+            # Raising an exception here is fine, transactions will just be resumed
+            if limit_pending and num_pending_transactions >= self.max_pending_transactions:
+                raise RuntimeError(
+                    f"We have {num_pending_transactions} pending transactions, "
+                    f"which is at least the maximum of {self.max_pending_transactions}. Trying again later.",
+                )
+
+            try:
+                yield {
+                    "gas": gas_limit,
+                    "gasPrice": gas_price,
+                    "nonce": nonce,
+                }
+            except Exception:
+                logger.info("Sending transaction with nonce %s failed, syncing with the node on next use", nonce)
+                self._reset()
+                raise
+
+            self._next_nonce = nonce + 1
+            self._spent_wei += gas_limit * gas_price
+
+    def _check_balance(self, *, gas_limit: int, gas_price: int):
+        available_balance_wei = self._get_balance() - self._spent_wei
+        min_balance_wei = int(self.min_balance_multiplier * gas_limit * gas_price)
+        if available_balance_wei < min_balance_wei:
+            raise RuntimeError(
+                f"Insufficient balance in EVM account {self.address} "
+                f"({from_wei(available_balance_wei)} < {from_wei(min_balance_wei)}) -- cannot send transaction"
+            )
+
+    def _reset(self):
+        self._gas_price: int | None = None
+        self._balance_wei: int | None = None
+        self._spent_wei = 0
+        self._next_nonce: int | None = None
+        self._confirmed_nonce = 0
+
+    def _get_gas_price(self) -> int:
+        if self._gas_price is None:
+            self._gas_price = self.web3.eth.gas_price
+        return self._gas_price
+
+    def _get_balance(self) -> int:
+        if self._balance_wei is None:
+            self._balance_wei = self.web3.eth.get_balance(
+                self.address,
+                block_identifier="pending",
+            )
+        return self._balance_wei
+
+    def _get_next_nonce(self) -> int:
+        if self._next_nonce is None:
+            self._next_nonce = self._get_transaction_count("pending")
+            self._confirmed_nonce = self._get_transaction_count("latest")
+        return self._next_nonce
+
+    def _get_transaction_count(self, block_identifier: str) -> int:
+        return self.web3.eth.get_transaction_count(
+            self.address,
+            block_identifier=block_identifier,
+        )
+
+
+@service(interface_override=NonceManager, scope="global")
+def nonce_manager_factory(container: Container):
+    web3 = container.get(interface=Web3)
+    account = container.get(interface=Account)
+    return NonceManager(web3=web3, address=account.address)
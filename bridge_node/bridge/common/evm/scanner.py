@@ -6,7 +6,13 @@ from web3 import Web3
 from web3.contract.contract import ContractEvent
 from web3.types import EventData
 
-from bridge.common.evm.utils import get_events
+from bridge.common.evm.utils import (
+    BlockRangeWindow,
+    get_events,
+    get_logs_for_events,
+    get_multi_event_batch,
+    iter_log_batches_concurrently,
+)
 from bridge.common.services.key_value_store import KeyValueStore
 
 logger = logging.getLogger(__name__)
@@ -14,7 +20,22 @@ logger = logging.getLogger(__name__)
 
 class EvmEventScanner:
     """
-    Generic EVM event scanner
+    Generic EVM event scanner.
+
+    If all events belong to the same contract, and `single_query` is True (the default), the logs of all events
+    are fetched with a single eth_getLogs call per block range. Otherwise, each event is queried separately.
+
+    The block range size adapts to the provider, and the learned size is stored per chain in the key value store,
+    so that it's shared by all scanners of the same chain and survives restarts.
+
+    With `prefetch_concurrency` > 1, the scanner runs in pipelined mode: up to that many block ranges are fetched
+    in parallel, the callback is called separately for each range (in block order, skipping ranges without
+    events), and the last scanned block is updated after each range. This keeps memory bounded when catching up
+    after a long downtime.
+
+    `scan_new_events` can be limited to at most `max_blocks` blocks per call. Callers catching up on a long range
+    should call it repeatedly, each time in a new DB transaction, until it returns True, so that every chunk of
+    blocks is applied and checkpointed durably on its own.
     """
 
     def __init__(
@@ -28,8 +49,17 @@ class EvmEventScanner:
         key_value_store: KeyValueStore,
         key_value_store_namespace: str,
         default_start_block: int,
+        single_query: bool = True,
+        initial_block_range_size: int = 100,
+        max_block_range_size: int = 5_000,
+        prefetch_concurrency: int = 1,
+        chain_id: int | None = None,
     ):
         self._web3 = web3
+        # The chain id doesn't change, so don't ask for it on every scan (pass it in if it's already known)
+        if chain_id is None:
+            chain_id = web3.eth.chain_id
+        self._block_range_window_key = f"evm:{chain_id}:get-logs:block-range-size"
         self._dbsession = dbsession
         self._block_safety_margin = block_safety_margin
         self._key_value_store = key_value_store
@@ -38,8 +68,18 @@ class EvmEventScanner:
 
         self._events = events
         self._callback = callback
+        self._single_query = single_query and len({event.address for event in events}) == 1
+        self._initial_block_range_size = initial_block_range_size
+        self._max_block_range_size = max_block_range_size
+        self._prefetch_concurrency = prefetch_concurrency
+
+    def scan_new_events(self, *, max_blocks: int | None = None) -> bool:
+        """
+        Scan events from the last scanned block up to the safe head (or at most `max_blocks` blocks),
+        call the callback with them and update the last scanned block.
 
-    def scan_new_events(self):
+        Returns True if the scanner is caught up with the safe head, False if there are blocks left to scan.
+        """
         current_block = self._web3.eth.block_number
         last_scanned_block = self._key_value_store.get_value(
             self._last_scanned_block_key,
@@ -55,23 +95,75 @@ class EvmEventScanner:
                 current_block,
                 self._block_safety_margin,
             )
-            return []
+            return True
+
+        caught_up = True
+        if max_blocks is not None and to_block - from_block + 1 > max_blocks:
+            to_block = from_block + max_blocks - 1
+            caught_up = False
 
         logger.info("Scanning events from block %s to block %s", from_block, to_block)
 
-        # TODO: this can all be done in one web3 call, no need to query multiple times
-        all_event_logs = []
-        for event in self._events:
-            logger.debug("Fetching events for event: %s", event.event_name)
-            event_log_batch = get_events(
-                event=event,
+        block_range_window_key = self._block_range_window_key
+        window = BlockRangeWindow(
+            initial_size=self._key_value_store.get_value(
+                block_range_window_key,
+                default_value=self._initial_block_range_size,
+            ),
+            max_size=self._max_block_range_size,
+        )
+
+        if self._prefetch_concurrency > 1:
+            # Pipelined mode: feed the callback and checkpoint range by range, in block order
+            for _, chunk_to_block, event_logs in iter_log_batches_concurrently(
+                fetch_logs=self._fetch_logs,
                 from_block=from_block,
                 to_block=to_block,
+                window=window,
+                concurrency=self._prefetch_concurrency,
+            ):
+                if event_logs:
+                    self._callback(event_logs)
+                self._key_value_store.set_value(self._last_scanned_block_key, chunk_to_block)
+                self._key_value_store.set_value(block_range_window_key, window.size)
+            return caught_up
+
+        if self._single_query:
+            all_event_logs = get_logs_for_events(
+                events=self._events,
+                from_block=from_block,
+                to_block=to_block,
+                window=window,
             )
-            all_event_logs.extend(event_log_batch)
+        else:
+            all_event_logs = []
+            for event in self._events:
+                logger.debug("Fetching events for event: %s", event.event_name)
+                event_log_batch = get_events(
+                    event=event,
+                    from_block=from_block,
+                    to_block=to_block,
+                    window=window,
+                )
+                all_event_logs.extend(event_log_batch)
 
         all_event_logs.sort(key=lambda x: (x.blockNumber, x.transactionIndex, x.logIndex))
 
         self._callback(all_event_logs)
 
         self._key_value_store.set_value(self._last_scanned_block_key, to_block)
+        self._key_value_store.set_value(block_range_window_key, window.size)
+        return caught_up
+
+    def _fetch_logs(self, from_block: int, to_block: int) -> list[EventData]:
+        if self._single_query:
+            return get_multi_event_batch(
+                events=self._events,
+                from_block=from_block,
+                to_block=to_block,
+            )
+        event_logs = []
+        for event in self._events:
+            event_logs.extend(event.get_logs(fromBlock=from_block, toBlock=to_block))
+        event_logs.sort(key=lambda x: (x.blockNumber, x.transactionIndex, x.logIndex))
+        return event_logs
@@ -3,12 +3,18 @@ import logging
 import os
 import pathlib
 import time
+from collections import deque
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import eth_utils
+import requests
 from eth_account import Account as EthAccount
 from eth_account.account import LocalAccount
+from hexbytes import HexBytes
 from web3 import Web3
+from web3._utils.events import get_event_data
 from web3.contract.contract import ContractEvent
 from web3.gas_strategies.rpc import rpc_gas_price_strategy
 from web3.middleware import construct_sign_and_send_raw_middleware, geth_poa_middleware
@@ -55,60 +61,350 @@ def load_abi(name: str, abi_dir: str | pathlib.Path = ABI_DIR) -> list[dict[str,
         return json.load(f)
 
 
-def get_events(
+class BlockRangeWindow:
+    """
+    Adaptive block range size for eth_getLogs queries.
+
+    The window grows while responses are small and fast, and is halved when a response is slow, or when the
+    provider rejects the range (too many results, range too large) or times out. The learned size can be
+    persisted (e.g. per chain) and passed back in as `initial_size`.
+    """
+
+    NUM_SUCCESSES_TO_FORGET_REJECTION = 20
+
+    def __init__(
+        self,
+        *,
+        initial_size: int = 100,
+        min_size: int = 1,
+        max_size: int = 5_000,
+        target_max_results: int = 1_000,
+        target_max_seconds: float = 5.0,
+    ):
+        if not 1 <= min_size <= max_size:
+            raise ValueError(f"invalid window bounds: min_size={min_size}, max_size={max_size}")
+        self.min_size = min_size
+        self.max_size = max_size
+        self.target_max_results = target_max_results
+        self.target_max_seconds = target_max_seconds
+        self.size = max(min(initial_size, max_size), min_size)
+        # After a rejection, don't grow back to the rejected size until there have been enough successes
+        self._rejected_size: int | None = None
+        self._num_successes_since_rejection = 0
+
+    def record_success(self, *, num_blocks: int, num_results: int, elapsed_seconds: float):
+        if self._rejected_size is not None:
+            self._num_successes_since_rejection += 1
+            if self._num_successes_since_rejection >= self.NUM_SUCCESSES_TO_FORGET_REJECTION:
+                self._rejected_size = None
+
+        if elapsed_seconds > self.target_max_seconds or num_results > self.target_max_results:
+            self._set_size(self.size // 2)
+        elif (
+            num_blocks >= self.size
+            and elapsed_seconds <= self.target_max_seconds / 2
+            and num_results <= self.target_max_results / 2
+        ):
+            new_size = self.size * 2
+            if self._rejected_size is not None:
+                new_size = min(new_size, self._rejected_size - 1)
+            self._set_size(new_size)
+
+    def shrink(self) -> bool:
+        """
+        Halve the window after the provider rejected the range. Returns False if the window is already at
+        its minimum size.
+        """
+        if self.size <= self.min_size:
+            return False
+        self._rejected_size = self.size
+        self._num_successes_since_rejection = 0
+        self._set_size(self.size // 2)
+        return True
+
+    def copy(self) -> "BlockRangeWindow":
+        return BlockRangeWindow(
+            initial_size=self.size,
+            min_size=self.min_size,
+            max_size=self.max_size,
+            target_max_results=self.target_max_results,
+            target_max_seconds=self.target_max_seconds,
+        )
+
+    def _set_size(self, size: int):
+        size = max(min(size, self.max_size), self.min_size)
+        if size != self.size:
+            logger.info("Changing eth_getLogs block range size from %s to %s", self.size, size)
+            self.size = size
+
+
+# Error messages of various providers for eth_getLogs queries that return too many results or span too many blocks
+_BLOCK_RANGE_TOO_LARGE_ERROR_MESSAGES = (
+    "query returned more than",  # geth, Infura, RSK: "query returned more than 10000 results"
+    "log response size exceeded",  # Alchemy
+    "block range is too wide",  # Ankr
+    "exceed maximum block range",  # BSC: "exceed maximum block range: 5000"
+    "block range too large",
+    "block range limit exceeded",  # Chainstack
+    "eth_getlogs is limited to",  # QuickNode: "eth_getLogs is limited to a 10,000 range"
+)
+# JSON-RPC "limit exceeded" (EIP-1474)
+_BLOCK_RANGE_TOO_LARGE_ERROR_CODES = (-32005,)
+
+
+def is_block_range_too_large_error(error: Exception) -> bool:
+    """
+    Return True if the provider rejected an eth_getLogs query because the block range (or its result) was too
+    large, or if the request timed out, meaning that the query should be retried with a smaller block range.
+    """
+    if isinstance(error, requests.Timeout):
+        return True
+    # web3 raises ValueError with the JSON-RPC error object as the argument
+    rpc_error = error.args[0] if error.args else None
+    if isinstance(rpc_error, dict):
+        if rpc_error.get("code") in _BLOCK_RANGE_TOO_LARGE_ERROR_CODES:
+            return True
+        message = str(rpc_error.get("message", ""))
+    else:
+        message = str(error)
+    message = message.lower()
+    return any(m in message for m in _BLOCK_RANGE_TOO_LARGE_ERROR_MESSAGES)
+
+
+def iter_log_batches(
     *,
-    event: ContractEvent,
+    fetch_logs: Callable[[int, int], list[EventData]],
     from_block: int,
     to_block: int,
-    batch_size: int = 100,
-    argument_filters=None,
-) -> list[EventData]:
-    """Load events in batches"""
+    window: BlockRangeWindow,
+    retries: int = 10,
+    max_retry_sleep_seconds: float = 30.0,
+) -> Iterator[tuple[int, int, list[EventData]]]:
+    """
+    Call `fetch_logs(batch_from_block, batch_to_block)` for consecutive block ranges sized by `window`, and yield
+    (batch_from_block, batch_to_block, logs) for each range.
+
+    Ranges rejected by the provider are split by shrinking the window. Other errors are retried up to `retries`
+    times per range, with exponential backoff.
+    """
     if to_block < from_block:
         raise ValueError(f"to_block {to_block} is smaller than from_block {from_block}")
 
-    logger.debug("Fetching events from %s to %s with batch size %s", from_block, to_block, batch_size)
-    ret = []
     batch_from_block = from_block
+    attempt = 0
     while batch_from_block <= to_block:
-        batch_to_block = min(batch_from_block + batch_size, to_block)
+        batch_to_block = min(batch_from_block + window.size - 1, to_block)
         # Let's keep this as info instead of debug, because it's nice to see the progress
         logger.info("Fetching batch from %s to %s (up to %s)", batch_from_block, batch_to_block, to_block)
+        start = time.monotonic()
+        try:
+            logs = fetch_logs(batch_from_block, batch_to_block)
+        except Exception as e:
+            if is_block_range_too_large_error(e) and window.shrink():
+                logger.warning("error fetching logs (%s), retrying with a smaller block range", e)
+                continue
+            if attempt >= retries:
+                raise e
+            logger.warning("error fetching logs: %s, retrying (%s/%s)", e, attempt + 1, retries)
+            exponential_sleep(attempt, max_sleep_time=max_retry_sleep_seconds)
+            attempt += 1
+            continue
+        attempt = 0
+        window.record_success(
+            num_blocks=batch_to_block - batch_from_block + 1,
+            num_results=len(logs),
+            elapsed_seconds=time.monotonic() - start,
+        )
+        if len(logs) > 0:
+            logger.info("Found %s events in batch", len(logs))
+        yield batch_from_block, batch_to_block, logs
+        batch_from_block = batch_to_block + 1
 
-        events = get_event_batch_with_retries(
-            event=event,
-            from_block=batch_from_block,
-            to_block=batch_to_block,
-            argument_filters=argument_filters,
+
+def iter_log_batches_concurrently(
+    *,
+    fetch_logs: Callable[[int, int], list[EventData]],
+    from_block: int,
+    to_block: int,
+    window: BlockRangeWindow,
+    concurrency: int,
+    retries: int = 10,
+) -> Iterator[tuple[int, int, list[EventData]]]:
+    """
+    Like `iter_log_batches`, but prefetch up to `concurrency` consecutive block ranges in parallel.
+
+    Ranges are still yielded in strict block order, and at most `concurrency` ranges are fetched or buffered at
+    any time, so memory stays bounded no matter how far behind `from_block` is. Each range is fetched with its own
+    copy of `window` (so rejected ranges are split independently), and `window` follows the size learned by the
+    latest yielded range.
+    """
+    if concurrency <= 1:
+        yield from iter_log_batches(
+            fetch_logs=fetch_logs,
+            from_block=from_block,
+            to_block=to_block,
+            window=window,
+            retries=retries,
         )
-        if len(events) > 0:
-            logger.info("Found %s events in batch", len(events))
+        return
+
+    if to_block < from_block:
+        raise ValueError(f"to_block {to_block} is smaller than from_block {from_block}")
+
+    def fetch_range(range_from_block: int, range_to_block: int, range_window: BlockRangeWindow):
+        ret = []
+        for _, _, logs in iter_log_batches(
+            fetch_logs=fetch_logs,
+            from_block=range_from_block,
+            to_block=range_to_block,
+            window=range_window,
+            retries=retries,
+        ):
+            ret.extend(logs)
+        return ret
+
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="evm-logs")
+    try:
+        pending = deque()
+        next_from_block = from_block
+        while pending or next_from_block <= to_block:
+            while len(pending) < concurrency and next_from_block <= to_block:
+                range_to_block = min(next_from_block + window.size - 1, to_block)
+                range_window = window.copy()
+                future = executor.submit(fetch_range, next_from_block, range_to_block, range_window)
+                pending.append((next_from_block, range_to_block, range_window, future))
+                next_from_block = range_to_block + 1
+
+            range_from_block, range_to_block, range_window, future = pending.popleft()
+            logs = future.result()
+            window.size = range_window.size
+            yield range_from_block, range_to_block, logs
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def get_events(
+    *,
+    event: ContractEvent,
+    from_block: int,
+    to_block: int,
+    batch_size: int = 100,
+    argument_filters=None,
+    window: BlockRangeWindow | None = None,
+) -> list[EventData]:
+    """
+    Load events in batches. The batch size adapts to the provider, starting from `batch_size`
+    (or the size of the given `window`).
+    """
+    if window is None:
+        window = BlockRangeWindow(initial_size=batch_size)
+
+    logger.debug("Fetching events from %s to %s with batch size %s", from_block, to_block, window.size)
+    ret = []
+    for _, _, events in iter_log_batches(
+        fetch_logs=lambda batch_from_block, batch_to_block: event.get_logs(
+            fromBlock=batch_from_block,
+            toBlock=batch_to_block,
+            argument_filters=argument_filters,
+        ),
+        from_block=from_block,
+        to_block=to_block,
+        window=window,
+    ):
         ret.extend(events)
-        batch_from_block = batch_to_block + 1
     logger.debug("Found %s events in total", len(ret))
     return ret
 
 
-def get_event_batch_with_retries(
-    event: ContractEvent,
+def get_logs_for_events(
+    *,
+    events: Sequence[ContractEvent],
     from_block: int,
     to_block: int,
-    *,
-    argument_filters=None,
-    retries=10,
-):
-    while True:
-        try:
-            return event.get_logs(
-                fromBlock=from_block,
-                toBlock=to_block,
-                argument_filters=argument_filters,
-            )
-        except Exception as e:
-            if retries <= 0:
-                raise e
-            logger.warning("error in get_all_entries: %s, retrying (%s)", e, retries)
-            retries -= 1
+    batch_size: int = 100,
+    window: BlockRangeWindow | None = None,
+) -> list[EventData]:
+    """
+    Load logs of multiple events of the same contract in batches, with a single eth_getLogs call per batch
+    (filtering by the contract address and an OR-list of the event topics). The returned events are sorted
+    by their position in the chain.
+    """
+    if window is None:
+        window = BlockRangeWindow(initial_size=batch_size)
+    if not events:
+        return []
+    # Validate before fetching anything, so that invalid input is not retried
+    _get_address_and_event_abis_by_topic(events)
+
+    logger.debug("Fetching events from %s to %s with batch size %s", from_block, to_block, window.size)
+    ret = []
+    for _, _, batch_events in iter_log_batches(
+        fetch_logs=lambda batch_from_block, batch_to_block: get_multi_event_batch(
+            events=events,
+            from_block=batch_from_block,
+            to_block=batch_to_block,
+        ),
+        from_block=from_block,
+        to_block=to_block,
+        window=window,
+    ):
+        ret.extend(batch_events)
+    logger.debug("Found %s events in total", len(ret))
+    return ret
+
+
+def get_multi_event_batch(
+    events: Sequence[ContractEvent],
+    from_block: int,
+    to_block: int,
+) -> list[EventData]:
+    """
+    Get the logs of all `events` in the block range with one eth_getLogs call and decode each log with the ABI
+    of the matching event. All events must be (non-anonymous) events of the same contract.
+    """
+    if not events:
+        return []
+    address, event_abis_by_topic = _get_address_and_event_abis_by_topic(events)
+
+    w3 = events[0].w3
+    logs = w3.eth.get_logs(
+        {
+            "address": address,
+            "fromBlock": from_block,
+            "toBlock": to_block,
+            "topics": [[Web3.to_hex(topic) for topic in event_abis_by_topic]],
+        }
+    )
+    ret = []
+    for log in logs:
+        if not log["topics"]:
+            continue
+        event_abi = event_abis_by_topic.get(HexBytes(log["topics"][0]))
+        if event_abi is None:
+            # The node should filter these out, but let's not trust it blindly
+            logger.warning("Got a log with an unexpected topic: %s", log)
+            continue
+        ret.append(get_event_data(w3.codec, event_abi, log))
+    ret.sort(key=lambda e: (e["blockNumber"], e["transactionIndex"], e["logIndex"]))
+    return ret
+
+
+def _get_address_and_event_abis_by_topic(
+    events: Sequence[ContractEvent],
+) -> tuple[str, dict[HexBytes, dict[str, Any]]]:
+    addresses = {event.address for event in events}
+    if len(addresses) != 1:
+        raise ValueError(f"All events must belong to the same contract, got addresses {addresses}")
+    (address,) = addresses
+
+    event_abis_by_topic = {}
+    for event in events:
+        event_abi = event._get_event_abi()
+        if event_abi.get("anonymous"):
+            raise ValueError(f"Anonymous event {event.event_name} cannot be fetched by topic")
+        event_abis_by_topic[HexBytes(eth_utils.event_abi_to_log_topic(event_abi))] = event_abi
+
+    return address, event_abis_by_topic
 
 
 def exponential_sleep(attempt, max_sleep_time=256.0):
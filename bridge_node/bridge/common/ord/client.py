@@ -1,7 +1,15 @@
+import time
 from typing import Any, TypedDict
 
 import requests
 
+from ..utils.http import (
+    RequestCounter,
+    Timeout,
+    create_http_session,
+    get_connection_pool_stats,
+)
+
 
 class OrdApiError(Exception):
     response: requests.Response
@@ -98,20 +106,63 @@ class OutputResponse(TypedDict):
 
 
 class OrdApiClient:
-    def __init__(self, base_url):
+    """
+    Client for the ord server JSON API.
+
+    Requests go through a keep-alive connection pool, so one client instance should be shared by everything that
+    talks to the same ord server (OrdOutputCache, RuneBridgeService, SimpleOrdWallet...).
+    """
+
+    def __init__(
+        self,
+        base_url,
+        *,
+        pool_size: int = 10,
+        timeout: Timeout = (5.0, 30.0),
+        max_retries: int = 3,
+        retry_backoff_factor: float = 0.5,
+    ):
         self.base_url = base_url
+        self.timeout = timeout
+        self._session = create_http_session(
+            pool_size=pool_size,
+            max_retries=max_retries,
+            backoff_factor=retry_backoff_factor,
+        )
+        self._request_counter = RequestCounter()
 
     def request(self, method, url, **kwargs):
         headers = kwargs.setdefault("headers", {})
         headers["Content-Type"] = "application/json"
         headers["Accept"] = "application/json"
-        resp = requests.request(method, f"{self.base_url}{url}", **kwargs)
+        kwargs.setdefault("timeout", self.timeout)
+        start = time.monotonic()
+        try:
+            resp = self._session.request(method, f"{self.base_url}{url}", **kwargs)
+        except requests.RequestException:
+            self._request_counter.record(time.monotonic() - start, error=True)
+            raise
+        self._request_counter.record(time.monotonic() - start, error=not resp.ok)
         if not resp.ok:
             if resp.status_code == 404:
                 raise OrdApiNotFound(resp)
             raise OrdApiError(resp)
         return resp.json()
 
+    def get_stats(self) -> dict[str, float | int]:
+        """
+        Get request counts and latencies, and the number of reused keep-alive connections
+        """
+        pool_stats = get_connection_pool_stats(self._session)
+        return {
+            **self._request_counter.as_dict(),
+            "num_connections": pool_stats.num_connections,
+            "num_reused_connections": pool_stats.num_reused_connections,
+        }
+
+    def close(self):
+        self._session.close()
+
     def get(self, url, **kwargs):
         return self.request("GET", url, **kwargs)
 
@@ -1,7 +1,11 @@
 import binascii
+import contextvars
+import functools
 import logging
 import time
 from collections import defaultdict
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 
 import pyord
@@ -11,7 +15,10 @@ from bitcointx.core import (
     CTxOut,
 )
 from bitcointx.core.key import (
-    BIP32PathTemplate,
+    BIP32_HARDENED_KEY_OFFSET,
+    BIP32Path,
+    CKey,
+    KeyDerivationInfo,
     KeyStore,
 )
 from bitcointx.core.psbt import (
@@ -36,9 +43,10 @@ from ..btc.multisig_utils import (
     estimate_p2wsh_multisig_tx_virtual_size,
     parse_p2wsh_multisig_utxo_descriptor,
 )
-from ..btc.rpc import BitcoinRPC
+from ..btc.rpc import LONG_RUNNING_CALL_TIMEOUT, BitcoinRPC
 from ..btc.types import UTXO
 from ..btc.utils import encode_segwit_address
+from ..utils.http import Timeout
 from .client import OrdApiClient
 from .transfers import (
     TARGET_POSTAGE_SAT,
@@ -81,6 +89,8 @@ class OrdMultisig:
         ord_client: OrdApiClient,
         btc_wallet_name: str | None = None,  # optional bitcoin wallet name for testing
         min_non_change_rune_utxo_confirmations: int = 1,
+        redeem_script_cache_size: int = 4096,
+        psbt_signing_concurrency: int = 1,
     ):
         _xprv = CCoinExtKey(master_xpriv)
         self._get_master_xpriv = lambda: _xprv
@@ -95,7 +105,14 @@ class OrdMultisig:
             raise ValueError("base_derivation_path must start with 'm'")
         self._base_derivation_path = base_derivation_path
         self._ranged_derivation_path = base_derivation_path + "/*"
+        self._base_path_indexes = tuple(BIP32Path(base_derivation_path))
+        self._master_fingerprint = _xprv.fingerprint
+        _base_xprv = _xprv.derive_path(base_derivation_path)
+        self._get_base_xpriv = lambda: _base_xprv
         # self._key_derivation_path = base_derivation_path + '/0'
+        # The base path is the same for all addresses, so only derive it once
+        self._base_xpubs = [xpub.derive_path(base_derivation_path) for xpub in self._master_xpubs]
+        self._derive_redeem_script = functools.lru_cache(redeem_script_cache_size)(self._compute_redeem_script)
 
         self._multisig_redeem_script = self._derive_redeem_script(0)
         self._multisig_script = P2WSHBitcoinAddress.from_redeemScript(self._multisig_redeem_script)
@@ -110,6 +127,7 @@ class OrdMultisig:
 
         self._btc_wallet_name = btc_wallet_name
         self._min_non_change_rune_utxo_confirmations = min_non_change_rune_utxo_confirmations
+        self._psbt_signing_concurrency = psbt_signing_concurrency
 
     @property
     def name(self) -> str:
@@ -172,7 +190,9 @@ class OrdMultisig:
         *,
         timestamp="now",
         desc_range: int | tuple[int, int],
+        timeout: Timeout = LONG_RUNNING_CALL_TIMEOUT,
     ):
+        # Importing with an old timestamp rescans the chain, which takes longer than the default RPC timeout
         response = self._bitcoin_rpc.call(
             "importdescriptors",
             [
@@ -184,6 +204,7 @@ class OrdMultisig:
                     "range": desc_range,
                 }
             ],
+            timeout=timeout,
         )
         for result in response:
             if not result.get("success"):
@@ -328,30 +349,15 @@ class OrdMultisig:
         required_rune_amounts = dict(required_rune_amounts)  # no defaultdict anymore
         input_amount_sat = 0
 
-        def add_psbt_input(utxo: UTXO):
-            input_tx_response = self._bitcoin_rpc.gettransaction(utxo.txid, True)
-            input_tx = CTransaction.stream_deserialize(
-                BytesIO(binascii.unhexlify(input_tx_response["hex"])),
-            )
+        selected_utxos: list[UTXO] = []
 
+        def select_utxo(utxo: UTXO):
             parsed_descriptor = parse_p2wsh_multisig_utxo_descriptor(utxo.desc)
             if self._get_master_xpriv().fingerprint not in parsed_descriptor.master_fingerprints:
                 # This should essentially never happen unless other descriptors are imported
                 # to the wallet
                 raise ValueError("UTXO doesn't belong to this multisig (master fingerprint not found)")
-
-            psbt.add_input(
-                txin=CTxIn(
-                    prevout=utxo.outpoint,
-                ),
-                inp=PSBT_Input(
-                    # witness_script=self._multisig_redeem_script,
-                    witness_script=utxo.witness_script,
-                    utxo=input_tx.vout[utxo.vout],
-                    force_witness_utxo=True,
-                    derivation_map=parsed_descriptor.derivation_map,
-                ),
-            )
+            selected_utxos.append(utxo)
 
         # Coin selection for runes
         for utxo in utxos:
@@ -397,7 +403,7 @@ class OrdMultisig:
                 required_rune_amounts[rune] -= utxo_balance
 
             logger.debug("Adding input %s (funding Runes)", utxo)
-            add_psbt_input(utxo)
+            select_utxo(utxo)
 
             if all(v <= 0 for v in required_rune_amounts.values()):
                 # We have enough runes
@@ -422,7 +428,7 @@ class OrdMultisig:
 
         while True:
             tx_size_vbyte = estimate_p2wsh_multisig_tx_virtual_size(
-                vin=psbt.unsigned_tx.vin,
+                vin=[CTxIn(prevout=utxo.outpoint) for utxo in selected_utxos],
                 vout=psbt.unsigned_tx.vout,
                 num_signatures=self._num_required_signers,
                 redeem_script=self._multisig_redeem_script,
@@ -457,13 +463,37 @@ class OrdMultisig:
             # Add input
             logger.debug("Adding input %s (funding TX fee)", utxo)
             input_amount_sat += utxo.amount_satoshi
-            add_psbt_input(utxo)
+            select_utxo(utxo)
 
             # Loop from the start
 
-        if len(psbt.inputs) > max_num_inputs:
+        if len(selected_utxos) > max_num_inputs:
             raise RuntimeError(
-                f"Number of inputs in PSBT {len(psbt.inputs)} exceeds the maximum {max_num_inputs}",
+                f"Number of inputs in PSBT {len(selected_utxos)} exceeds the maximum {max_num_inputs}",
+            )
+
+        # Fetch all input transactions with a single batch request instead of one request per input
+        input_txids = list(dict.fromkeys(utxo.txid for utxo in selected_utxos))
+        input_tx_responses = self._bitcoin_rpc.call_many([("gettransaction", (txid, True)) for txid in input_txids])
+        input_txs = {
+            txid: CTransaction.stream_deserialize(
+                BytesIO(binascii.unhexlify(input_tx_response["hex"])),
+            )
+            for txid, input_tx_response in zip(input_txids, input_tx_responses, strict=True)
+        }
+        for utxo in selected_utxos:
+            parsed_descriptor = parse_p2wsh_multisig_utxo_descriptor(utxo.desc)
+            psbt.add_input(
+                txin=CTxIn(
+                    prevout=utxo.outpoint,
+                ),
+                inp=PSBT_Input(
+                    # witness_script=self._multisig_redeem_script,
+                    witness_script=utxo.witness_script,
+                    utxo=input_txs[utxo.txid].vout[utxo.vout],
+                    force_witness_utxo=True,
+                    derivation_map=parsed_descriptor.derivation_map,
+                ),
             )
 
         # Assuming we got here, TX is funded properly.
@@ -484,18 +514,37 @@ class OrdMultisig:
 
     # TODO: add rune-PSBT-specific logic and methods, maybe
 
-    def sign_psbt(self, psbt: PSBT, *, finalize: bool = False) -> PSBT:
+    def sign_psbt(self, psbt: PSBT, *, finalize: bool = False, max_workers: int | None = None) -> PSBT:
+        """
+        Sign all inputs of the PSBT.
+
+        With `max_workers` (default: `psbt_signing_concurrency`) > 1, the inputs are signed in parallel threads.
+        Only the secp256k1 calls run without the GIL, so how much this helps depends on the machine
+        (see tests/common/ord/benchmark_psbt_signing.py). The result is the same either way.
+        """
         # Keystore works as long as the derivation infos are set for each PSBT input
         psbt = psbt.clone()
-        keystore = KeyStore.from_iterable(
-            [
-                self._get_master_xpriv(),
-            ],
-            default_path_template=BIP32PathTemplate(self._ranged_derivation_path),
-            require_path_templates=True,
-        )
-        result = psbt.sign(keystore, finalize=finalize)
-        assert result.num_inputs_signed == len(psbt.inputs)
+        keystore = KeyStore(external_privkey_lookup=self._lookup_privkey)
+        if max_workers is None:
+            max_workers = self._psbt_signing_concurrency
+        max_workers = min(max_workers, len(psbt.inputs))
+        if max_workers <= 1:
+            result = psbt.sign(keystore, finalize=finalize)
+            assert result.num_inputs_signed == len(psbt.inputs)
+            return psbt
+
+        # Same as PSBT.sign, but each input is signed in its own task. Each task only modifies its own input
+        unsigned_tx = psbt.unsigned_tx
+
+        def sign_input(inp: PSBT_Input, context: contextvars.Context):
+            return context.run(inp.sign, unsigned_tx, keystore, finalize=finalize)
+
+        # bitcointx keeps the chain params in contextvars, which are not inherited by the worker threads
+        contexts = [contextvars.copy_context() for _ in psbt.inputs]
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="psbt-sign") as executor:
+            sign_infos = list(executor.map(sign_input, psbt.inputs, contexts))
+        num_inputs_signed = sum(1 for info in sign_infos if info and info.num_new_sigs)
+        assert num_inputs_signed == len(psbt.inputs)
         return psbt
 
         # Alternatively, we could use walletprocesspsbt, which works as long
@@ -507,6 +556,22 @@ class OrdMultisig:
         #     signed_psbt = self.finalize_psbt(signed_psbt)
         # return signed_psbt
 
+    def _lookup_privkey(self, key_id: bytes, derivation: KeyDerivationInfo | None) -> CKey | None:
+        # Only allow keys at <base_derivation_path>/<non-hardened index>, like a KeyStore with the master key and
+        # the path template <base_derivation_path>/* would. Deriving from the base key instead of the master key
+        # saves all but one of the key derivations per input.
+        if derivation is None or derivation.master_fp != self._master_fingerprint:
+            return None
+        indexes = tuple(derivation.path)
+        if len(indexes) != len(self._base_path_indexes) + 1 or indexes[:-1] != self._base_path_indexes:
+            return None
+        if indexes[-1] >= BIP32_HARDENED_KEY_OFFSET:
+            return None
+        privkey = self._get_base_xpriv().derive(indexes[-1]).priv
+        if privkey.pub.key_id != key_id:
+            return None
+        return privkey
+
     def combine_and_finalize_psbt(
         self,
         *,
@@ -547,6 +612,19 @@ class OrdMultisig:
         p2wsh = P2WSHBitcoinAddress.from_redeemScript(redeem_script)
         return encode_segwit_address(p2wsh)
 
+    def derive_addresses(self, indices: Iterable[int]) -> list[str]:
+        """
+        Derive the addresses for many indices at once, e.g. `derive_addresses(range(100, 200))`.
+
+        The redeem scripts are not cached, so that pre-generating large ranges doesn't evict the cache.
+        """
+        return [
+            encode_segwit_address(
+                P2WSHBitcoinAddress.from_redeemScript(self._compute_redeem_script(index)),
+            )
+            for index in indices
+        ]
+
     # Helpers for PSBT serialization
     def serialize_psbt(self, psbt: PSBT) -> str:
         return psbt.to_base64()
@@ -563,10 +641,8 @@ class OrdMultisig:
             add_change_out=False,
         )
 
-    def _derive_redeem_script(self, index: int) -> CScript:
-        sorted_child_pubkeys = [
-            xpub.derive_path(self._base_derivation_path).derive(index).pub for xpub in self._master_xpubs
-        ]
+    def _compute_redeem_script(self, index: int) -> CScript:
+        sorted_child_pubkeys = [xpub.derive(index).pub for xpub in self._base_xpubs]
         sorted_child_pubkeys.sort()
 
         return standard_multisig_redeem_script(
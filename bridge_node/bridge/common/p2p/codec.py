@@ -0,0 +1,291 @@
+"""
+Compact binary encoding for messages sent between the nodes.
+
+The default path (`PyroNetwork.serialize`) turns dataclasses and Decimals into tagged dicts, which Pyro's serpent
+serializer then encodes again as Python literals, and the receiving side rebuilds them into SimpleNamespaces.
+`MessageCodec` instead encodes the whole message once into a versioned `marshal` payload: registered dataclasses
+are encoded as positional tuples without field names, and strings and bytes (e.g. PSBTs) are copied as-is,
+without escaping. The payload is sent as a single bytes value with the default serializer.
+
+marshal is not safe against malicious data, so payloads received from peers are size-limited and checked to
+contain only the plain data types the codec writes (see `_check_marshal_payload`) before they are loaded.
+"""
+
+import dataclasses
+import marshal
+import struct
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+CODEC_VERSION = 1
+_VERSION_PREFIX = bytes([CODEC_VERSION])
+# Pin the marshal format so that nodes running different Python versions understand each other
+_MARSHAL_VERSION = 4
+
+# Tuples are reserved for tagged values, other tuples are encoded as lists (like in PyroNetwork.serialize)
+_TAG_MESSAGE = 0
+_TAG_DECIMAL = 1
+_TAG_DATACLASS = 2
+
+_PASSTHROUGH_TYPES = frozenset({str, int, float, bool, bytes, type(None)})
+
+DEFAULT_MAX_PAYLOAD_SIZE = 16 * 1024 * 1024
+DEFAULT_MAX_DEPTH = 64
+
+# marshal type codes (see Python/marshal.c) of the values that encode() writes. Anything else, e.g. code objects,
+# sets or text floats, is rejected.
+_MARSHAL_FLAG_REF = 0x80
+_MARSHAL_FIXED_SIZES = {
+    ord("N"): 0,  # None
+    ord("F"): 0,  # False
+    ord("T"): 0,  # True
+    ord("i"): 4,  # 32-bit int
+    ord("g"): 8,  # binary float
+}
+_MARSHAL_STRINGS = frozenset(ord(c) for c in "stuaA")  # bytes and str, with a 32-bit length
+_MARSHAL_SHORT_STRINGS = frozenset(ord(c) for c in "zZ")  # short ASCII str, with an 8-bit length
+_MARSHAL_LONG = ord("l")
+_MARSHAL_TUPLE = ord("(")
+_MARSHAL_SMALL_TUPLE = ord(")")
+_MARSHAL_LIST = ord("[")
+_MARSHAL_DICT = ord("{")
+_MARSHAL_DICT_END = ord("0")
+_MARSHAL_REF = ord("r")
+_MARSHAL_CONTAINERS = frozenset({_MARSHAL_TUPLE, _MARSHAL_SMALL_TUPLE, _MARSHAL_LIST, _MARSHAL_DICT})
+_INT32 = struct.Struct("<i")
+# Longer ints are not needed (a digit is 15 bits)
+_MARSHAL_MAX_LONG_DIGITS = 100
+
+
+class MessageCodecError(ValueError):
+    pass
+
+
+@dataclasses.dataclass(frozen=True)
+class _MessageSchema:
+    name: str
+    cls: type
+    field_names: tuple[str, ...]
+
+
+class MessageCodec:
+    """
+    Encodes messages to bytes and back.
+
+    Message dataclasses must be registered with `register()` on both the sending and the receiving side, and they
+    are decoded back to instances of the registered class. Fields can be added to the end of a message, as long as
+    they have defaults: fields missing from the payload get their defaults, and unknown trailing fields are ignored.
+    Unregistered dataclasses are encoded with their field names and decoded as SimpleNamespaces.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_payload_size: int = DEFAULT_MAX_PAYLOAD_SIZE,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+    ):
+        self.max_payload_size = max_payload_size
+        self.max_depth = max_depth
+        self._schemas_by_class: dict[type, _MessageSchema] = {}
+        self._schemas_by_name: dict[str, _MessageSchema] = {}
+
+    def register(self, cls: type[T], *, name: str | None = None) -> type[T]:
+        if not dataclasses.is_dataclass(cls):
+            raise TypeError(f"{cls} is not a dataclass")
+        if name is None:
+            name = f"{cls.__module__}.{cls.__qualname__}"
+        existing = self._schemas_by_name.get(name)
+        if existing is not None and existing.cls is not cls:
+            raise ValueError(f"Message name {name} already registered for {existing.cls}")
+        schema = _MessageSchema(
+            name=name,
+            cls=cls,
+            field_names=tuple(field.name for field in dataclasses.fields(cls)),
+        )
+        self._schemas_by_class[cls] = schema
+        self._schemas_by_name[name] = schema
+        return cls
+
+    def encode(self, value: Any) -> bytes:
+        return _VERSION_PREFIX + marshal.dumps(self._to_marshallable(value), _MARSHAL_VERSION)
+
+    def decode(self, data: bytes) -> Any:
+        data = memoryview(data)
+        if not data or data[0] != CODEC_VERSION:
+            raise MessageCodecError(f"Unsupported message codec version: {data[0] if data else None}")
+        if len(data) > self.max_payload_size:
+            raise MessageCodecError(f"Message payload too large: {len(data)} > {self.max_payload_size} bytes")
+        payload = data[1:]
+        _check_marshal_payload(payload, max_depth=self.max_depth)
+        try:
+            # Safe: the payload was checked to contain only (bounded) None/bool/int/float/bytes/str/tuple/list/dict
+            value = marshal.loads(payload)  # noqa: S302
+        except (EOFError, ValueError, TypeError) as e:
+            raise MessageCodecError(f"Invalid message payload: {e}") from e
+        return self._from_marshallable(value)
+
+    def _to_marshallable(self, value: Any) -> Any:
+        value_type = type(value)
+        if value_type in _PASSTHROUGH_TYPES:
+            return value
+        schema = self._schemas_by_class.get(value_type)
+        if schema is not None:
+            return (
+                _TAG_MESSAGE,
+                schema.name,
+                *(self._to_marshallable(getattr(value, name)) for name in schema.field_names),
+            )
+        if value_type is list or value_type is tuple:
+            return [self._to_marshallable(item) for item in value]
+        if value_type is dict:
+            return {key: self._to_marshallable(item) for key, item in value.items()}
+        if value_type is Decimal:
+            return (_TAG_DECIMAL, str(value))
+        if isinstance(value, bytearray | memoryview):
+            # marshal writes the buffer as-is and it's decoded as bytes
+            return value
+        # marshal only accepts the exact builtin types, e.g. IntEnums and HexBytes need to be converted
+        if isinstance(value, bool):
+            return bool(value)
+        if isinstance(value, int):
+            return int(value)
+        if isinstance(value, str):
+            return str.__str__(value)
+        if isinstance(value, bytes):
+            return bytes(value)
+        if isinstance(value, float):
+            return float(value)
+        if dataclasses.is_dataclass(value) and not isinstance(value, type):
+            return (
+                _TAG_DATACLASS,
+                {field.name: self._to_marshallable(getattr(value, field.name)) for field in dataclasses.fields(value)},
+            )
+        raise MessageCodecError(f"Cannot encode value of type {value_type}")
+
+    def _from_marshallable(self, value: Any) -> Any:
+        value_type = type(value)
+        if value_type in _PASSTHROUGH_TYPES:
+            return value
+        if value_type is list:
+            return [self._from_marshallable(item) for item in value]
+        if value_type is dict:
+            return {key: self._from_marshallable(item) for key, item in value.items()}
+        if value_type is tuple and value:
+            tag = value[0]
+            if tag == _TAG_MESSAGE:
+                schema = self._schemas_by_name.get(value[1])
+                if schema is None:
+                    raise MessageCodecError(f"Unknown message {value[1]!r}")
+                values = value[2 : 2 + len(schema.field_names)]
+                try:
+                    return schema.cls(*(self._from_marshallable(item) for item in values))
+                except TypeError as e:
+                    raise MessageCodecError(f"Invalid message {schema.name}: {e}") from e
+            if tag == _TAG_DECIMAL and len(value) == 2:
+                return Decimal(value[1])
+            if tag == _TAG_DATACLASS and len(value) == 2:
+                return SimpleNamespace(**self._from_marshallable(value[1]))
+        raise MessageCodecError(f"Cannot decode value of type {value_type}")
+
+
+def _check_marshal_payload(data: memoryview, *, max_depth: int) -> None:
+    """
+    Walk through a marshal payload without loading it, and raise MessageCodecError unless it contains exactly one
+    value made only of the types that MessageCodec writes, nested at most `max_depth` levels deep.
+
+    References are only allowed to scalars and empty tuples, so that a payload cannot make cyclic or exponentially
+    large values out of a few bytes.
+    """
+    size = len(data)
+    pos = 0
+    # Whether each value stored for back-references can be referenced, in the order marshal stores them
+    referenceable: list[bool] = []
+    # Containers being read: [type code, number of items left (items read for dicts, which end with a marker)]
+    stack = [[None, 1]]
+    try:
+        while stack:
+            container = stack[-1]
+            is_dict = container[0] == _MARSHAL_DICT
+            if not is_dict and container[1] == 0:
+                stack.pop()
+                continue
+
+            # Reads past the end are caught by struct.error, skipped ones by the final position check
+            if pos >= size:
+                raise MessageCodecError("Invalid message payload: truncated")
+            code = data[pos]
+            pos += 1
+            flag_ref = code & _MARSHAL_FLAG_REF
+            code &= ~_MARSHAL_FLAG_REF
+
+            if is_dict:
+                if code == _MARSHAL_DICT_END:
+                    if flag_ref or container[1] % 2:
+                        raise MessageCodecError("Invalid message payload: bad dict")
+                    stack.pop()
+                    continue
+                container[1] += 1
+            else:
+                container[1] -= 1
+
+            can_reference = True
+            if code in _MARSHAL_FIXED_SIZES:
+                pos += _MARSHAL_FIXED_SIZES[code]
+            elif code in _MARSHAL_STRINGS:
+                (length,) = _INT32.unpack_from(data, pos)
+                if length < 0:
+                    raise MessageCodecError("Invalid message payload: negative length")
+                pos += 4 + length
+            elif code in _MARSHAL_SHORT_STRINGS:
+                pos += 1 + data[pos]
+            elif code == _MARSHAL_LONG:
+                (num_digits,) = _INT32.unpack_from(data, pos)
+                if abs(num_digits) > _MARSHAL_MAX_LONG_DIGITS:
+                    raise MessageCodecError("Invalid message payload: int too large")
+                pos += 4 + abs(num_digits) * 2
+            elif code == _MARSHAL_REF:
+                (index,) = _INT32.unpack_from(data, pos)
+                pos += 4
+                if flag_ref or not 0 <= index < len(referenceable) or not referenceable[index]:
+                    raise MessageCodecError("Invalid message payload: bad reference")
+                continue
+            elif code in _MARSHAL_CONTAINERS:
+                if code == _MARSHAL_SMALL_TUPLE:
+                    num_items = data[pos]
+                    pos += 1
+                elif code == _MARSHAL_DICT:
+                    num_items = 0
+                else:
+                    (num_items,) = _INT32.unpack_from(data, pos)
+                    pos += 4
+                    if num_items < 0:
+                        raise MessageCodecError("Invalid message payload: negative length")
+                # Only empty tuples are shared. Containers are stored for references before their items
+                can_reference = num_items == 0 and code != _MARSHAL_LIST and code != _MARSHAL_DICT
+                if len(stack) > max_depth:
+                    raise MessageCodecError("Invalid message payload: nested too deep")
+                stack.append([code, num_items])
+            else:
+                raise MessageCodecError(f"Invalid message payload: unsupported type code {code!r}")
+
+            if flag_ref:
+                referenceable.append(can_reference)
+    except (struct.error, IndexError) as e:
+        raise MessageCodecError("Invalid message payload: truncated") from e
+
+    if pos != size:
+        raise MessageCodecError("Invalid message payload: truncated or trailing data")
+
+
+# The codec used by PyroNetwork. Message dataclasses are registered in their modules
+message_codec = MessageCodec()
+
+
+def register_message(cls: type[T]) -> type[T]:
+    """
+    Class decorator that registers a message dataclass to the default codec.
+    """
+    return message_codec.register(cls)
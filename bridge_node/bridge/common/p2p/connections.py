@@ -0,0 +1,213 @@
+import logging
+import select
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+import Pyro5
+import Pyro5.errors
+from Pyro5.errors import CommunicationError
+
+from .client import BoundPyroProxy
+
+logger = logging.getLogger(__name__)
+
+
+class PeerConnection:
+    """
+    A long-lived, authenticated connection to a single peer.
+
+    The underlying proxy is connected (and the handshake challenge done) lazily, and then reused for subsequent
+    calls. The connection is re-established if the peer has closed it, or if it's older than `max_age` seconds,
+    which also re-validates the peer against the current federator list.
+
+    If connecting fails, further attempts are not made until a backoff period (doubling after each failure,
+    up to `max_retry_interval` seconds) has passed -- calls fail fast with a CommunicationError instead.
+
+    The connection can be used from multiple threads. Only one thread uses it at a time.
+    """
+
+    def __init__(
+        self,
+        *,
+        peer_id: str,
+        uri: str,
+        create_proxy: Callable[[str], BoundPyroProxy],
+        max_age: float = 600.0,
+        min_retry_interval: float = 1.0,
+        max_retry_interval: float = 60.0,
+    ):
+        self.peer_id = peer_id
+        self.uri = uri
+        self._create_proxy = create_proxy
+        self._max_age = max_age
+        self._min_retry_interval = min_retry_interval
+        self._max_retry_interval = max_retry_interval
+
+        self._lock = threading.Lock()
+        self._proxy: BoundPyroProxy | None = None
+        self._connected_at = 0.0
+        self._num_failures = 0
+        self._next_attempt_at = 0.0
+
+    def __repr__(self):
+        return f"<PeerConnection {self.uri}>"
+
+    @contextmanager
+    def proxy(self, timeout: float | None = None) -> Iterator[BoundPyroProxy]:
+        """
+        Get exclusive access to the connected proxy of the peer.
+
+        If `timeout` is given, waiting for the connection (if another thread is using it), connecting and each call
+        made with the proxy are bounded by the time remaining of it, so that a caller that has given up on the peer
+        doesn't hold the connection for longer.
+
+        Raises CommunicationError if the peer cannot be connected to, or if the connection is not free in time.
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        if not self._lock.acquire(timeout=timeout if timeout is not None else -1):
+            raise Pyro5.errors.TimeoutError(f"connection to {self.uri} is busy")
+        try:
+            proxy = self._connect(timeout=self._get_remaining_time(deadline))
+            proxy._pyroTimeout = self._get_remaining_time(deadline)
+            try:
+                yield proxy
+            except CommunicationError:
+                # Pyro releases the connection on communication errors, but make sure we reconnect next time
+                self._release()
+                raise
+        finally:
+            self._lock.release()
+
+    def get_info(self) -> dict[str, str]:
+        if not self._lock.acquire(blocking=False):
+            # Another thread is talking with the peer right now
+            return {
+                "status": "online",
+                "uri": self.uri,
+            }
+        try:
+            self._connect()
+        except CommunicationError:
+            status = "offline"
+        else:
+            status = "online"
+        finally:
+            self._lock.release()
+        return {
+            "status": status,
+            "uri": self.uri,
+        }
+
+    def close(self):
+        with self._lock:
+            self._release()
+
+    def _get_remaining_time(self, deadline: float | None) -> float | None:
+        if deadline is None:
+            # Pyro's default of 0 means no timeout, but setting it on a connected proxy would make the socket
+            # non-blocking
+            return Pyro5.config.COMMTIMEOUT or None
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise Pyro5.errors.TimeoutError(f"timed out waiting for the connection to {self.uri}")
+        return remaining
+
+    def _connect(self, timeout: float | None = None) -> BoundPyroProxy:
+        if self._proxy is not None:
+            if time.monotonic() - self._connected_at > self._max_age:
+                logger.debug("Connection to %s expired, reconnecting", self.uri)
+                self._release()
+            elif not self._is_healthy(self._proxy):
+                logger.debug("Connection to %s closed, reconnecting", self.uri)
+                self._release()
+            else:
+                self._proxy._pyroClaimOwnership()
+                return self._proxy
+
+        now = time.monotonic()
+        if now < self._next_attempt_at:
+            raise CommunicationError(
+                f"not connecting to {self.uri} for another {self._next_attempt_at - now:.1f} seconds "
+                f"after {self._num_failures} failed attempts"
+            )
+
+        proxy = self._create_proxy(self.uri)
+        if timeout is not None:
+            proxy._pyroTimeout = timeout
+        try:
+            proxy._pyroBind()
+        except CommunicationError:
+            self._num_failures += 1
+            retry_interval = min(
+                self._min_retry_interval * 2 ** (self._num_failures - 1),
+                self._max_retry_interval,
+            )
+            self._next_attempt_at = time.monotonic() + retry_interval
+            raise
+
+        self._proxy = proxy
+        self._connected_at = time.monotonic()
+        self._num_failures = 0
+        self._next_attempt_at = 0.0
+        return proxy
+
+    def _release(self):
+        if self._proxy is None:
+            return
+        proxy, self._proxy = self._proxy, None
+        try:
+            proxy._pyroClaimOwnership()
+            proxy._pyroRelease()
+        except Exception:
+            logger.debug("Error releasing connection to %s", self.uri, exc_info=True)
+
+    def _is_healthy(self, proxy: BoundPyroProxy) -> bool:
+        connection = proxy._pyroConnection
+        if connection is None:
+            return False
+        try:
+            # An idle connection should have nothing to read. If it's readable, the peer has closed it
+            # (or sent something unexpected), and it cannot be used anymore.
+            readable, _, _ = select.select([connection.sock], [], [], 0)
+        except (OSError, ValueError):
+            return False
+        return not readable
+
+
+class PeerConnectionPool:
+    """
+    Keeps one PeerConnection per peer URI.
+    """
+
+    def __init__(
+        self,
+        *,
+        create_proxy: Callable[[str], BoundPyroProxy],
+        max_age: float = 600.0,
+    ):
+        self._create_proxy = create_proxy
+        self._max_age = max_age
+        self._lock = threading.Lock()
+        self._connections: dict[str, PeerConnection] = {}
+
+    def get(self, peer_id: str, uri: str) -> PeerConnection:
+        with self._lock:
+            connection = self._connections.get(uri)
+            if connection is None:
+                connection = PeerConnection(
+                    peer_id=peer_id,
+                    uri=uri,
+                    create_proxy=self._create_proxy,
+                    max_age=self._max_age,
+                )
+                self._connections[uri] = connection
+            return connection
+
+    def close(self):
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+        for connection in connections:
+            connection.close()
@@ -2,7 +2,9 @@ import dataclasses
 import logging
 import socket
 import threading
+import time
 from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from decimal import Decimal
 from types import SimpleNamespace
 from typing import (
@@ -13,6 +15,7 @@ from typing import (
 
 import Pyro5.api
 import Pyro5.errors
+import serpent
 from anemic.ioc import (
     Container,
     service,
@@ -26,6 +29,8 @@ from bridge.common.p2p.auth.bridge_ssl import (
 from bridge.config import Config
 
 from .client import BoundPyroProxy
+from .codec import MessageCodec, MessageCodecError, message_codec
+from .connections import PeerConnection, PeerConnectionPool
 from .messaging import MessageEnvelope
 
 logger = logging.getLogger(__name__)
@@ -41,7 +46,14 @@ class Network(Protocol):
     def is_leader(self) -> bool:
         pass
 
-    def ask(self, question: str, **kwargs: Any) -> list[Any]: ...
+    def ask(
+        self,
+        question: str,
+        *,
+        timeout: float | None = None,
+        quorum: int | None = None,
+        **kwargs: Any,
+    ) -> list[Any]: ...
 
     def answer_with(self, question: str, callback: Callable[..., Any]): ...
 
@@ -69,6 +81,10 @@ class PyroNetwork(Network):
         privkey=None,
         leader_node_id=None,
         fetch_peer_addresses: Callable[[], list[str]] = lambda: [],
+        ask_timeout: float | None = None,
+        peer_connection_max_age: float = 600.0,
+        use_message_codec: bool = False,
+        codec: MessageCodec = message_codec,
     ):
         self.host = host
         self.port = port
@@ -77,10 +93,18 @@ class PyroNetwork(Network):
         self.context = None
         self.privkey = privkey
         self.fetch_peer_addresses = fetch_peer_addresses
+        self.ask_timeout = ask_timeout
+        # Questions are always answered in both formats, but only asked with the codec if enabled
+        self.use_message_codec = use_message_codec
+        self.codec = codec
 
         self.create_daemon(context_cls)
 
         self._peers = peers  # list of (node_id, hostname:port) tuples
+        self._connections = PeerConnectionPool(
+            create_proxy=self._create_peer_proxy,
+            max_age=peer_connection_max_age,
+        )
 
         if self.node_id is None:
             self.node_id = self.uri.object
@@ -111,31 +135,104 @@ class PyroNetwork(Network):
         # Leader is hardcoded in config
         return self.node_id == self.leader_node_id
 
-    def ask(self, question: str, **kwargs: Any):
+    def ask(
+        self,
+        question: str,
+        *,
+        timeout: float | None = None,
+        quorum: int | None = None,
+        **kwargs: Any,
+    ):
+        """
+        Ask a question from all peers concurrently and return the non-null answers.
+
+        Peers that haven't answered within `timeout` seconds (default: `ask_timeout`) are skipped.
+        If `quorum` is given, return as soon as that many non-null answers have been received.
+        """
+        if timeout is None:
+            timeout = self.ask_timeout
         logger.debug(
-            "Asking question %r from all peers",
+            "Asking question %r from all peers (timeout: %s, quorum: %s)",
             question,
+            timeout,
+            quorum,
         )
-        answers = []
         logger.debug("ask kwargs %s", kwargs)
-        serialized_kwargs = {key: self.serialize(value) for key, value in kwargs.items()}
-        logger.debug("ask serialized kwargs %s", serialized_kwargs)
-        for peer in self.peers:
-            try:
-                try:
-                    answer = peer.answer(question, **serialized_kwargs)
-                except CommunicationError as e:
-                    # TODO: handle ConnectionRefused and have less spam
-                    logger.exception("Error communicating with peer %s: %s", peer, e)
-                    answer = None
-                if answer is not None:
-                    # TODO: proper return type for null answer
-                    deserialized_answer = self.deserialize(answer)
-                    answers.append(deserialized_answer)
-            except Pyro5.errors.CommunicationError:
-                logger.exception("Error asking question %s from peer %s", question, peer)
+        if self.use_message_codec:
+            # Encoded once, the same payload is sent to all peers
+            payload = self.codec.encode(kwargs)
+            logger.debug("ask encoded kwargs: %d bytes", len(payload))
+        else:
+            payload = {key: self.serialize(value) for key, value in kwargs.items()}
+            logger.debug("ask serialized kwargs %s", payload)
+
+        peers = self.peers
+        if not peers:
+            return []
+
+        answers = []
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        executor = ThreadPoolExecutor(max_workers=len(peers), thread_name_prefix="pyro-ask")
+        try:
+            pending = {executor.submit(self._ask_peer, peer, question, payload, timeout): peer for peer in peers}
+            while pending:
+                remaining = deadline - time.monotonic() if deadline is not None else None
+                if remaining is not None and remaining <= 0:
+                    break
+                done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    del pending[future]
+                    answer = future.result()
+                    if answer is not None:
+                        answers.append(answer)
+                if quorum is not None and len(answers) >= quorum:
+                    break
+            if pending and (quorum is None or len(answers) < quorum):
+                logger.warning(
+                    "Question %r timed out after %s seconds, no answer from peers %s",
+                    question,
+                    timeout,
+                    list(pending.values()),
+                )
+        finally:
+            # Don't wait for slow peers, their answers are discarded
+            executor.shutdown(wait=False, cancel_futures=True)
         return answers
 
+    def _ask_peer(
+        self,
+        peer: PeerConnection,
+        question: str,
+        payload: dict[str, Any] | bytes,
+        timeout: float | None,
+    ):
+        try:
+            with peer.proxy(timeout=timeout) as proxy:
+                if self.use_message_codec:
+                    answer = proxy.answer_encoded(question, payload)
+                else:
+                    answer = proxy.answer(question, **payload)
+            if answer is None:
+                # TODO: proper return type for null answer
+                return None
+            if self.use_message_codec:
+                return self.codec.decode(self._to_bytes(answer))
+        except CommunicationError as e:
+            # TODO: handle ConnectionRefused and have less spam
+            logger.exception("Error communicating with peer %s: %s", peer, e)
+            return None
+        except Exception:
+            logger.exception("Error asking question %s from peer %s", question, peer)
+            return None
+        return self.deserialize(answer)
+
+    @staticmethod
+    def _to_bytes(data: bytes | dict) -> bytes:
+        # serpent encodes bytes as base64 dicts
+        if isinstance(data, dict):
+            return serpent.tobytes(data)
+        return data
+
     def serialize(self, value: Any) -> Any:
         if dataclasses.is_dataclass(value):
             ret = {
@@ -155,6 +252,8 @@ class PyroNetwork(Network):
                 "_is_decimal": True,
                 "value": str(value),
             }
+        if isinstance(value, list | tuple):
+            return [self.serialize(item) for item in value]
         return value
 
     def deserialize(self, value: Any) -> Any:
@@ -168,13 +267,15 @@ class PyroNetwork(Network):
                 )
             if value.get("_is_decimal"):
                 return Decimal(value["value"])
+        if isinstance(value, list):
+            return [self.deserialize(item) for item in value]
         return value
 
     def broadcast(self, msg: Any):
         logger.debug(
             "Broadcasting msg %r to all peers: %s",
             msg,
-            [peer._pyroUri.location for peer in self.peers],
+            [peer.uri for peer in self.peers],
         )
         envelope = PyroMessageEnvelope(
             sender=str(self.uri),
@@ -182,7 +283,8 @@ class PyroNetwork(Network):
         )
         for peer in self.peers:
             try:
-                peer.receive(envelope)
+                with peer.proxy() as proxy:
+                    proxy.receive(envelope)
             except Pyro5.errors.CommunicationError:
                 logger.exception("Error sending message to peer %s", peer)
 
@@ -218,13 +320,8 @@ class PyroNetwork(Network):
         kwargs = {key: self.deserialize(value) for key, value in kwargs.items()}
         logger.debug("answer deserialized kwargs: %s", kwargs)
 
-        answer_callback = self._answer_callbacks.get(question)
+        answer_callback = self._get_answer_callback(question)
         if answer_callback is None:
-            logger.warning(
-                "No answer callback for question %r (valid callbacks: %r)",
-                question,
-                list(self._answer_callbacks.keys()),
-            )
             return None
         try:
             ret = answer_callback(**kwargs)
@@ -236,6 +333,40 @@ class PyroNetwork(Network):
             return None
         return ret
 
+    @Pyro5.api.expose
+    def answer_encoded(self, question: str, payload: bytes) -> bytes | None:
+        """
+        Like `answer`, but the kwargs and the answer are encoded with the message codec.
+        """
+        logger.debug("Answering encoded question %r (thread %s)", question, threading.current_thread().name)
+        try:
+            kwargs = self.codec.decode(self._to_bytes(payload))
+        except MessageCodecError:
+            logger.exception("Invalid payload for question %r", question)
+            return None
+        logger.debug("answer decoded kwargs: %s", kwargs)
+
+        answer_callback = self._get_answer_callback(question)
+        if answer_callback is None:
+            return None
+        try:
+            ret = answer_callback(**kwargs)
+            logger.debug("answer ret: %s", ret)
+            return self.codec.encode(ret)
+        except Exception:
+            logger.exception("Error answering question %r (thread %s)", question, threading.current_thread().name)
+            return None
+
+    def _get_answer_callback(self, question: str) -> Callable[..., Any] | None:
+        answer_callback = self._answer_callbacks.get(question)
+        if answer_callback is None:
+            logger.warning(
+                "No answer callback for question %r (valid callbacks: %r)",
+                question,
+                list(self._answer_callbacks.keys()),
+            )
+        return answer_callback
+
     def answer_with(self, question: str, callback: Callable[..., Any]):
         logger.info("Registering answer callback for question %r", question)
         if question in self._answer_callbacks:
@@ -247,13 +378,9 @@ class PyroNetwork(Network):
 
         logger.debug("Listener added to network: %s", listener)
 
-    def get_peers(self):
+    def get_peers(self) -> list[PeerConnection]:
         return [
-            BoundPyroProxy(
-                self.get_peer_uri(peer, host),
-                privkey=self.privkey,
-                fetch_peer_addresses=self.fetch_peer_addresses,
-            )
+            self._connections.get(peer, self.get_peer_uri(peer, host))
             for peer, host in self._peers
             if peer != self.node_id
         ]
@@ -271,28 +398,16 @@ class PyroNetwork(Network):
             "node_id": self.node_id,
             "uri": str(self.uri),
             "is_leader": self.is_leader(),
-            "peers": {peer._pyroUri.object: self.get_peer_info(peer) for peer in self.peers},
+            "peers": {peer.peer_id: peer.get_info() for peer in self.peers},
         }
 
-    def get_peer_info(self, peer):
-        # Due to how peers are created at the moment, it's not connected
-        # until the first call is made
-        try:
-            peer._pyroBind()
-        except Pyro5.errors.CommunicationError:
-            return {
-                "status": "offline",
-                "uri": str(peer._pyroUri),
-            }
-
-        info = {
-            "status": "offline" if not peer._pyroConnection else "online",
-            "uri": str(peer._pyroUri),
-        }
-
-        peer._pyroRelease()
-
-        return info
+    def _create_peer_proxy(self, uri: str) -> BoundPyroProxy:
+        # The transport always uses the default serializer, never marshal, which is not safe against data from peers
+        return BoundPyroProxy(
+            uri,
+            privkey=self.privkey,
+            fetch_peer_addresses=self.fetch_peer_addresses,
+        )
 
     def start(self):
         if self._running:
@@ -313,6 +428,7 @@ class PyroNetwork(Network):
         logger.info("Stopping Pyro daemon loop")
         self._running = False
         self._thread.join()
+        self._connections.close()
         logger.info("Pyro daemon loop stopped")
 
 
@@ -353,6 +469,8 @@ def create_pyro_network(container: Container):
         privkey=config.evm_private_key,
         fetch_peer_addresses=access_control_contract.functions.federators().call,
         leader_node_id=config.leader_node_id,
+        ask_timeout=config.p2p_ask_timeout,
+        use_message_codec=config.p2p_use_message_codec,
     )
 
     # TODO: VERY UGLY! But we don't want to crash on startup if network not started
@@ -0,0 +1,170 @@
+import bisect
+import math
+import threading
+import typing
+from collections.abc import Collection, Sequence
+from dataclasses import dataclass
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+Timeout = float | tuple[float, float]
+
+
+def create_http_session(
+    *,
+    pool_size: int = 10,
+    max_retries: int = 0,
+    backoff_factor: float = 0.5,
+    retry_status_codes: Collection[int] = (502, 503, 504),
+    retry_methods: Collection[str] = ("GET",),
+) -> requests.Session:
+    """
+    Create a requests Session with a keep-alive connection pool of `pool_size` connections per host.
+
+    Connection errors and `retry_status_codes` are retried up to `max_retries` times with exponential backoff,
+    but only for `retry_methods`. After the retries are exhausted the last response is returned as-is, so that
+    callers can produce their own error messages.
+    """
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=tuple(retry_status_codes),
+        allowed_methods=frozenset(method.upper() for method in retry_methods),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@dataclass(frozen=True)
+class ConnectionPoolStats:
+    num_requests: int
+    num_connections: int
+
+    @property
+    def num_reused_connections(self) -> int:
+        return max(self.num_requests - self.num_connections, 0)
+
+
+def get_connection_pool_stats(session: requests.Session) -> ConnectionPoolStats:
+    """
+    Sum up the request and connection counters of all urllib3 connection pools of the session
+    """
+    num_requests = 0
+    num_connections = 0
+    adapters = {id(adapter): adapter for adapter in session.adapters.values()}
+    for adapter in adapters.values():
+        pools = getattr(getattr(adapter, "poolmanager", None), "pools", None)
+        if pools is None:
+            continue
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            num_requests += pool.num_requests
+            num_connections += pool.num_connections
+    return ConnectionPoolStats(
+        num_requests=num_requests,
+        num_connections=num_connections,
+    )
+
+
+class RequestCounter:
+    """
+    Thread-safe request counter with latency totals
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.num_requests = 0
+        self.num_errors = 0
+        self.total_latency_seconds = 0.0
+        self.max_latency_seconds = 0.0
+
+    def record(self, latency_seconds: float, *, error: bool = False):
+        with self._lock:
+            self.num_requests += 1
+            if error:
+                self.num_errors += 1
+            self.total_latency_seconds += latency_seconds
+            self.max_latency_seconds = max(self.max_latency_seconds, latency_seconds)
+
+    @property
+    def avg_latency_seconds(self) -> float:
+        with self._lock:
+            if not self.num_requests:
+                return 0.0
+            return self.total_latency_seconds / self.num_requests
+
+    def as_dict(self) -> dict[str, float | int]:
+        avg_latency_seconds = self.avg_latency_seconds
+        with self._lock:
+            return {
+                "num_requests": self.num_requests,
+                "num_errors": self.num_errors,
+                "total_latency_seconds": self.total_latency_seconds,
+                "avg_latency_seconds": avg_latency_seconds,
+                "max_latency_seconds": self.max_latency_seconds,
+            }
+
+
+class LatencyHistogram:
+    """
+    Thread-safe fixed-bucket latency histogram. Percentiles are estimated as the upper bound of the bucket
+    the percentile falls in.
+    """
+
+    DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self._lock = threading.Lock()
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # last one is for everything above the highest bucket
+        self.count = 0
+        self.total_seconds = 0.0
+
+    def record(self, latency_seconds: float):
+        index = bisect.bisect_left(self.buckets, latency_seconds)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.total_seconds += latency_seconds
+
+    def percentile(self, percentile: float) -> float:
+        with self._lock:
+            if not self.count:
+                return 0.0
+            threshold = self.count * percentile / 100
+            cumulative = 0
+            for index, count in enumerate(self.counts):
+                cumulative += count
+                if cumulative >= threshold and count:
+                    return self.buckets[index] if index < len(self.buckets) else math.inf
+            return math.inf
+
+    def as_dict(self) -> dict[str, typing.Any]:
+        p50 = self.percentile(50)
+        p95 = self.percentile(95)
+        p99 = self.percentile(99)
+        with self._lock:
+            return {
+                "count": self.count,
+                "total_seconds": self.total_seconds,
+                "avg_seconds": self.total_seconds / self.count if self.count else 0.0,
+                "p50_seconds": p50,
+                "p95_seconds": p95,
+                "p99_seconds": p99,
+                "buckets": {
+                    **{f"le_{bound:g}": count for bound, count in zip(self.buckets, self.counts, strict=False)},
+                    "le_inf": self.counts[-1],
+                },
+            }
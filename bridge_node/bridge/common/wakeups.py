@@ -0,0 +1,181 @@
+"""
+Wake the main loop up when something happens on the chains, instead of only polling on a fixed interval.
+"""
+
+import abc
+import logging
+import threading
+from typing import Protocol
+
+from web3 import Web3
+
+logger = logging.getLogger(__name__)
+
+
+class Wakeup:
+    """
+    Lets the main loop sleep until it's notified (or a timeout passes).
+
+    Notifications received while the main loop is not waiting are not lost: the next wait returns immediately.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._reasons: set[str] = set()
+
+    def notify(self, reason: str):
+        with self._condition:
+            self._reasons.add(reason)
+            self._condition.notify_all()
+
+    def wait(self, timeout: float) -> set[str]:
+        """
+        Wait until notified, or until `timeout` seconds have passed. Returns the reasons of the notifications.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._reasons, timeout=timeout)
+            reasons, self._reasons = self._reasons, set()
+            return reasons
+
+
+class WakeupBroadcast(Wakeup):
+    """
+    Forwards notifications to multiple wakeups, e.g. one for each bridge worker.
+    """
+
+    def __init__(self, wakeups: list[Wakeup]):
+        super().__init__()
+        self.wakeups = wakeups
+
+    def notify(self, reason: str):
+        for wakeup in self.wakeups:
+            wakeup.notify(reason)
+
+
+class WakeupSource(Protocol):
+    def start(self, wakeup: Wakeup) -> None: ...
+
+    def stop(self) -> None: ...
+
+
+class _ThreadedWakeupSource(abc.ABC):
+    name: str
+
+    def __init__(self):
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self, wakeup: Wakeup):
+        if self._thread is not None:
+            raise RuntimeError(f"{self.name} already started")
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(wakeup,),
+            name=self.name,
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    @abc.abstractmethod
+    def _run(self, wakeup: Wakeup):
+        """
+        Notify `wakeup` until stopped, in a thread of its own.
+        """
+
+
+class BitcoindZmqWakeupSource(_ThreadedWakeupSource):
+    """
+    Wakes the main loop up on bitcoind ZMQ notifications (-zmqpubhashblock, -zmqpubrawtx).
+
+    Requires pyzmq to be installed. Without it, an error is logged and the main loop keeps polling.
+    """
+
+    def __init__(
+        self,
+        *,
+        urls: list[str],
+        topics: tuple[str, ...] = ("hashblock", "rawtx"),
+        poll_timeout_ms: int = 1000,
+    ):
+        super().__init__()
+        self.name = "bitcoind-zmq-wakeup"
+        self.urls = urls
+        self.topics = topics
+        self._poll_timeout_ms = poll_timeout_ms
+
+    def start(self, wakeup: Wakeup):
+        try:
+            import zmq  # noqa: F401
+        except ImportError:
+            logger.error(
+                "pyzmq is not installed, not listening to bitcoind ZMQ notifications from %s. "
+                "Install pyzmq or unset BRIDGE_BTC_ZMQ_URLS",
+                self.urls,
+            )
+            return
+        super().start(wakeup)
+
+    def _run(self, wakeup: Wakeup):
+        import zmq
+
+        context = zmq.Context()
+        socket = context.socket(zmq.SUB)
+        try:
+            for topic in self.topics:
+                socket.setsockopt(zmq.SUBSCRIBE, topic.encode())
+            for url in self.urls:
+                socket.connect(url)
+            logger.info("Listening to bitcoind ZMQ notifications %s from %s", self.topics, self.urls)
+            while not self._stopped.is_set():
+                if not socket.poll(self._poll_timeout_ms):
+                    continue
+                # Drain everything that's queued, one notification is enough
+                topics = set()
+                while True:
+                    try:
+                        topic, *_ = socket.recv_multipart(zmq.NOBLOCK)
+                    except zmq.Again:
+                        break
+                    topics.add(topic.decode())
+                for topic in topics:
+                    wakeup.notify(f"bitcoind:{topic}")
+        finally:
+            socket.close(linger=0)
+            context.term()
+
+
+class EvmNewBlockWakeupSource(_ThreadedWakeupSource):
+    """
+    Wakes the main loop up when a new block is seen on an EVM chain. The block number is polled.
+    """
+
+    def __init__(
+        self,
+        *,
+        web3: Web3,
+        name: str,
+        poll_interval: float,
+    ):
+        super().__init__()
+        self.name = f"{name}-new-block-wakeup"
+        self.web3 = web3
+        self.poll_interval = poll_interval
+
+    def _run(self, wakeup: Wakeup):
+        last_block_number = None
+        while not self._stopped.is_set():
+            try:
+                block_number = self.web3.eth.block_number
+            except Exception:
+                logger.warning("Error polling block number for %s", self.name, exc_info=True)
+            else:
+                if last_block_number is not None and block_number != last_block_number:
+                    wakeup.notify(f"{self.name}:{block_number}")
+                last_block_number = block_number
+            self._stopped.wait(self.poll_interval)
@@ -38,10 +38,25 @@ class Config:
     port = environ.var(5000, converter=int)
     peers = environ.var(converter=lambda s: [x.split("@") for x in comma_separated(s)])
     iteration_sleep_time = environ.var(converter=float, default="20.0")
+    # Wake the main loop up early on new blocks/transactions. iteration_sleep_time is the fallback
+    min_iteration_interval = environ.var(converter=float, default="1.0")
+    btc_zmq_urls = environ.var(converter=comma_separated, default="")
+    evm_new_block_poll_interval = environ.var(converter=float, default="0")
+    # Each bridge runs in its own worker. Per-bridge sleep times override iteration_sleep_time,
+    # e.g. "runesrsk=10,runesbob=30"
+    bridge_iteration_sleep_times = environ.var(
+        converter=lambda s: {name: float(value) for name, value in (x.split("=") for x in comma_separated(s))},
+        default="",
+    )
+    bridge_iteration_timeout = environ.var(converter=float, default="600.0")
+    bridge_max_backoff = environ.var(converter=float, default="300.0")
     db_url = environ.var()
     enabled_bridges = environ.var(converter=comma_separated, default="all")
     access_control_contract_address = environ.var()
     evm_rpc_url = environ.var()
+    p2p_ask_timeout = environ.var(converter=float, default="60.0")
+    # Ask questions using the binary message codec. All peers must be running a version that answers them
+    p2p_use_message_codec = environ.bool_var(default=False)
 
     # Generic blockchain settings for all bridges
     evm_block_safety_margin = environ.var(converter=int, default=5)
@@ -59,6 +74,8 @@ class Config:
 
     # TODO: this global btc rpc url is not needed
     btc_rpc_url = secret("bridge_btc_rpc_url", environ.var())
+    # Connection pool size of the bitcoind RPC session, shared by all bridges
+    btc_rpc_pool_size = environ.var(converter=int, default="10")
     evm_private_key = secret("bridge_evm_private_key")
 
     # Messenger settings
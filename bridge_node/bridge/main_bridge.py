@@ -2,8 +2,16 @@ import logging
 import time
 
 from anemic.ioc import Container, auto, autowired, service
+from web3 import Web3
 
+from bridge.common.bridge_workers import BridgeWorker
 from bridge.common.p2p.network import Network
+from bridge.common.wakeups import (
+    BitcoindZmqWakeupSource,
+    EvmNewBlockWakeupSource,
+    WakeupBroadcast,
+    WakeupSource,
+)
 
 from .bridges.runes.bridge import RuneBridge
 from .bridges.tap_rsk.bridge import TapRskBridge
@@ -18,6 +26,7 @@ class MainBridge(Bridge):
     name = "MAIN_BRIDGE"
     config: Config = autowired(auto)
     network: Network = autowired(auto)
+    web3: Web3 = autowired(auto)
     tap_rsk_bridge: TapRskBridge = autowired(auto)
     runesrsk_bridge: RuneBridge = autowired(RuneBridge, name="runesrsk-bridge")
     runesbob_bridge: RuneBridge = autowired(RuneBridge, name="runesbob-bridge")
@@ -45,14 +54,71 @@ class MainBridge(Bridge):
         self.network.answer_with("main:ping", self._answer_pong)
 
     def enter_main_loop(self):
-        while True:
-            try:
-                self.run_iteration()
-            except KeyboardInterrupt:
-                break
-            except Exception:
-                logger.exception("Error in main loop")
-            time.sleep(self.config.iteration_sleep_time)
+        workers = self.get_workers()
+        wakeup_sources = self.get_wakeup_sources()
+        for worker in workers:
+            worker.start()
+        for wakeup_source in wakeup_sources:
+            wakeup_source.start(WakeupBroadcast([worker.wakeup for worker in workers]))
+        try:
+            while True:
+                try:
+                    self.supervise(workers)
+                    time.sleep(self.config.iteration_sleep_time)
+                except KeyboardInterrupt:
+                    break
+                except Exception:
+                    logger.exception("Error in main loop")
+        finally:
+            for wakeup_source in wakeup_sources:
+                wakeup_source.stop()
+            for worker in workers:
+                worker.stop(timeout=self.config.iteration_sleep_time)
+
+    def get_workers(self) -> list[BridgeWorker]:
+        sleep_times = self.config.bridge_iteration_sleep_times
+        return [
+            BridgeWorker(
+                bridge=bridge,
+                sleep_time=sleep_times.get(bridge.name, self.config.iteration_sleep_time),
+                min_interval=self.config.min_iteration_interval,
+                timeout=self.config.bridge_iteration_timeout,
+                max_backoff=self.config.bridge_max_backoff,
+            )
+            for bridge in self.bridges
+        ]
+
+    def supervise(self, workers: list[BridgeWorker]):
+        if self.network.is_leader():
+            self.ping()
+        for worker in workers:
+            if worker.is_stuck():
+                logger.error("Bridge %s is stuck: %s", worker.name, worker.get_status())
+            elif not worker.is_alive():
+                logger.error("Worker for bridge %s died, restarting it", worker.name)
+                worker.start()
+            else:
+                logger.debug("Bridge %s: %s", worker.name, worker.get_status())
+
+    def get_wakeup_sources(self) -> list[WakeupSource]:
+        wakeup_sources = []
+        if self.config.btc_zmq_urls:
+            wakeup_sources.append(BitcoindZmqWakeupSource(urls=self.config.btc_zmq_urls))
+        if self.config.evm_new_block_poll_interval > 0:
+            web3s = {self.web3.provider.endpoint_uri: ("evm", self.web3)}
+            for bridge in self.bridges:
+                if isinstance(bridge, RuneBridge):
+                    bridge_web3 = bridge.service.web3
+                    web3s.setdefault(bridge_web3.provider.endpoint_uri, (bridge.name, bridge_web3))
+            for name, web3 in web3s.values():
+                wakeup_sources.append(
+                    EvmNewBlockWakeupSource(
+                        web3=web3,
+                        name=name,
+                        poll_interval=self.config.evm_new_block_poll_interval,
+                    )
+                )
+        return wakeup_sources
 
     def run_iteration(self):
         logger.info("Running main loop iteration from node: %s", self.network.node_id)
@@ -55,6 +55,7 @@ class CachedModuleSetup:
     federator_evm_private_keys: list[str]
     user_evm_private_key: str
     rune_bridge_contract_address: str
+    multicall_address: str
     root_ord_wallet_name: str
     root_ord_wallet_address: str
     user_ord_wallet_name: str
@@ -123,6 +124,7 @@ def runes_module_setup(
             name="user",
         )
         rune_bridge_address = cached_setup.rune_bridge_contract_address
+        multicall_address = cached_setup.multicall_address
 
         root_ord_wallet = OrdWallet(
             ord=ord,
@@ -170,6 +172,9 @@ def runes_module_setup(
             )
         rune_bridge_address = deployment["addresses"]["RuneBridge"]
 
+        with measure_time("deploy-multicall3"):
+            multicall_address = hardhat.run_json_command("deploy-multicall3")["address"]
+
         with measure_time("create ord wallets"):
             root_ord_wallet = ord.create_test_wallet("root-ord")  # used for funding other wallets
             root_ord_wallet.get_receiving_address()  # will cache it
@@ -190,6 +195,7 @@ def runes_module_setup(
             federator_evm_private_keys=[wallet.account.key.hex() for wallet in federator_evm_wallets],
             user_evm_private_key=user_evm_wallet.account.key.hex(),
             rune_bridge_contract_address=rune_bridge_address,
+            multicall_address=multicall_address,
             root_ord_wallet_name=root_ord_wallet.name,
             root_ord_wallet_address=root_ord_wallet.get_receiving_address(),
             user_ord_wallet_name=user_ord_wallet.name,
@@ -202,6 +208,7 @@ def runes_module_setup(
         federator_evm_wallets=federator_evm_wallets,
         user_evm_wallet=user_evm_wallet,
         rune_bridge_contract=rune_bridge_contract,
+        multicall_address=multicall_address,
         root_ord_wallet=root_ord_wallet,
         user_ord_wallet=user_ord_wallet,
     )
@@ -262,6 +269,7 @@ def runes_setup(
         federator_wirings = [
             wire_rune_bridge_for_federator(
                 rune_bridge_contract_address=rune_bridge_contract.address,
+                multicall_address=runes_module_setup.multicall_address,
                 evm_rpc_url=hardhat.rpc_url,
                 btc_rpc_wallet_url=bitcoind.get_wallet_rpc_url(multisig.name),
                 btc_num_required_signers=num_required_signers,
@@ -328,6 +336,7 @@ def wire_rune_bridge_for_federator(
     btc_rpc_wallet_url: str,
     ord_api_url: str,
     rune_bridge_contract_address: ChecksumAddress,
+    multicall_address: ChecksumAddress | None,
     btc_num_required_signers: int,
     evm_private_key: str | bytes,
     btc_master_xpriv: str | bytes,
@@ -365,6 +374,7 @@ def wire_rune_bridge_for_federator(
             runes_to_evm_fee_percentage_decimal=Decimal(0),
             btc_network="regtest",
             btc_base_derivation_path="m/13/0/0",
+            evm_multicall_address=multicall_address,
         ),
         secrets=RuneBridgeSecrets(
             evm_private_key=evm_private_key,
@@ -0,0 +1,30 @@
+import pytest
+
+from bridge.bridges.runes.config import RuneBridgeConfig
+from bridge.bridges.runes.evm import RUNE_TO_EVM_TRANSFER_BATCH_MAX_SIZE
+
+
+def create_config(**kwargs) -> RuneBridgeConfig:
+    return RuneBridgeConfig(
+        bridge_id="test-runebridge",
+        rune_bridge_contract_address="0x0000000000000000000000000000000000000001",
+        evm_rpc_url="http://localhost:8545",
+        btc_rpc_wallet_url="http://localhost:18443/wallet/test",
+        ord_api_url="http://localhost:80",
+        btc_num_required_signers=2,
+        btc_network="regtest",
+        btc_base_derivation_path="m/13/0/0",
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize("batch_size", [1, RUNE_TO_EVM_TRANSFER_BATCH_MAX_SIZE])
+def test_evm_transfer_batch_max_size_within_limits_is_accepted(batch_size):
+    config = create_config(evm_transfer_batch_max_size=batch_size)
+    assert config.evm_transfer_batch_max_size == batch_size
+
+
+@pytest.mark.parametrize("batch_size", [0, RUNE_TO_EVM_TRANSFER_BATCH_MAX_SIZE + 1])
+def test_evm_transfer_batch_max_size_out_of_range_is_rejected(batch_size):
+    with pytest.raises(ValueError, match="evm_transfer_batch_max_size"):
+        create_config(evm_transfer_batch_max_size=batch_size)
@@ -0,0 +1,140 @@
+from types import SimpleNamespace
+
+import pytest
+
+from bridge.bridges.runes.contract_state import RuneBridgeContractState
+
+FEDERATOR = "0x000000000000000000000000000000000000dEaD"
+NOT_FEDERATOR = "0x000000000000000000000000000000000000bEEF"
+
+
+class ContractCallStub:
+    def __init__(self, calls, name, value):
+        self._calls = calls
+        self._name = name
+        self._value = value
+
+    def call(self, block_identifier=None):
+        self._calls.append((self._name, block_identifier))
+        return self._value
+
+
+class RuneBridgeFunctionsStub:
+    def __init__(self):
+        self.calls = []
+        self.paused_runes = set()
+
+    def isFederator(self, address):  # noqa: N802
+        return ContractCallStub(self.calls, "isFederator", address == FEDERATOR)
+
+    def numRequiredFederators(self):  # noqa: N802
+        return ContractCallStub(self.calls, "numRequiredFederators", 2)
+
+    def frozen(self):
+        return ContractCallStub(self.calls, "frozen", False)
+
+    def isRuneRegistered(self, rune_number):  # noqa: N802
+        return ContractCallStub(self.calls, "isRuneRegistered", True)
+
+    def isRunePaused(self, rune_number):  # noqa: N802
+        return ContractCallStub(self.calls, "isRunePaused", rune_number in self.paused_runes)
+
+    def getTokenByRune(self, rune_number):  # noqa: N802
+        return ContractCallStub(self.calls, "getTokenByRune", f"token-{rune_number}")
+
+
+@pytest.fixture()
+def web3():
+    return SimpleNamespace(eth=SimpleNamespace(block_number=1))
+
+
+@pytest.fixture()
+def functions():
+    return RuneBridgeFunctionsStub()
+
+
+@pytest.fixture()
+def contract_state(web3, functions):
+    return RuneBridgeContractState(
+        web3=web3,
+        rune_bridge_contract=SimpleNamespace(functions=functions),
+        block_check_interval=60,
+    )
+
+
+def test_values_are_cached_within_a_block(contract_state, functions):
+    for _ in range(10):
+        assert contract_state.is_federator(FEDERATOR)
+        assert not contract_state.is_federator(NOT_FEDERATOR)
+        assert contract_state.get_num_required_federators() == 2
+        assert not contract_state.is_frozen()
+        assert contract_state.is_rune_registered(123)
+        assert not contract_state.is_rune_paused(123)
+        assert contract_state.get_token_by_rune(123) == "token-123"
+    assert sorted(functions.calls) == [
+        ("frozen", 1),
+        ("getTokenByRune", 1),
+        ("isFederator", 1),
+        ("isFederator", 1),
+        ("isRunePaused", 1),
+        ("isRuneRegistered", 1),
+        ("numRequiredFederators", 1),
+    ]
+
+
+def test_cache_is_cleared_on_new_block(contract_state, functions, web3):
+    assert not contract_state.is_rune_paused(123)
+    functions.paused_runes.add(123)
+    web3.eth.block_number = 2
+
+    # The block number is only checked every block_check_interval seconds...
+    assert not contract_state.is_rune_paused(123)
+    # ...or on refresh
+    contract_state.refresh()
+    assert contract_state.block_number == 2
+    assert contract_state.is_rune_paused(123)
+    assert functions.calls == [("isRunePaused", 1), ("isRunePaused", 2)]
+
+
+def test_block_number_is_checked_periodically(web3, functions):
+    contract_state = RuneBridgeContractState(
+        web3=web3,
+        rune_bridge_contract=SimpleNamespace(functions=functions),
+        block_check_interval=0,
+    )
+    assert contract_state.is_frozen() is False
+    web3.eth.block_number = 2
+    assert contract_state.is_frozen() is False
+    assert functions.calls == [("frozen", 1), ("frozen", 2)]
+
+
+def test_prefetched_values_are_cached(web3, functions):
+    class MulticallStub:
+        def __init__(self):
+            self.calls = []
+
+        def try_call(self, contract_functions, *, block_identifier=None):
+            self.calls.append(len(contract_functions))
+            return [(True, function.call(block_identifier=block_identifier)) for function in contract_functions]
+
+    multicall = MulticallStub()
+    contract_state = RuneBridgeContractState(
+        web3=web3,
+        rune_bridge_contract=SimpleNamespace(functions=functions),
+        multicall=multicall,
+        block_check_interval=60,
+    )
+    functions.paused_runes.add(456)
+    contract_state.prefetch_runes([123, 456, 123])
+    contract_state.prefetch_federators([FEDERATOR, NOT_FEDERATOR])
+    # Everything is cached already
+    contract_state.prefetch_runes([456])
+    assert multicall.calls == [6, 2]
+
+    num_calls = len(functions.calls)
+    assert contract_state.is_federator(FEDERATOR)
+    assert not contract_state.is_federator(NOT_FEDERATOR)
+    assert not contract_state.is_rune_paused(123)
+    assert contract_state.is_rune_paused(456)
+    assert contract_state.get_token_by_rune(456) == "token-456"
+    assert len(functions.calls) == num_calls
@@ -0,0 +1,68 @@
+import pytest
+
+from bridge.bridges.runes.deposit_addresses import DepositAddressIndex, DepositAddressOwner
+from bridge.bridges.runes.models import Bridge, DepositAddress, User
+
+EVM_ADDRESS = "0x000000000000000000000000000000000000dEaD"
+
+
+def create_deposit_address(dbsession, *, bridge_id, btc_address) -> User:
+    user = User(bridge_id=bridge_id, evm_address=EVM_ADDRESS)
+    dbsession.add(user)
+    dbsession.flush()
+    dbsession.add(DepositAddress(user_id=user.id, btc_address=btc_address))
+    dbsession.flush()
+    return user
+
+
+@pytest.fixture()
+def bridge_id(dbsession):
+    with dbsession.begin():
+        bridge = Bridge(name="runesrsk")
+        dbsession.add(bridge)
+        dbsession.flush()
+        return bridge.id
+
+
+def test_index_is_loaded_from_db(dbsession, bridge_id):
+    with dbsession.begin():
+        user = create_deposit_address(dbsession, bridge_id=bridge_id, btc_address="bcrt1qexisting")
+        user_id = user.id
+
+    index = DepositAddressIndex(bridge_id=bridge_id)
+    with dbsession.begin():
+        index.load(dbsession)
+        assert index.get_many(dbsession, ["bcrt1qexisting", "bcrt1qunknown"]) == {
+            "bcrt1qexisting": DepositAddressOwner(user_id=user_id, evm_address=EVM_ADDRESS),
+        }
+
+
+def test_addresses_are_added_on_commit(dbsession, bridge_id):
+    index = DepositAddressIndex(bridge_id=bridge_id)
+    with dbsession.begin():
+        index.load(dbsession)
+
+    with dbsession.begin():
+        user = create_deposit_address(dbsession, bridge_id=bridge_id, btc_address="bcrt1qcommitted")
+        owner = DepositAddressOwner(user_id=user.id, evm_address=EVM_ADDRESS)
+        index.add_on_commit(dbsession, "bcrt1qcommitted", owner)
+    assert index._owners == {"bcrt1qcommitted": owner}
+
+
+def test_rolled_back_addresses_are_not_added(dbsession, bridge_id):
+    index = DepositAddressIndex(bridge_id=bridge_id)
+    with dbsession.begin():
+        index.load(dbsession)
+
+    dbsession.begin()
+    user = create_deposit_address(dbsession, bridge_id=bridge_id, btc_address="bcrt1qrolledback")
+    index.add_on_commit(
+        dbsession,
+        "bcrt1qrolledback",
+        DepositAddressOwner(user_id=user.id, evm_address=EVM_ADDRESS),
+    )
+    dbsession.rollback()
+    assert index._owners == {}
+
+    with dbsession.begin():
+        assert index.get(dbsession, "bcrt1qrolledback") is None
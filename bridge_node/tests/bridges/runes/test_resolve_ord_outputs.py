@@ -0,0 +1,144 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from bridge.bridges.runes.service import RuneBridgeService
+
+
+class OrdClientStub:
+    def __init__(self, outputs):
+        # (txid, vout) -> list of responses, returned in order (last one repeated)
+        self.outputs = outputs
+        self.calls = []
+        self.max_concurrent_calls = 0
+        self._concurrent_calls = 0
+        self._lock = threading.Lock()
+        self._barrier = threading.Barrier(2, timeout=5)
+
+    def get_output(self, txid, vout):
+        with self._lock:
+            self.calls.append((txid, vout))
+            num_calls = len([c for c in self.calls if c == (txid, vout)])
+            self._concurrent_calls += 1
+            self.max_concurrent_calls = max(self.max_concurrent_calls, self._concurrent_calls)
+        try:
+            if len(self.calls) <= 2:
+                # The first two requests wait for each other, which only works if they are made concurrently
+                self._barrier.wait()
+            responses = self.outputs[(txid, vout)]
+            return responses[min(num_calls, len(responses)) - 1]
+        finally:
+            with self._lock:
+                self._concurrent_calls -= 1
+
+
+def output(*, indexed=True, spent=False):
+    return {
+        "indexed": indexed,
+        "spent": spent,
+        "runes": [],
+    }
+
+
+def create_service(ord_client, *, concurrency=4):
+    service = RuneBridgeService(
+        config=SimpleNamespace(
+            bridge_id="test-runes",
+            btc_network="regtest",
+            evm_multicall_address=None,
+            ord_output_resolution_concurrency=concurrency,
+        ),
+        transaction_manager=None,
+        bitcoin_rpc=None,
+        ord_client=ord_client,
+        ord_multisig=None,
+        evm_account=SimpleNamespace(address="0x000000000000000000000000000000000000dEaD"),
+        web3=SimpleNamespace(eth=SimpleNamespace(block_number=1)),
+        rune_bridge_contract=None,
+        nonce_manager=object(),
+    )
+    service.sleeps = []
+    service._sleep = service.sleeps.append
+    return service
+
+
+def test_resolve_ord_outputs_concurrently():
+    indexed_a = output()
+    indexed_b = output()
+    ord_client = OrdClientStub(
+        {
+            ("aa", 0): [indexed_a],
+            ("bb", 1): [indexed_b],
+        }
+    )
+    service = create_service(ord_client)
+
+    ret = service._resolve_ord_outputs([("aa", 0), ("bb", 1), ("aa", 0)])
+
+    assert ret == {("aa", 0): indexed_a, ("bb", 1): indexed_b}
+    # Duplicates are only requested once
+    assert sorted(ord_client.calls) == [("aa", 0), ("bb", 1)]
+    assert ord_client.max_concurrent_calls == 2
+    assert service.sleeps == []
+
+
+def test_resolve_ord_outputs_retries_only_unindexed_outputs():
+    indexed = output()
+    ord_client = OrdClientStub(
+        {
+            ("aa", 0): [indexed],
+            ("bb", 0): [output(indexed=False), output(indexed=False), output()],
+            ("cc", 0): [output(indexed=False), output()],
+        }
+    )
+    service = create_service(ord_client)
+
+    ret = service._resolve_ord_outputs([("aa", 0), ("bb", 0), ("cc", 0)])
+
+    assert ret == {("aa", 0): indexed, ("bb", 0): output(), ("cc", 0): output()}
+    assert ord_client.calls.count(("aa", 0)) == 1
+    assert ord_client.calls.count(("bb", 0)) == 3
+    assert ord_client.calls.count(("cc", 0)) == 2
+    assert service.sleeps == [0, 1]
+
+
+def test_resolve_ord_outputs_unindexed_spent_output_is_none():
+    indexed = output()
+    ord_client = OrdClientStub(
+        {
+            ("aa", 0): [indexed],
+            ("bb", 0): [output(indexed=False, spent=True)],
+        }
+    )
+    service = create_service(ord_client)
+
+    ret = service._resolve_ord_outputs([("aa", 0), ("bb", 0)])
+
+    assert ret == {("aa", 0): indexed, ("bb", 0): None}
+    assert ord_client.calls.count(("bb", 0)) == 1
+    assert service.sleeps == []
+
+
+def test_resolve_ord_outputs_gives_up_after_retries():
+    ord_client = OrdClientStub(
+        {
+            ("aa", 0): [output()],
+            ("bb", 0): [output(indexed=False)],
+        }
+    )
+    service = create_service(ord_client)
+
+    with pytest.raises(RuntimeError, match="not indexed in ord after 3 tries"):
+        service._resolve_ord_outputs([("aa", 0), ("bb", 0)], retries=3)
+
+    assert ord_client.calls.count(("aa", 0)) == 1
+    assert ord_client.calls.count(("bb", 0)) == 3
+
+
+def test_resolve_ord_outputs_empty():
+    ord_client = OrdClientStub({})
+    service = create_service(ord_client)
+
+    assert service._resolve_ord_outputs([]) == {}
+    assert ord_client.calls == []
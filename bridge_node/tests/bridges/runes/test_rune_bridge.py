@@ -4,6 +4,15 @@ from decimal import Decimal
 
 import pytest
 
+from bridge.bridges.runes.models import (
+    DepositAddressPoolEntry,
+    RuneDeposit,
+    RuneDepositStatus,
+    RuneTokenDeposit,
+    RuneTokenDepositStatus,
+    User,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -138,6 +147,78 @@ def test_multiple_runes_can_be_transferred(
     bridge_util.assert_runes_transferred_to_evm(transfer_b)
 
 
+def test_runes_can_be_transferred_to_evm_in_batches(
+    bridge_util,
+    user_ord_wallet,
+    user_evm_wallet,
+    rune_bridge_service,
+    dbsession,
+    monkeypatch,
+):
+    monkeypatch.setattr(rune_bridge_service.config, "evm_transfer_batch_max_size", 5)
+    rune = bridge_util.etch_and_register_test_rune(
+        prefix="EVMBATCH",
+        fund=(user_ord_wallet, 3000),
+    )
+
+    deposit_address = bridge_util.get_deposit_address(user_evm_wallet.address)
+    transfers = [
+        bridge_util.transfer_runes_to_evm(
+            wallet=user_ord_wallet,
+            amount_decimal=1000,
+            deposit_address=deposit_address,
+            rune=rune,
+        )
+        for _ in range(3)
+    ]
+
+    bridge_util.run_bridge_iteration()
+
+    for transfer in transfers:
+        bridge_util.assert_runes_transferred_to_evm(transfer)
+    # All transfers were sent in the same EVM transaction
+    deposits = dbsession.query(RuneDeposit).all()
+    assert len(deposits) == 3
+    assert len({deposit.evm_tx_hash for deposit in deposits}) == 1
+    # ...and all of them were confirmed from the single receipt
+    assert {deposit.status for deposit in deposits} == {RuneDepositStatus.CONFIRMED_IN_EVM}
+
+
+def test_rune_to_evm_transfer_signatures_can_be_asked_in_batches(
+    bridge_util,
+    user_ord_wallet,
+    user_evm_wallet,
+    rune_bridge_service,
+    dbsession,
+    monkeypatch,
+):
+    monkeypatch.setattr(rune_bridge_service.config, "evm_sign_batch_max_size", 5)
+    rune = bridge_util.etch_and_register_test_rune(
+        prefix="SIGNBATCH",
+        fund=(user_ord_wallet, 3000),
+    )
+
+    deposit_address = bridge_util.get_deposit_address(user_evm_wallet.address)
+    transfers = [
+        bridge_util.transfer_runes_to_evm(
+            wallet=user_ord_wallet,
+            amount_decimal=1000,
+            deposit_address=deposit_address,
+            rune=rune,
+        )
+        for _ in range(3)
+    ]
+
+    bridge_util.run_bridge_iteration()
+
+    for transfer in transfers:
+        bridge_util.assert_runes_transferred_to_evm(transfer)
+    # The signatures were asked in one batch, but the transfers were still sent one by one
+    deposits = dbsession.query(RuneDeposit).all()
+    assert len(deposits) == 3
+    assert len({deposit.evm_tx_hash for deposit in deposits}) == 3
+
+
 def test_runes_can_be_transferred_sequentially(
     bridge_util,
     user_ord_wallet,
@@ -327,6 +408,96 @@ def test_runes_can_be_transferred_simultaneously(
     )
 
 
+def test_rune_tokens_can_be_transferred_to_btc_in_batches(
+    bridge_util,
+    user_ord_wallet,
+    user_evm_wallet,
+    rune_bridge_service,
+    dbsession,
+    monkeypatch,
+):
+    rune = bridge_util.etch_and_register_test_rune(
+        prefix="BATCHED",
+        fund=(user_ord_wallet, 5000),
+    )
+    deposit_address = bridge_util.get_deposit_address(user_evm_wallet.address)
+    bridge_util.transfer_runes_to_evm(
+        wallet=user_ord_wallet,
+        amount_decimal=5000,
+        deposit_address=deposit_address,
+        rune=rune,
+    )
+    bridge_util.run_bridge_iteration()
+
+    monkeypatch.setattr(rune_bridge_service.config, "btc_transfer_batch_max_size", 3)
+    transfers = [
+        bridge_util.transfer_rune_tokens_to_btc(
+            sender=user_evm_wallet,
+            receiver_wallet=user_ord_wallet,
+            amount_decimal=1000,
+            rune=rune,
+        )
+        for _ in range(3)
+    ]
+    bridge_util.run_bridge_iteration()
+
+    for transfer in transfers:
+        bridge_util.assert_rune_tokens_transferred_to_btc(transfer)
+    # All transfers were sent in the same Bitcoin transaction
+    deposits = dbsession.query(RuneTokenDeposit).all()
+    assert len(deposits) == 3
+    assert len({deposit.btc_tx_id for deposit in deposits}) == 1
+
+
+def test_rune_token_deposits_with_zero_net_amount_are_rejected_from_batches(
+    bridge_util,
+    user_ord_wallet,
+    user_evm_wallet,
+    rune_bridge_service,
+    dbsession,
+    monkeypatch,
+):
+    rune = bridge_util.etch_and_register_test_rune(
+        prefix="ZEROBATCH",
+        fund=(user_ord_wallet, 5000),
+    )
+    deposit_address = bridge_util.get_deposit_address(user_evm_wallet.address)
+    bridge_util.transfer_runes_to_evm(
+        wallet=user_ord_wallet,
+        amount_decimal=5000,
+        deposit_address=deposit_address,
+        rune=rune,
+    )
+    bridge_util.run_bridge_iteration()
+
+    monkeypatch.setattr(rune_bridge_service.config, "btc_transfer_batch_max_size", 3)
+    transfers = [
+        bridge_util.transfer_rune_tokens_to_btc(
+            sender=user_evm_wallet,
+            receiver_wallet=user_ord_wallet,
+            amount_decimal=1000,
+            rune=rune,
+        )
+        for _ in range(2)
+    ]
+    rune_bridge_service.scan_rune_token_deposits()
+    with dbsession.begin():
+        zero_deposit = dbsession.query(RuneTokenDeposit).order_by(RuneTokenDeposit.id).first()
+        zero_deposit.net_rune_amount_raw = 0
+        zero_deposit_id = zero_deposit.id
+
+    bridge_util.run_bridge_iteration()
+
+    bridge_util.assert_rune_tokens_transferred_to_btc(transfers[1])
+    dbsession.expire_all()
+    assert dbsession.get(RuneTokenDeposit, zero_deposit_id).status == RuneTokenDepositStatus.REJECTED
+    # The rejected deposit is not picked again
+    assert all(
+        zero_deposit_id not in deposit_ids
+        for deposit_ids in rune_bridge_service.get_accepted_rune_token_deposit_id_batches()
+    )
+
+
 @pytest.mark.parametrize(
     "enable_bob,enable_carol,expected_transfer_happened",
     [
@@ -699,6 +870,43 @@ def test_ord_indexing(
     assert bitcoind.rpc.call("getblockcount") == block_number + 1
 
 
+def test_deposit_addresses_are_claimed_from_the_pool(
+    bridge_util,
+    user_ord_wallet,
+    user_evm_wallet,
+    rune_bridge_service,
+    bridge_ord_multisig,
+    dbsession,
+    monkeypatch,
+):
+    monkeypatch.setattr(rune_bridge_service.config, "deposit_address_pool_size", 3)
+    assert rune_bridge_service.refill_deposit_address_pool() == 3
+    assert rune_bridge_service.refill_deposit_address_pool() == 0
+
+    deposit_address = bridge_util.get_deposit_address(user_evm_wallet.address)
+    with dbsession.begin():
+        user = dbsession.query(User).filter_by(evm_address=user_evm_wallet.address).one()
+        # The pool index is the user id, like for addresses derived on demand
+        assert deposit_address == bridge_ord_multisig.derive_address(user.id)
+        assert dbsession.query(DepositAddressPoolEntry).count() == 2
+    # Same user, same address
+    assert bridge_util.get_deposit_address(user_evm_wallet.address) == deposit_address
+    assert rune_bridge_service.refill_deposit_address_pool() == 1
+
+    rune = bridge_util.etch_and_register_test_rune(
+        prefix="POOLED",
+        fund=(user_ord_wallet, 1000),
+    )
+    transfer = bridge_util.transfer_runes_to_evm(
+        wallet=user_ord_wallet,
+        amount_decimal=1000,
+        deposit_address=deposit_address,
+        rune=rune,
+    )
+    bridge_util.run_bridge_iteration()
+    bridge_util.assert_runes_transferred_to_evm(transfer)
+
+
 def test_get_pending_deposits_for_evm_address(
     bridge_util,
     user_ord_wallet,
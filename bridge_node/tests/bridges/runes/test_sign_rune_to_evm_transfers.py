@@ -0,0 +1,80 @@
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from bridge.bridges.runes import messages
+from bridge.bridges.runes.service import RuneBridgeService, ValidationError
+
+
+def create_transfer(txid):
+    return messages.RuneToEvmTransfer(
+        evm_address="0x000000000000000000000000000000000000bEEF",
+        amount_raw=1000,
+        amount_decimal=Decimal("0.000000000000001"),
+        net_amount_raw=996,
+        txid=txid,
+        vout=0,
+        rune_name="AAAAAA",
+        rune_number=1,
+    )
+
+
+@pytest.fixture()
+def service():
+    service = RuneBridgeService(
+        config=SimpleNamespace(
+            bridge_id="test-runes",
+            btc_network="regtest",
+            evm_multicall_address=None,
+        ),
+        transaction_manager=None,
+        bitcoin_rpc=None,
+        ord_client=None,
+        ord_multisig=None,
+        evm_account=SimpleNamespace(address="0x000000000000000000000000000000000000dEaD"),
+        web3=SimpleNamespace(eth=SimpleNamespace(block_number=1)),
+        rune_bridge_contract=None,
+        nonce_manager=object(),
+    )
+    service.contract_state = SimpleNamespace(prefetch_runes=list)
+
+    def answer_sign_rune_to_evm_transfer_question(message):
+        txid = message.transfer.txid
+        if txid == "invalid":
+            raise ValidationError("invalid transfer")
+        if txid == "poison":
+            raise KeyError("poison")
+        return messages.SignRuneToEvmTransferAnswer(
+            signature=f"signature-{txid}",
+            signer=service.evm_account.address,
+            message_hash=f"hash-{txid}",
+        )
+
+    service.answer_sign_rune_to_evm_transfer_question = answer_sign_rune_to_evm_transfer_question
+    return service
+
+
+def test_all_transfers_are_signed(service):
+    answer = service.answer_sign_rune_to_evm_transfers_question(
+        message=messages.SignRuneToEvmTransfersQuestion(
+            transfers=[create_transfer("aa"), create_transfer("bb")],
+        ),
+    )
+    assert [a.signature for a in answer.answers] == ["signature-aa", "signature-bb"]
+    assert answer.errors == [None, None]
+
+
+def test_failing_transfers_dont_prevent_signing_the_others(service):
+    answer = service.answer_sign_rune_to_evm_transfers_question(
+        message=messages.SignRuneToEvmTransfersQuestion(
+            transfers=[
+                create_transfer("aa"),
+                create_transfer("poison"),
+                create_transfer("bb"),
+                create_transfer("invalid"),
+            ],
+        ),
+    )
+    assert [a.signature if a else None for a in answer.answers] == ["signature-aa", None, "signature-bb", None]
+    assert answer.errors == [None, "KeyError: 'poison'", None, "invalid transfer"]
@@ -0,0 +1,55 @@
+import pytest
+
+from bridge.common.evm.multicall import Multicall, MulticallError
+from bridge.common.evm.utils import load_abi
+
+NOT_A_CONTRACT = "0x000000000000000000000000000000000000dEaD"
+
+
+@pytest.fixture(scope="module")
+def multicall_address(hardhat):
+    return hardhat.run_json_command("deploy-multicall3")["address"]
+
+
+@pytest.fixture(scope="module")
+def test_token(hardhat):
+    address = hardhat.run_json_command("deploy-testtoken", "--supply", "1000")["address"]
+    return hardhat.web3.eth.contract(address=address, abi=load_abi("TestToken"))
+
+
+@pytest.fixture(params=["multicall", "sequential"])
+def multicall(request, hardhat, multicall_address):
+    return Multicall(
+        web3=hardhat.web3,
+        address=multicall_address if request.param == "multicall" else None,
+        max_calls_per_request=2,
+    )
+
+
+def test_call(multicall, test_token):
+    assert multicall.call(
+        [
+            test_token.functions.name(),
+            test_token.functions.symbol(),
+            test_token.functions.decimals(),
+            test_token.functions.totalSupply(),
+            test_token.functions.balanceOf(NOT_A_CONTRACT),
+        ]
+    ) == ["TestToken", "TT", 18, 1000 * 10**18, 0]
+
+
+def test_call_empty(multicall):
+    assert multicall.call([]) == []
+
+
+def test_try_call_failures(multicall, test_token, hardhat):
+    not_a_token = hardhat.web3.eth.contract(address=NOT_A_CONTRACT, abi=load_abi("TestToken"))
+    functions = [
+        test_token.functions.symbol(),
+        not_a_token.functions.symbol(),
+        # Reverts
+        test_token.functions.transferFrom(NOT_A_CONTRACT, NOT_A_CONTRACT, 1),
+    ]
+    assert multicall.try_call(functions) == [(True, "TT"), (False, None), (False, None)]
+    with pytest.raises(MulticallError):
+        multicall.call(functions)
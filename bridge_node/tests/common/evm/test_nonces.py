@@ -0,0 +1,138 @@
+import pytest
+
+from bridge.common.evm.nonces import NonceManager
+
+ADDRESS = "0x0000000000000000000000000000000000000001"
+
+
+class EthStub:
+    def __init__(self):
+        self.current_gas_price = 10
+        self.balance = 10**18
+        self.transaction_counts = {"latest": 5, "pending": 6}
+        self.calls = []
+
+    @property
+    def gas_price(self):
+        self.calls.append("gas_price")
+        return self.current_gas_price
+
+    def get_balance(self, address, block_identifier):
+        self.calls.append("get_balance")
+        return self.balance
+
+    def get_transaction_count(self, address, block_identifier):
+        self.calls.append(f"get_transaction_count:{block_identifier}")
+        return self.transaction_counts[block_identifier]
+
+
+class Web3Stub:
+    def __init__(self):
+        self.eth = EthStub()
+
+
+@pytest.fixture()
+def web3():
+    return Web3Stub()
+
+
+@pytest.fixture()
+def nonce_manager(web3):
+    return NonceManager(web3=web3, address=ADDRESS)
+
+
+def test_nonces_are_assigned_locally(web3, nonce_manager):
+    nonces = []
+    for _ in range(3):
+        with nonce_manager.transaction_params(gas_limit=100_000) as tx_params:
+            assert tx_params["gas"] == 100_000
+            assert tx_params["gasPrice"] == 10
+            nonces.append(tx_params["nonce"])
+
+    assert nonces == [6, 7, 8]
+    assert sorted(web3.eth.calls) == [
+        "gas_price",
+        "get_balance",
+        "get_transaction_count:latest",
+        "get_transaction_count:pending",
+    ]
+
+
+def test_refresh_syncs_with_node(web3, nonce_manager):
+    with nonce_manager.transaction_params(gas_limit=100_000) as tx_params:
+        assert tx_params["nonce"] == 6
+
+    web3.eth.transaction_counts = {"latest": 10, "pending": 10}
+    web3.eth.current_gas_price = 20
+    nonce_manager.refresh()
+    with nonce_manager.transaction_params(gas_limit=100_000) as tx_params:
+        assert tx_params["nonce"] == 10
+        assert tx_params["gasPrice"] == 20
+
+
+def test_failed_transaction_does_not_use_up_nonce(web3, nonce_manager):
+    with pytest.raises(ValueError):
+        with nonce_manager.transaction_params(gas_limit=100_000) as tx_params:
+            assert tx_params["nonce"] == 6
+            raise ValueError("nonce too low")
+
+    web3.eth.transaction_counts = {"latest": 7, "pending": 7}
+    with nonce_manager.transaction_params(gas_limit=100_000) as tx_params:
+        assert tx_params["nonce"] == 7
+
+
+def test_number_of_pending_transactions_is_limited(web3, nonce_manager):
+    for _ in range(3):
+        with nonce_manager.transaction_params(gas_limit=100_000):
+            pass
+
+    with pytest.raises(RuntimeError, match="pending transactions"):
+        with nonce_manager.transaction_params(gas_limit=100_000):
+            pass
+
+    # One got mined
+    web3.eth.transaction_counts["latest"] = 6
+    with nonce_manager.transaction_params(gas_limit=100_000) as tx_params:
+        assert tx_params["nonce"] == 9
+
+
+def test_insufficient_balance(web3, nonce_manager):
+    web3.eth.balance = 3_100_000
+    with nonce_manager.transaction_params(gas_limit=100_000):
+        pass
+    with nonce_manager.transaction_params(gas_limit=100_000):
+        pass
+
+    # The balance spent on the previous transactions is taken into account
+    with pytest.raises(RuntimeError, match="Insufficient balance"):
+        with nonce_manager.transaction_params(gas_limit=100_000):
+            pass
+
+
+def test_batch_larger_than_max_pending_transactions_can_be_sent(web3, nonce_manager):
+    num_transactions = nonce_manager.max_pending_transactions * 2 + 2
+    nonce_manager.check_balance(gas_limit=100_000 * num_transactions)
+
+    nonces = []
+    for _ in range(num_transactions):
+        with nonce_manager.transaction_params(gas_limit=100_000, limit_pending=False) as tx_params:
+            nonces.append(tx_params["nonce"])
+
+    assert nonces == list(range(6, 6 + num_transactions))
+    # The limit still applies to other transactions
+    with pytest.raises(RuntimeError, match="pending transactions"):
+        with nonce_manager.transaction_params(gas_limit=100_000):
+            pass
+
+
+def test_balance_is_checked_for_the_whole_batch(web3, nonce_manager):
+    web3.eth.balance = 10_000_000
+    nonce_manager.check_balance(gas_limit=100_000 * 8)
+    with pytest.raises(RuntimeError, match="Insufficient balance"):
+        nonce_manager.check_balance(gas_limit=100_000 * 10)
+
+    with nonce_manager.transaction_params(gas_limit=100_000 * 8, limit_pending=False):
+        pass
+    # The balance spent on the previous transactions is taken into account
+    with pytest.raises(RuntimeError, match="Insufficient balance"):
+        nonce_manager.check_balance(gas_limit=100_000 * 2)
@@ -0,0 +1,168 @@
+import pytest
+
+from bridge.common.evm.scanner import EvmEventScanner
+from tests.utils.evm import create_fake_logs_web3
+
+
+class DictKeyValueStore:
+    def __init__(self):
+        self.values = {}
+
+    def get_value(self, key, default_value):
+        return self.values.get(key, default_value)
+
+    def set_value(self, key, value):
+        self.values[key] = value
+
+
+@pytest.fixture()
+def fake_chain():
+    web3, provider, contract = create_fake_logs_web3()
+    foo_abi = contract.events.Foo._get_event_abi()
+    bar_abi = contract.events.Bar._get_event_abi()
+    provider.add_log(event_abi=foo_abi, block_number=5, counter=1, message="first")
+    provider.add_log(event_abi=bar_abi, block_number=6, amount=2)
+    provider.add_log(event_abi=foo_abi, block_number=150, counter=2, message="second")
+    return web3, provider, contract
+
+
+def create_scanner(web3, contract, key_value_store, callback, **kwargs):
+    return EvmEventScanner(
+        web3=web3,
+        events=[contract.events.Foo, contract.events.Bar],
+        callback=callback,
+        dbsession=None,
+        block_safety_margin=0,
+        key_value_store=key_value_store,
+        key_value_store_namespace="test",
+        default_start_block=0,
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize("single_query", [True, False])
+def test_scan_new_events(fake_chain, single_query):
+    web3, provider, contract = fake_chain
+    key_value_store = DictKeyValueStore()
+    scanned = []
+    scanner = create_scanner(web3, contract, key_value_store, scanned.extend, single_query=single_query)
+
+    scanner.scan_new_events()
+    assert [e["event"] for e in scanned] == ["Foo", "Bar", "Foo"]
+    assert key_value_store.values["test:evm:events:last-scanned-block"] == 150
+    assert key_value_store.values["evm:31337:get-logs:block-range-size"] == 200
+    assert len(provider.get_logs_requests) == (2 if single_query else 3)
+
+    scanned.clear()
+    provider.block_number = 160
+    scanner.scan_new_events()
+    assert scanned == []
+    assert key_value_store.values["test:evm:events:last-scanned-block"] == 160
+
+
+def test_scan_new_events_in_chunks(fake_chain):
+    web3, provider, contract = fake_chain
+    key_value_store = DictKeyValueStore()
+    callback_calls = []
+    scanner = create_scanner(web3, contract, key_value_store, callback_calls.append)
+
+    assert scanner.scan_new_events(max_blocks=100) is False
+    assert [[e["event"] for e in events] for events in callback_calls] == [["Foo", "Bar"]]
+    assert key_value_store.values["test:evm:events:last-scanned-block"] == 100
+
+    assert scanner.scan_new_events(max_blocks=100) is True
+    assert [[e["blockNumber"] for e in events] for events in callback_calls[1:]] == [[150]]
+    assert key_value_store.values["test:evm:events:last-scanned-block"] == 150
+
+    assert scanner.scan_new_events(max_blocks=100) is True
+    assert len(callback_calls) == 2
+    assert provider.num_chain_id_requests == 1
+
+
+def test_chain_id_can_be_passed_in(fake_chain):
+    web3, provider, contract = fake_chain
+    key_value_store = DictKeyValueStore()
+    scanner = create_scanner(web3, contract, key_value_store, lambda events: None, chain_id=1234)
+    scanner.scan_new_events()
+    assert provider.num_chain_id_requests == 0
+    assert "evm:1234:get-logs:block-range-size" in key_value_store.values
+
+
+def test_block_range_size_is_shared_per_chain(fake_chain):
+    web3, provider, contract = fake_chain
+    key_value_store = DictKeyValueStore()
+    key_value_store.values["evm:31337:get-logs:block-range-size"] = 1000
+    scanner = create_scanner(web3, contract, key_value_store, lambda events: None)
+    scanner.scan_new_events()
+    assert len(provider.get_logs_requests) == 1
+    assert key_value_store.values["evm:31337:get-logs:block-range-size"] == 1000
+
+
+@pytest.mark.parametrize("single_query", [True, False])
+def test_pipelined_scan(single_query):
+    web3, provider, contract = create_fake_logs_web3()
+    foo_abi = contract.events.Foo._get_event_abi()
+    bar_abi = contract.events.Bar._get_event_abi()
+    for block_number in range(1, 1001, 7):
+        provider.add_log(event_abi=foo_abi, block_number=block_number, counter=block_number, message="")
+        provider.add_log(event_abi=bar_abi, block_number=block_number, log_index=1, amount=block_number)
+    provider.block_number = 1000
+
+    key_value_store = DictKeyValueStore()
+    key_value_store.values["evm:31337:get-logs:block-range-size"] = 50
+    callback_calls = []
+
+    def callback(events):
+        callback_calls.append(
+            (
+                [e["blockNumber"] for e in events],
+                key_value_store.values.get("test:evm:events:last-scanned-block"),
+            )
+        )
+
+    scanner = create_scanner(
+        web3,
+        contract,
+        key_value_store,
+        callback,
+        single_query=single_query,
+        max_block_range_size=50,
+        prefetch_concurrency=4,
+    )
+    scanner.scan_new_events()
+
+    assert len(callback_calls) == 20
+    scanned_blocks = [block_number for block_numbers, _ in callback_calls for block_number in block_numbers]
+    assert scanned_blocks == [block_number for block_number in range(1, 1001, 7) for _ in range(2)]
+    # checkpoint is stored after each range
+    assert [last_scanned_block for _, last_scanned_block in callback_calls] == [None] + list(range(50, 1000, 50))
+    assert key_value_store.values["test:evm:events:last-scanned-block"] == 1000
+
+
+def test_pipelined_scan_stops_at_errors(mocker):
+    web3, provider, contract = create_fake_logs_web3(block_number=1000)
+    mocker.patch("bridge.common.evm.utils.time.sleep")
+    key_value_store = DictKeyValueStore()
+    key_value_store.values["evm:31337:get-logs:block-range-size"] = 100
+    scanned_ranges = []
+
+    original_fetch_logs = EvmEventScanner._fetch_logs
+
+    def fetch_logs(self, from_block, to_block):
+        if from_block > 500:
+            raise ValueError("bad node")
+        scanned_ranges.append((from_block, to_block))
+        return original_fetch_logs(self, from_block, to_block)
+
+    mocker.patch.object(EvmEventScanner, "_fetch_logs", fetch_logs)
+    scanner = create_scanner(
+        web3,
+        contract,
+        key_value_store,
+        lambda events: None,
+        max_block_range_size=100,
+        prefetch_concurrency=4,
+    )
+    with pytest.raises(ValueError):
+        scanner.scan_new_events()
+    assert key_value_store.values["test:evm:events:last-scanned-block"] == 500
@@ -0,0 +1,113 @@
+import pytest
+import requests
+
+from bridge.common.evm.utils import (
+    BlockRangeWindow,
+    get_events,
+    get_logs_for_events,
+    is_block_range_too_large_error,
+)
+from tests.utils.evm import create_fake_logs_web3
+
+
+@pytest.fixture()
+def fake_chain():
+    web3, provider, contract = create_fake_logs_web3()
+    foo_abi = contract.events.Foo._get_event_abi()
+    bar_abi = contract.events.Bar._get_event_abi()
+    provider.add_log(event_abi=bar_abi, block_number=5, log_index=1, amount=2)
+    provider.add_log(event_abi=foo_abi, block_number=5, log_index=0, counter=1, message="first")
+    provider.add_log(event_abi=foo_abi, block_number=150, log_index=0, counter=2, message="second")
+    provider.add_log(event_abi=bar_abi, block_number=250, log_index=0, amount=3)
+    return provider, contract
+
+
+def test_get_events(fake_chain):
+    provider, contract = fake_chain
+    events = get_events(event=contract.events.Foo, from_block=1, to_block=300, window=BlockRangeWindow(max_size=100))
+    assert [e["args"]["counter"] for e in events] == [1, 2]
+    assert len(provider.get_logs_requests) == 3
+
+
+def test_get_logs_for_events_uses_one_query_per_batch(fake_chain):
+    provider, contract = fake_chain
+    events = get_logs_for_events(
+        events=[contract.events.Foo, contract.events.Bar],
+        from_block=1,
+        to_block=300,
+        window=BlockRangeWindow(max_size=100),
+    )
+    assert [e["event"] for e in events] == ["Foo", "Bar", "Foo", "Bar"]
+    assert [e["blockNumber"] for e in events] == [5, 5, 150, 250]
+    assert events[0]["args"] == {"counter": 1, "message": "first"}
+    assert events[1]["args"] == {"amount": 2}
+    assert len(provider.get_logs_requests) == 3
+    assert all(len(request["topics"][0]) == 2 for request in provider.get_logs_requests)
+
+
+def test_get_logs_for_events_requires_same_contract(fake_chain):
+    provider, contract = fake_chain
+    other_contract = contract.w3.eth.contract(address="0x" + "22" * 20, abi=contract.abi)
+    with pytest.raises(ValueError):
+        get_logs_for_events(
+            events=[contract.events.Foo, other_contract.events.Bar],
+            from_block=1,
+            to_block=300,
+        )
+
+
+def test_block_range_window_grows_when_responses_are_small(fake_chain):
+    provider, contract = fake_chain
+    window = BlockRangeWindow(initial_size=10, max_size=1000)
+    events = get_events(event=contract.events.Foo, from_block=1, to_block=1000, window=window)
+    assert [e["args"]["counter"] for e in events] == [1, 2]
+    ranges = [(int(r["fromBlock"], 16), int(r["toBlock"], 16)) for r in provider.get_logs_requests]
+    assert ranges == [(1, 10), (11, 30), (31, 70), (71, 150), (151, 310), (311, 630), (631, 1000)]
+    assert window.size == 640
+
+
+def test_block_range_window_shrinks_when_there_are_too_many_results():
+    web3, provider, contract = create_fake_logs_web3()
+    foo_abi = contract.events.Foo._get_event_abi()
+    for block_number in range(1, 101):
+        provider.add_log(event_abi=foo_abi, block_number=block_number, counter=block_number, message="")
+    provider.max_results = 10
+
+    window = BlockRangeWindow(initial_size=100)
+    events = get_events(event=contract.events.Foo, from_block=1, to_block=100, window=window)
+    assert [e["args"]["counter"] for e in events] == list(range(1, 101))
+    assert window.size <= 10
+    assert len(provider.get_logs_requests) < 30, "the window should not keep growing back to rejected sizes"
+
+
+def test_other_errors_are_retried_with_backoff(fake_chain, mocker):
+    provider, contract = fake_chain
+    sleep = mocker.patch("bridge.common.evm.utils.time.sleep")
+    provider.num_errors_to_return = 3
+    window = BlockRangeWindow(initial_size=1000)
+    events = get_events(event=contract.events.Foo, from_block=1, to_block=300, window=window)
+    assert [e["args"]["counter"] for e in events] == [1, 2]
+    assert [call.args[0] for call in sleep.call_args_list] == [1, 2, 4]
+    assert window.size == 1000, "generic errors should not shrink the window"
+
+    provider.num_errors_to_return = 100
+    with pytest.raises(ValueError):
+        get_events(event=contract.events.Foo, from_block=1, to_block=300, window=window)
+
+
+@pytest.mark.parametrize(
+    "error,expected",
+    [
+        (ValueError({"code": -32005, "message": "limit exceeded"}), True),
+        (ValueError({"code": -32000, "message": "query returned more than 10000 results"}), True),
+        (ValueError({"code": -32000, "message": "Log response size exceeded. You can make eth_getLogs ..."}), True),
+        (ValueError({"code": -32000, "message": "exceed maximum block range: 5000"}), True),
+        (requests.ReadTimeout(), True),
+        (ValueError({"code": -32000, "message": "internal error"}), False),
+        (ValueError({"code": -32000, "message": "invalid block range params"}), False),
+        (ValueError({"code": -32000, "message": "execution timeout"}), False),
+        (ValueError("header not found"), False),
+    ],
+)
+def test_is_block_range_too_large_error(error, expected):
+    assert is_block_range_too_large_error(error) == expected
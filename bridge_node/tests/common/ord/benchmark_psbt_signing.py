@@ -0,0 +1,104 @@
+"""
+Measure how long a federator takes to sign Rune PSBTs, with and without parallel signing of the inputs.
+
+Run with: python -m tests.common.ord.benchmark_psbt_signing
+"""
+
+import time
+
+from bitcointx.core import COutPoint, CTxIn, CTxOut
+from bitcointx.core.key import BIP32Path
+from bitcointx.core.psbt import PartiallySignedTransaction as PSBT
+from bitcointx.core.psbt import PSBT_Input, PSBT_KeyDerivationInfo, PSBT_Output
+from bitcointx.core.script import standard_multisig_redeem_script
+from bitcointx.wallet import CCoinExtKey, P2WSHBitcoinAddress
+
+from bridge.common.ord.multisig import OrdMultisig
+from bridge.common.ord.transfers import TARGET_POSTAGE_SAT
+
+BASE_DERIVATION_PATH = "m/13/0/0"
+NUM_SIGNERS = 3
+NUM_REQUIRED_SIGNERS = 2
+
+
+def create_multisig() -> tuple[OrdMultisig, list[CCoinExtKey]]:
+    xprivs = [CCoinExtKey.from_seed(bytes([i + 1]) * 64) for i in range(NUM_SIGNERS)]
+    multisig = OrdMultisig(
+        master_xpriv=str(xprivs[0]),
+        master_xpubs=[str(xpriv.neuter()) for xpriv in xprivs],
+        num_required_signers=NUM_REQUIRED_SIGNERS,
+        base_derivation_path=BASE_DERIVATION_PATH,
+        # Not used for signing
+        bitcoin_rpc=None,
+        ord_client=None,
+    )
+    return multisig, xprivs
+
+
+def create_psbt(xprivs: list[CCoinExtKey], *, num_inputs: int, num_transfers: int) -> PSBT:
+    """
+    Create a PSBT like the ones the bridge creates: each input is from a different derived deposit address.
+    """
+    xpubs = [xpriv.neuter() for xpriv in xprivs]
+    base_xpubs = [xpub.derive_path(BASE_DERIVATION_PATH) for xpub in xpubs]
+    psbt = PSBT()
+    for index in range(num_inputs):
+        child_pubkeys = [base_xpub.derive(index).pub for base_xpub in base_xpubs]
+        redeem_script = standard_multisig_redeem_script(
+            total=NUM_SIGNERS,
+            required=NUM_REQUIRED_SIGNERS,
+            pubkeys=sorted(child_pubkeys),
+        )
+        psbt.add_input(
+            txin=CTxIn(prevout=COutPoint(index.to_bytes(32, "little"), 0)),
+            inp=PSBT_Input(
+                witness_script=redeem_script,
+                utxo=CTxOut(
+                    nValue=100_000,
+                    scriptPubKey=P2WSHBitcoinAddress.from_redeemScript(redeem_script).to_scriptPubKey(),
+                ),
+                force_witness_utxo=True,
+                derivation_map={
+                    child_pubkey: PSBT_KeyDerivationInfo(
+                        master_fp=xpub.fingerprint,
+                        path=BIP32Path(f"{BASE_DERIVATION_PATH}/{index}"),
+                    )
+                    for xpub, child_pubkey in zip(xpubs, child_pubkeys, strict=True)
+                },
+            ),
+        )
+    change_script_pubkey = psbt.inputs[0].witness_utxo.scriptPubKey
+    for _ in range(num_transfers + 1):
+        psbt.add_output(
+            txout=CTxOut(nValue=TARGET_POSTAGE_SAT, scriptPubKey=change_script_pubkey),
+            outp=PSBT_Output(),
+        )
+    return psbt
+
+
+def benchmark(multisig: OrdMultisig, psbt: PSBT, max_workers: int, *, duration: float = 1.0) -> float:
+    multisig.sign_psbt(psbt, max_workers=max_workers)
+    iterations = 0
+    start = time.perf_counter()
+    while (elapsed := time.perf_counter() - start) < duration:
+        multisig.sign_psbt(psbt, max_workers=max_workers)
+        iterations += 1
+    return elapsed / iterations
+
+
+def main():
+    multisig, xprivs = create_multisig()
+    worker_counts = [1, 2, 4, 8]
+    print(f"{'inputs':>8} {'transfers':>10} " + " ".join(f"{f'{n} worker(s)':>14}" for n in worker_counts))
+    for num_inputs, num_transfers in [(1, 1), (10, 10), (50, 50), (200, 100)]:
+        psbt = create_psbt(xprivs, num_inputs=num_inputs, num_transfers=num_transfers)
+        expected = multisig.serialize_psbt(multisig.sign_psbt(psbt, max_workers=1))
+        results = []
+        for max_workers in worker_counts:
+            assert multisig.serialize_psbt(multisig.sign_psbt(psbt, max_workers=max_workers)) == expected
+            results.append(benchmark(multisig, psbt, max_workers))
+        print(f"{num_inputs:8} {num_transfers:10} " + " ".join(f"{result * 1e3:11.1f} ms" for result in results))
+
+
+if __name__ == "__main__":
+    main()
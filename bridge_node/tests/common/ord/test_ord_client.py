@@ -0,0 +1,87 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from bridge.common.ord.client import OrdApiClient, OrdApiError, OrdApiNotFound
+
+
+class FakeOrdRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_GET(self):  # noqa N802
+        self.server.request_paths.append(self.path)
+        if self.path == "/blockcount":
+            self._respond(200, 123)
+        elif self.path == "/flaky":
+            self.server.num_flaky_requests += 1
+            if self.server.num_flaky_requests < 3:
+                self._respond(503, "try again")
+            else:
+                self._respond(200, "ok")
+        elif self.path == "/broken":
+            self._respond(500, "broken")
+        else:
+            self._respond(404, "not found")
+
+    def _respond(self, status, data):
+        body = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def fake_ord_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeOrdRequestHandler)
+    server.request_paths = []
+    server.num_flaky_requests = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_ord_api_client_reuses_connections(fake_ord_url):
+    client = OrdApiClient(base_url=fake_ord_url)
+    for _ in range(5):
+        assert client.get("/blockcount") == 123
+
+    stats = client.get_stats()
+    assert stats["num_requests"] == 5
+    assert stats["num_errors"] == 0
+    assert stats["num_connections"] == 1
+    assert stats["num_reused_connections"] == 4
+
+
+def test_ord_api_client_errors(fake_ord_url):
+    client = OrdApiClient(base_url=fake_ord_url, max_retries=0)
+    with pytest.raises(OrdApiNotFound):
+        client.get("/nonexistent")
+    assert client.get_rune("NONEXISTENT") is None
+    with pytest.raises(LookupError):
+        client.get_output("00" * 32, 0)
+    with pytest.raises(OrdApiError) as exc_info:
+        client.get("/broken")
+    assert exc_info.value.status_code == 500
+    assert client.get_stats()["num_errors"] == 4
+
+
+def test_ord_api_client_retries_unavailable_responses(fake_ord_url):
+    client = OrdApiClient(base_url=fake_ord_url, max_retries=3, retry_backoff_factor=0)
+    assert client.get("/flaky") == "ok"
+    assert client.get_stats()["num_requests"] == 1
+
+
+def test_ord_api_client_gives_up_after_max_retries(fake_ord_url):
+    client = OrdApiClient(base_url=fake_ord_url, max_retries=1, retry_backoff_factor=0)
+    with pytest.raises(OrdApiError) as exc_info:
+        client.get("/flaky")
+    assert exc_info.value.status_code == 503
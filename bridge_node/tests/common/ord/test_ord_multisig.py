@@ -40,6 +40,15 @@ def test_verify_descriptor(
         )
 
 
+def test_derive_addresses(
+    multisig,
+    bitcoind,
+):
+    derived_addresses = multisig.derive_addresses(range(10, 20))
+    assert derived_addresses == bitcoind.rpc.call("deriveaddresses", multisig.get_descriptor(), [10, 19])
+    assert derived_addresses == [multisig.derive_address(index) for index in range(10, 20)]
+
+
 def test_get_rune_balance(
     ord: OrdService,  # noqa A002
     bitcoind: BitcoindService,
@@ -152,6 +161,11 @@ def test_2_of_3_send_runes(
     signed1 = multisig1.sign_psbt(unsigned_psbt)
     signed2 = multisig2.sign_psbt(unsigned_psbt)
 
+    # Signing the inputs in parallel gives the same (deterministic) signatures
+    assert len(unsigned_psbt.inputs) > 1
+    signed1_parallel = multisig1.sign_psbt(unsigned_psbt, max_workers=4)
+    assert multisig1.serialize_psbt(signed1_parallel) == multisig1.serialize_psbt(signed1)
+
     with pytest.raises(ValueError):
         multisig1.combine_and_finalize_psbt(
             initial_psbt=unsigned_psbt,
@@ -0,0 +1,102 @@
+"""
+Compare the default PyroNetwork serialization (+ serpent) with the message codec (+ marshal).
+
+Run with: python -m tests.common.p2p.benchmark_codec
+"""
+
+import time
+from decimal import Decimal
+
+from Pyro5.serializers import serializers
+
+from bridge.bridges.runes import messages
+from bridge.common.p2p.codec import message_codec
+from bridge.common.p2p.network import PyroNetwork
+
+
+def create_psbt_question(num_transfers: int, psbt_size: int) -> messages.SignRuneTokenToBtcTransferQuestion:
+    transfers = [
+        messages.RuneTokenToBtcTransfer(
+            receiver_address=f"bcrt1qreceiver{i}",
+            net_rune_amount=1000 + i,
+            token_address="0x000000000000000000000000000000000000dEaD",
+            rune_name="TESTRUNE",
+            rune_number=123,
+            event_tx_hash="0x" + f"{i:064x}",
+            event_log_index=i,
+        )
+        for i in range(num_transfers)
+    ]
+    return messages.SignRuneTokenToBtcTransferQuestion(
+        transfer=transfers[0],
+        # Base64, like the real PSBTs
+        unsigned_psbt_serialized="cHNidP8B" * (psbt_size // 8),
+        fee_rate_sats_per_vb=10,
+        transfers=transfers,
+    )
+
+
+def create_evm_transfers_question(num_transfers: int) -> messages.SignRuneToEvmTransfersQuestion:
+    return messages.SignRuneToEvmTransfersQuestion(
+        transfers=[
+            messages.RuneToEvmTransfer(
+                evm_address="0x000000000000000000000000000000000000dEaD",
+                amount_raw=1000 + i,
+                amount_decimal=Decimal("10.00") + i,
+                net_amount_raw=990 + i,
+                txid=f"{i:064x}",
+                vout=i,
+                rune_name="TESTRUNE",
+                rune_number=123,
+            )
+            for i in range(num_transfers)
+        ]
+    )
+
+
+def roundtrip_default(network: PyroNetwork, message):
+    serializer = serializers["serpent"]
+    kwargs = {"message": network.serialize(message)}
+    data = serializer.dumpsCall("peer", "answer", ("question",), kwargs)
+    _, _, _, kwargs = serializer.loadsCall(data)
+    network.deserialize(kwargs["message"])
+    return len(data)
+
+
+def roundtrip_codec(message):
+    serializer = serializers["marshal"]
+    payload = message_codec.encode({"message": message})
+    data = serializer.dumpsCall("peer", "answer_encoded", ("question", payload), {})
+    _, _, vargs, _ = serializer.loadsCall(data)
+    message_codec.decode(vargs[1])
+    return len(data)
+
+
+def benchmark(name: str, func, *args, duration: float = 1.0):
+    size = func(*args)
+    iterations = 0
+    start = time.perf_counter()
+    while (elapsed := time.perf_counter() - start) < duration:
+        func(*args)
+        iterations += 1
+    print(f"  {name:8} {elapsed / iterations * 1e6:10.1f} us/roundtrip {size:10} bytes")
+
+
+def main():
+    # serialize/deserialize don't use the network state
+    network = PyroNetwork.__new__(PyroNetwork)
+    cases = {
+        "1 EVM transfer": create_evm_transfers_question(1),
+        "100 EVM transfers": create_evm_transfers_question(100),
+        "PSBT, 1 transfer, 1 KB": create_psbt_question(1, 1_000),
+        "PSBT, 20 transfers, 50 KB": create_psbt_question(20, 50_000),
+        "PSBT, 100 transfers, 500 KB": create_psbt_question(100, 500_000),
+    }
+    for case, message in cases.items():
+        print(case)
+        benchmark("default", roundtrip_default, network, message)
+        benchmark("codec", roundtrip_codec, message)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+import dataclasses
+import marshal
+from decimal import Decimal
+from enum import IntEnum
+
+import pytest
+
+from bridge.bridges.runes import messages
+from bridge.common.p2p.codec import CODEC_VERSION, MessageCodec, MessageCodecError, message_codec
+
+
+@dataclasses.dataclass
+class Question:
+    number: int
+    amount: Decimal
+
+
+@dataclasses.dataclass
+class QuestionV2:
+    number: int
+    amount: Decimal
+    comment: str | None = None
+
+
+@dataclasses.dataclass
+class Unregistered:
+    value: int
+
+
+class Status(IntEnum):
+    OK = 1
+
+
+@pytest.fixture
+def codec():
+    codec = MessageCodec()
+    codec.register(Question)
+    return codec
+
+
+def test_roundtrip(codec):
+    value = {
+        "question": Question(number=1, amount=Decimal("1.23")),
+        "questions": [Question(number=2, amount=Decimal(0)), None],
+        "data": b"\x00\xff" * 1000,
+        "flags": (True, False),
+        "ratio": 0.5,
+    }
+    assert codec.decode(codec.encode(value)) == {
+        "question": Question(number=1, amount=Decimal("1.23")),
+        "questions": [Question(number=2, amount=Decimal(0)), None],
+        "data": b"\x00\xff" * 1000,
+        # Tuples are sent as lists
+        "flags": [True, False],
+        "ratio": 0.5,
+    }
+
+
+def test_subclasses_of_builtin_types_are_converted(codec):
+    assert codec.decode(codec.encode([Status.OK, bytearray(b"abc"), memoryview(b"def")])) == [1, b"abc", b"def"]
+
+
+def test_unregistered_dataclasses_are_decoded_as_namespaces(codec):
+    decoded = codec.decode(codec.encode(Unregistered(value=1)))
+    assert not isinstance(decoded, Unregistered)
+    assert decoded.value == 1
+
+
+def test_unknown_values_cannot_be_encoded(codec):
+    with pytest.raises(MessageCodecError):
+        codec.encode(object())
+
+
+def test_unknown_messages_cannot_be_decoded(codec):
+    other_codec = MessageCodec()
+    other_codec.register(Unregistered)
+    with pytest.raises(MessageCodecError, match="Unknown message"):
+        codec.decode(other_codec.encode(Unregistered(value=1)))
+
+
+def test_invalid_payloads_cannot_be_decoded(codec):
+    with pytest.raises(MessageCodecError, match="version"):
+        codec.decode(bytes([CODEC_VERSION + 1]) + codec.encode(1)[1:])
+    with pytest.raises(MessageCodecError):
+        codec.decode(b"")
+    with pytest.raises(MessageCodecError):
+        codec.decode(bytes([CODEC_VERSION]) + b"garbage")
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        # Code objects (or anything else the codec doesn't write) are not loaded
+        marshal.dumps(compile("1 + 1", "<test>", "eval"), 4),
+        marshal.dumps({1, 2}, 4),
+        # A list that contains itself
+        b"\xdb" + (1).to_bytes(4, "little") + b"r" + (0).to_bytes(4, "little"),
+        # A list that refers to a (non-empty) list twice
+        b"[" + (2).to_bytes(4, "little") + b"\xdb" + (1).to_bytes(4, "little") + b"N" + b"r" + bytes(4),
+        # References to values that don't exist
+        b"r" + bytes(4),
+        # Truncated and trailing data
+        marshal.dumps("foo", 4)[:-1],
+        marshal.dumps("foo", 4) + b"N",
+        b"s" + (2**31 - 1).to_bytes(4, "little"),
+        b"\x80",
+        b"{N",
+    ],
+)
+def test_unsafe_payloads_are_not_loaded(codec, payload):
+    with pytest.raises(MessageCodecError):
+        codec.decode(bytes([CODEC_VERSION]) + payload)
+
+
+def test_payload_size_and_depth_are_limited():
+    codec = MessageCodec(max_payload_size=100, max_depth=3)
+    assert codec.decode(codec.encode([[["a" * 50]]])) == [[["a" * 50]]]
+    with pytest.raises(MessageCodecError, match="too large"):
+        codec.decode(codec.encode(["a" * 100]))
+    with pytest.raises(MessageCodecError, match="too deep"):
+        codec.decode(codec.encode([[[[1]]]]))
+
+
+def test_fields_can_be_added_to_messages():
+    old_codec = MessageCodec()
+    old_codec.register(Question, name="Question")
+    new_codec = MessageCodec()
+    new_codec.register(QuestionV2, name="Question")
+
+    assert new_codec.decode(old_codec.encode(Question(number=1, amount=Decimal(1)))) == QuestionV2(
+        number=1,
+        amount=Decimal(1),
+    )
+    assert old_codec.decode(new_codec.encode(QuestionV2(number=1, amount=Decimal(1), comment="hi"))) == Question(
+        number=1,
+        amount=Decimal(1),
+    )
+
+
+def test_names_cannot_be_registered_twice(codec):
+    with pytest.raises(ValueError):
+        codec.register(QuestionV2, name=f"{Question.__module__}.{Question.__qualname__}")
+
+
+def test_rune_messages_are_registered():
+    question = messages.SignRuneTokenToBtcTransferQuestion(
+        transfer=messages.RuneTokenToBtcTransfer(
+            receiver_address="bcrt1qreceiver",
+            net_rune_amount=1000,
+            token_address="0x000000000000000000000000000000000000dEaD",
+            rune_name="TESTRUNE",
+            rune_number=123,
+            event_tx_hash="0x" + "00" * 32,
+            event_log_index=1,
+        ),
+        unsigned_psbt_serialized="cHNidP8B" * 10_000,
+        fee_rate_sats_per_vb=10,
+    )
+    assert message_codec.decode(message_codec.encode({"message": question})) == {"message": question}
@@ -0,0 +1,145 @@
+import Pyro5
+import pytest
+from Pyro5.errors import CommunicationError
+
+from bridge.common.p2p.connections import PeerConnection, PeerConnectionPool
+
+
+class ProxyStub:
+    def __init__(self, *, fail=False):
+        self.fail = fail
+        self.bound = False
+        self.released = False
+        self._pyroTimeout = None
+        self._pyroConnection = None
+
+    def _pyroBind(self):  # noqa: N802
+        if self.fail:
+            raise CommunicationError("connection refused")
+        self.bound = True
+
+    def _pyroRelease(self):  # noqa: N802
+        self.released = True
+
+    def _pyroClaimOwnership(self):  # noqa: N802
+        pass
+
+
+@pytest.fixture
+def created_proxies():
+    return []
+
+
+@pytest.fixture
+def connection(mocker, created_proxies):
+    def create_proxy(uri):
+        proxy = ProxyStub()
+        created_proxies.append(proxy)
+        return proxy
+
+    # The stubs have no socket to check
+    mocker.patch.object(PeerConnection, "_is_healthy", return_value=True)
+    return PeerConnection(
+        peer_id="peer1",
+        uri="PYRO:peer1@localhost:18081",
+        create_proxy=create_proxy,
+    )
+
+
+def test_connection_is_reused(connection, created_proxies):
+    with connection.proxy(timeout=5) as proxy1:
+        assert 4 < proxy1._pyroTimeout <= 5
+    with connection.proxy() as proxy2:
+        # Without a timeout, Pyro's default (no timeout) is used
+        assert proxy2._pyroTimeout is None
+    assert proxy1 is proxy2
+    assert len(created_proxies) == 1
+    assert proxy1.bound
+
+
+def test_default_timeout_is_used_without_a_timeout(mocker, connection, created_proxies):
+    mocker.patch.object(Pyro5.config, "COMMTIMEOUT", 3.0)
+    with connection.proxy() as proxy:
+        assert proxy._pyroTimeout == 3.0
+    mocker.patch.object(Pyro5.config, "COMMTIMEOUT", 0.0)
+    with connection.proxy() as proxy:
+        # 0 would make the socket of the connected proxy non-blocking
+        assert proxy._pyroTimeout is None
+    assert len(created_proxies) == 1
+
+
+def test_connection_is_recreated_after_communication_errors(connection, created_proxies):
+    with pytest.raises(CommunicationError):
+        with connection.proxy():
+            raise CommunicationError("connection lost")
+    with connection.proxy():
+        pass
+    assert len(created_proxies) == 2
+    assert created_proxies[0].released
+
+
+def test_expired_connection_is_recreated(mocker, connection, created_proxies):
+    monotonic = mocker.patch("bridge.common.p2p.connections.time.monotonic", return_value=1000.0)
+    with connection.proxy():
+        pass
+    monotonic.return_value = 1000.0 + 601
+    with connection.proxy():
+        pass
+    assert len(created_proxies) == 2
+    assert created_proxies[0].released
+
+
+def test_unhealthy_connection_is_recreated(connection, created_proxies):
+    with connection.proxy():
+        pass
+    PeerConnection._is_healthy.return_value = False
+    with connection.proxy():
+        pass
+    assert len(created_proxies) == 2
+
+
+def test_connecting_backs_off_after_failures(mocker):
+    monotonic = mocker.patch("bridge.common.p2p.connections.time.monotonic", return_value=1000.0)
+    created_proxies = []
+
+    def create_proxy(uri):
+        proxy = ProxyStub(fail=True)
+        created_proxies.append(proxy)
+        return proxy
+
+    connection = PeerConnection(
+        peer_id="peer1",
+        uri="PYRO:peer1@localhost:18081",
+        create_proxy=create_proxy,
+        min_retry_interval=1.0,
+        max_retry_interval=3.0,
+    )
+    with pytest.raises(CommunicationError):
+        with connection.proxy():
+            pass
+    assert len(created_proxies) == 1
+    assert connection.get_info()["status"] == "offline"
+    assert len(created_proxies) == 1
+
+    monotonic.return_value = 1001.0
+    with pytest.raises(CommunicationError):
+        with connection.proxy():
+            pass
+    assert len(created_proxies) == 2
+
+    # 2 seconds after the second failure
+    monotonic.return_value = 1002.5
+    with pytest.raises(CommunicationError):
+        with connection.proxy():
+            pass
+    assert len(created_proxies) == 2
+    monotonic.return_value = 1003.0
+    assert connection.get_info()["status"] == "offline"
+    assert len(created_proxies) == 3
+
+
+def test_pool_returns_same_connection_per_uri():
+    pool = PeerConnectionPool(create_proxy=lambda uri: ProxyStub())
+    connection = pool.get("peer1", "PYRO:peer1@localhost:18081")
+    assert pool.get("peer1", "PYRO:peer1@localhost:18081") is connection
+    assert pool.get("peer2", "PYRO:peer2@localhost:18082") is not connection
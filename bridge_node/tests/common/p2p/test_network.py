@@ -1,4 +1,6 @@
 import dataclasses
+import threading
+import time
 from collections import namedtuple
 from decimal import Decimal
 
@@ -10,8 +12,8 @@ from bridge.common.p2p.network import Network, PyroMessageEnvelope, PyroNetwork
 from tests.mock_network import MockNetwork
 
 
-def create_test_pyro_network(node_id="test", host="localhost", port=8080, peers=None):
-    return PyroNetwork(node_id=node_id, host=host, port=port, peers=peers or [])
+def create_test_pyro_network(node_id="test", host="localhost", port=8080, peers=None, **kwargs):
+    return PyroNetwork(node_id=node_id, host=host, port=port, peers=peers or [], **kwargs)
 
 
 @pytest.fixture
@@ -73,10 +75,21 @@ class PeerStub:
 
         PyroUri = namedtuple("PyroUri", ["object", "location"])
         self._pyroUri = PyroUri(object="test", location="peerstub:none")
+        self._pyroConnection = None
+        self._pyroTimeout = None
 
     def __call__(self, *args, **kwargs):
         return self
 
+    def _pyroBind(self):  # noqa: N802
+        pass
+
+    def _pyroRelease(self):  # noqa: N802
+        pass
+
+    def _pyroClaimOwnership(self):  # noqa: N802
+        pass
+
     def receive(self, msg):
         self.messages.append(msg)
 
@@ -305,3 +318,125 @@ def test_ask_answer(mocker, request):
     peer2.answer_with("test_decimal", lambda thing: Decimal(2) + thing)
     answers = peer1.ask("test_decimal", thing=Decimal(1))
     assert answers == [Decimal(3)]
+
+    peer2.answer_with("test_dataclass_list", lambda things: [SomeAnswer(answer=thing.question) for thing in things])
+    answers = peer1.ask("test_dataclass_list", things=[SomeQuestion(question=1), SomeQuestion(question=2)])
+    assert len(answers) == 1
+    assert [answer.answer for answer in answers[0]] == [1, 2]
+
+
+def test_ask_answer_with_message_codec(mocker, request):
+    mocker.patch(
+        "Pyro5.config.SSL",
+        False,
+    )
+
+    peer1 = create_test_pyro_network(
+        node_id="peer1",
+        host="localhost",
+        port=18083,
+        peers=[("peer2", "localhost:18084")],
+        use_message_codec=True,
+    )
+    request.addfinalizer(peer1.stop)
+
+    # Questions are answered with the codec even if the answering node doesn't ask with it
+    peer2 = create_test_pyro_network(
+        node_id="peer2", host="localhost", port=18084, peers=[("peer1", "localhost:18083")]
+    )
+    request.addfinalizer(peer2.stop)
+
+    peer2.answer_with("test", lambda data, thing: {"data": data, "answer": SomeAnswer(answer=thing.child.question)})
+    answers = peer1.ask("test", data=b"\x00" * 100_000, thing=NestedQuestion(child=SomeQuestion(question=789)))
+    assert len(answers) == 1
+    assert answers[0]["data"] == b"\x00" * 100_000
+    assert answers[0]["answer"].answer == 789
+
+    peer2.answer_with("test_decimal", lambda thing: Decimal(2) + thing)
+    assert peer1.ask("test_decimal", thing=Decimal(1)) == [Decimal(3)]
+
+    peer2.answer_with("test_error", lambda: 1 / 0)
+    assert peer1.ask("test_error") == []
+
+    # The codec payload is sent with the default serializer, marshal is never used for the transport
+    assert peer1._create_peer_proxy("PYRO:peer2@localhost:18084")._pyroSerializer is None
+
+
+class AnsweringPeerStub(PeerStub):
+    def __init__(self, answer, delay=0.0):
+        super().__init__()
+        self._answer = answer
+        self._delay = delay
+
+    def answer(self, question, **kwargs):
+        time.sleep(self._delay)
+        return self._answer
+
+
+def use_peer_stubs(mocker, network, peers):
+    network._peers = [(f"peer{i}", f"localhost:{18090 + i}") for i in range(len(peers))]
+    peers_by_uri = {f"PYRO:peer{i}@localhost:{18090 + i}": peer for i, peer in enumerate(peers)}
+    mocker.patch(
+        "bridge.common.p2p.network.BoundPyroProxy",
+        side_effect=lambda uri, **kwargs: peers_by_uri[uri],
+    )
+
+
+def test_ask_fans_out_to_peers_concurrently(mocker, test_pyro_network):
+    peers = [AnsweringPeerStub(f"answer {i}", delay=0.2) for i in range(5)]
+    use_peer_stubs(mocker, test_pyro_network, peers)
+
+    start = time.monotonic()
+    answers = test_pyro_network.ask("test")
+    assert time.monotonic() - start < 0.6
+    assert sorted(answers) == [f"answer {i}" for i in range(5)]
+
+
+def test_ask_skips_peers_that_dont_answer_in_time(mocker, test_pyro_network):
+    peers = [
+        AnsweringPeerStub("fast"),
+        AnsweringPeerStub(None),
+        AnsweringPeerStub("slow", delay=2.0),
+    ]
+    use_peer_stubs(mocker, test_pyro_network, peers)
+
+    start = time.monotonic()
+    assert test_pyro_network.ask("test", timeout=0.5) == ["fast"]
+    assert time.monotonic() - start < 1.5
+    assert 0 < peers[0]._pyroTimeout <= 0.5
+
+
+def test_ask_does_not_wait_for_busy_connections(mocker, test_pyro_network):
+    peers = [
+        AnsweringPeerStub("fast"),
+        AnsweringPeerStub("slow", delay=2.0),
+    ]
+    use_peer_stubs(mocker, test_pyro_network, peers)
+    threads_before = set(threading.enumerate())
+
+    # The slow peer is still answering the first question when the second one is asked
+    assert test_pyro_network.ask("test", timeout=0.3) == ["fast"]
+    assert test_pyro_network.ask("test", timeout=0.3) == ["fast"]
+    time.sleep(0.2)
+    # The thread asking the second question gave up waiting for the connection instead of queuing up behind
+    # the first one
+    ask_threads = [
+        thread
+        for thread in threading.enumerate()
+        if thread.name.startswith("pyro-ask") and thread not in threads_before
+    ]
+    assert len(ask_threads) == 1
+
+
+def test_ask_returns_when_quorum_is_reached(mocker, test_pyro_network):
+    peers = [
+        AnsweringPeerStub(None),
+        AnsweringPeerStub("fast 1", delay=0.1),
+        AnsweringPeerStub("fast 2", delay=0.1),
+        AnsweringPeerStub("slow", delay=2.0),
+    ]
+    use_peer_stubs(mocker, test_pyro_network, peers)
+
+    start = time.monotonic()
+    assert sorted(test_pyro_network.ask("test", quorum=2)) == ["fast 1", "fast 2"]
+    assert time.monotonic() - start < 1.5
@@ -0,0 +1,92 @@
+import threading
+import time
+
+from bridge.common.bridge_workers import BridgeWorker
+
+
+class BridgeStub:
+    def __init__(self, name="stub", fail=False, block: threading.Event | None = None):
+        self.name = name
+        self.fail = fail
+        self.block = block
+        self.iterations = 0
+        self.iterated = threading.Event()
+
+    def init(self):
+        pass
+
+    def run_iteration(self):
+        self.iterations += 1
+        self.iterated.set()
+        if self.block is not None:
+            self.block.wait()
+        if self.fail:
+            raise ValueError("iteration failed")
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_worker_runs_iterations_on_its_own_cadence():
+    bridge = BridgeStub()
+    worker = BridgeWorker(bridge=bridge, sleep_time=0.01, min_interval=0)
+    worker.start()
+    try:
+        wait_until(lambda: bridge.iterations >= 3)
+        assert worker.get_status()["consecutive_failures"] == 0
+    finally:
+        worker.stop(timeout=5)
+    assert not worker.is_alive()
+
+
+def test_worker_is_woken_up_early():
+    bridge = BridgeStub()
+    worker = BridgeWorker(bridge=bridge, sleep_time=60, min_interval=0)
+    worker.start()
+    try:
+        wait_until(lambda: bridge.iterations == 1)
+        worker.wakeup.notify("test")
+        wait_until(lambda: bridge.iterations == 2)
+    finally:
+        worker.stop(timeout=5)
+
+
+def test_worker_backs_off_after_failures():
+    bridge = BridgeStub(fail=True)
+    worker = BridgeWorker(bridge=bridge, sleep_time=0.01, min_interval=0, max_backoff=60)
+    worker.start()
+    try:
+        wait_until(lambda: worker.get_status()["consecutive_failures"] >= 3)
+        # Wakeups don't cut the backoff short
+        worker.wakeup.notify("test")
+        iterations = bridge.iterations
+        time.sleep(0.05)
+        assert bridge.iterations <= iterations + 1
+        assert worker.is_alive()
+    finally:
+        worker.stop(timeout=5)
+
+
+def test_slow_bridge_does_not_block_others():
+    unblock = threading.Event()
+    slow_bridge = BridgeStub(name="slow", block=unblock)
+    fast_bridge = BridgeStub(name="fast")
+    slow_worker = BridgeWorker(bridge=slow_bridge, sleep_time=0.01, min_interval=0, timeout=0.05)
+    fast_worker = BridgeWorker(bridge=fast_bridge, sleep_time=0.01, min_interval=0)
+    slow_worker.start()
+    fast_worker.start()
+    try:
+        assert slow_bridge.iterated.wait(timeout=5)
+        wait_until(lambda: fast_bridge.iterations >= 3)
+        wait_until(slow_worker.is_stuck)
+        assert slow_worker.get_status()["stuck"]
+        unblock.set()
+        wait_until(lambda: not slow_worker.is_stuck())
+    finally:
+        unblock.set()
+        slow_worker.stop(timeout=5)
+        fast_worker.stop(timeout=5)
@@ -0,0 +1,88 @@
+import logging
+import sys
+import threading
+import time
+
+import pytest
+
+from bridge.common.wakeups import BitcoindZmqWakeupSource, EvmNewBlockWakeupSource, Wakeup
+
+
+def test_wakeup_times_out():
+    wakeup = Wakeup()
+    start = time.monotonic()
+    assert wakeup.wait(timeout=0.1) == set()
+    assert time.monotonic() - start >= 0.1
+
+
+def test_wakeup_is_notified_from_another_thread():
+    wakeup = Wakeup()
+    threading.Timer(0.05, wakeup.notify, args=("test",)).start()
+    start = time.monotonic()
+    assert wakeup.wait(timeout=5) == {"test"}
+    assert time.monotonic() - start < 5
+
+
+def test_notifications_are_not_lost_between_waits():
+    wakeup = Wakeup()
+    wakeup.notify("first")
+    wakeup.notify("second")
+    assert wakeup.wait(timeout=0) == {"first", "second"}
+    assert wakeup.wait(timeout=0) == set()
+
+
+class EthStub:
+    def __init__(self):
+        self.block_number = 1
+
+
+class Web3Stub:
+    def __init__(self):
+        self.eth = EthStub()
+
+
+def test_evm_new_block_wakeup():
+    web3 = Web3Stub()
+    wakeup = Wakeup()
+    source = EvmNewBlockWakeupSource(web3=web3, name="evm", poll_interval=0.01)
+    source.start(wakeup)
+    try:
+        assert wakeup.wait(timeout=0.1) == set()
+        web3.eth.block_number = 2
+        assert wakeup.wait(timeout=5) == {"evm-new-block-wakeup:2"}
+    finally:
+        source.stop()
+
+
+def test_bitcoind_zmq_wakeup():
+    zmq = pytest.importorskip("zmq")
+
+    # A local publisher stands in for bitcoind
+    context = zmq.Context()
+    publisher = context.socket(zmq.PUB)
+    port = publisher.bind_to_random_port("tcp://127.0.0.1")
+    wakeup = Wakeup()
+    source = BitcoindZmqWakeupSource(urls=[f"tcp://127.0.0.1:{port}"], poll_timeout_ms=10)
+    source.start(wakeup)
+    try:
+        # ZMQ subscriptions are set up asynchronously, so publish until the subscriber gets it
+        deadline = time.monotonic() + 5
+        reasons = set()
+        while not reasons and time.monotonic() < deadline:
+            publisher.send_multipart([b"hashblock", b"\x00" * 32, b"\x00\x00\x00\x00"])
+            reasons = wakeup.wait(timeout=0.05)
+        assert reasons == {"bitcoind:hashblock"}
+    finally:
+        source.stop()
+        publisher.close(linger=0)
+        context.term()
+
+
+def test_bitcoind_zmq_wakeup_without_pyzmq(mocker, caplog):
+    mocker.patch.dict(sys.modules, {"zmq": None})
+    source = BitcoindZmqWakeupSource(urls=["tcp://127.0.0.1:28332"])
+    with caplog.at_level(logging.ERROR):
+        source.start(Wakeup())
+    assert "pyzmq is not installed" in caplog.text
+    assert source._thread is None
+    source.stop()
@@ -0,0 +1,23 @@
+import math
+
+from bridge.common.utils.http import LatencyHistogram
+
+
+def test_latency_histogram():
+    histogram = LatencyHistogram(buckets=(0.1, 1.0, 10.0))
+    assert histogram.percentile(50) == 0.0
+
+    for latency in [0.05, 0.05, 0.5, 0.5, 0.5, 5.0, 5.0, 5.0, 5.0, 50.0]:
+        histogram.record(latency)
+
+    assert histogram.count == 10
+    assert histogram.percentile(20) == 0.1
+    assert histogram.percentile(50) == 1.0
+    assert histogram.percentile(90) == 10.0
+    assert histogram.percentile(99) == math.inf
+    assert histogram.as_dict()["buckets"] == {
+        "le_0.1": 2,
+        "le_1": 3,
+        "le_10": 4,
+        "le_inf": 1,
+    }
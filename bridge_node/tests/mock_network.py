@@ -16,13 +16,15 @@ class MockNetwork(Network):
         for peer in peers:
             self._peers[peer.node_id] = peer
 
-    def ask(self, question, **kwargs):
+    def ask(self, question, *, timeout=None, quorum=None, **kwargs):
         answers = []
 
         for peer in self._peers.values():
             answer = peer.answer(question, **kwargs)
             if answer is not None:
                 answers.append(answer)
+            if quorum is not None and len(answers) >= quorum:
+                break
 
         return answers
 
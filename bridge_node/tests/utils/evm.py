@@ -0,0 +1,117 @@
+import threading
+
+import eth_abi
+import eth_utils
+from hexbytes import HexBytes
+from web3 import Web3
+from web3.providers import BaseProvider
+
+TEST_CONTRACT_ADDRESS = Web3.to_checksum_address("0x" + "11" * 20)
+TEST_CONTRACT_ABI = [
+    {
+        "anonymous": False,
+        "inputs": [
+            {"indexed": True, "name": "counter", "type": "uint256"},
+            {"indexed": False, "name": "message", "type": "string"},
+        ],
+        "name": "Foo",
+        "type": "event",
+    },
+    {
+        "anonymous": False,
+        "inputs": [
+            {"indexed": False, "name": "amount", "type": "uint256"},
+        ],
+        "name": "Bar",
+        "type": "event",
+    },
+]
+
+
+class FakeLogsProvider(BaseProvider):
+    """
+    Web3 provider that serves eth_blockNumber and eth_getLogs from an in-memory list of logs,
+    and records the eth_getLogs requests
+    """
+
+    def __init__(self, *, block_number: int = 0):
+        super().__init__()
+        self.block_number = block_number
+        self.logs = []
+        self.get_logs_requests = []
+        self.num_chain_id_requests = 0
+        self.max_results = None  # Return an error like public providers do if there are more results
+        self.num_errors_to_return = 0  # Return a generic error for this many next eth_getLogs calls
+        self._lock = threading.Lock()
+
+    def add_log(self, *, event_abi, block_number: int, log_index: int = 0, transaction_index: int = 0, **args):
+        indexed_inputs = [i for i in event_abi["inputs"] if i["indexed"]]
+        data_inputs = [i for i in event_abi["inputs"] if not i["indexed"]]
+        topics = [eth_utils.event_abi_to_log_topic(event_abi)]
+        topics.extend(eth_abi.encode([i["type"]], [args[i["name"]]]) for i in indexed_inputs)
+        data = eth_abi.encode([i["type"] for i in data_inputs], [args[i["name"]] for i in data_inputs])
+        self.logs.append(
+            {
+                "address": TEST_CONTRACT_ADDRESS,
+                "topics": [HexBytes(topic).hex() for topic in topics],
+                "data": HexBytes(data).hex(),
+                "blockNumber": hex(block_number),
+                "blockHash": "0x" + f"{block_number:064x}",
+                "transactionHash": "0x" + f"{block_number:032x}{transaction_index:032x}",
+                "transactionIndex": hex(transaction_index),
+                "logIndex": hex(log_index),
+                "removed": False,
+            }
+        )
+        self.block_number = max(self.block_number, block_number)
+
+    def make_request(self, method, params):
+        if method == "eth_chainId":
+            self.num_chain_id_requests += 1
+            return {"jsonrpc": "2.0", "id": 1, "result": hex(31337)}
+        if method == "eth_blockNumber":
+            return {"jsonrpc": "2.0", "id": 1, "result": hex(self.block_number)}
+        if method == "eth_getLogs":
+            (filter_params,) = params
+            with self._lock:
+                self.get_logs_requests.append(filter_params)
+                if self.num_errors_to_return > 0:
+                    self.num_errors_to_return -= 1
+                    return {"jsonrpc": "2.0", "id": 1, "error": {"code": -32000, "message": "internal error"}}
+            logs = self._get_logs(filter_params)
+            if self.max_results is not None and len(logs) > self.max_results:
+                return {
+                    "jsonrpc": "2.0",
+                    "id": 1,
+                    "error": {"code": -32005, "message": f"query returned more than {self.max_results} results"},
+                }
+            return {"jsonrpc": "2.0", "id": 1, "result": logs}
+        raise NotImplementedError(method)
+
+    def _get_logs(self, filter_params):
+        from_block = int(filter_params["fromBlock"], 16)
+        to_block = int(filter_params["toBlock"], 16)
+        topics = filter_params.get("topics") or []
+        addresses = filter_params["address"]
+        if not isinstance(addresses, list):
+            addresses = [addresses]
+        addresses = [address.lower() for address in addresses]
+        ret = []
+        for log in self.logs:
+            if not from_block <= int(log["blockNumber"], 16) <= to_block:
+                continue
+            if log["address"].lower() not in addresses:
+                continue
+            if topics and topics[0] is not None:
+                allowed = topics[0] if isinstance(topics[0], list) else [topics[0]]
+                if log["topics"][0] not in allowed:
+                    continue
+            ret.append(log)
+        return ret
+
+
+def create_fake_logs_web3(*, block_number: int = 0):
+    provider = FakeLogsProvider(block_number=block_number)
+    web3 = Web3(provider)
+    contract = web3.eth.contract(address=TEST_CONTRACT_ADDRESS, abi=TEST_CONTRACT_ABI)
+    return web3, provider, contract